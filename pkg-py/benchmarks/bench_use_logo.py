@@ -0,0 +1,98 @@
+"""
+Compare `use_logo()` with and without the precomputed resolution table.
+
+Run with `uv run python pkg-py/benchmarks/bench_use_logo.py`.
+"""
+
+from __future__ import annotations
+
+import itertools
+import timeit
+
+from brand_yml import Brand, _use_logo
+from brand_yml._use_logo import (
+    USE_LOGO_VARIANTS,
+    logo_resolution_table,
+    resolve_logo,
+    resolve_logo_entry,
+)
+
+brand = Brand.from_yaml_str("""
+logo:
+  images:
+    mark: logos/mark.svg
+    mark-white: logos/mark-white.svg
+    wordmark: logos/wordmark.svg
+    wordmark-white: logos/wordmark-white.svg
+  small: mark
+  medium:
+    light: wordmark
+    dark: wordmark-white
+  large: logos/full.png
+""")
+
+assert brand.logo is not None
+logo = brand.logo
+names = ["small", "medium", "large", "smallest", "largest", "mark", "other"]
+calls = list(
+    itertools.product(names, USE_LOGO_VARIANTS, (True, False)),
+)
+
+
+class BranchyTable:
+    """Walks the decision table for every lookup, as before the table."""
+
+    def __init__(self, logo):
+        self.logo = logo
+
+    def __contains__(self, key) -> bool:
+        return True
+
+    def __getitem__(self, key):
+        return resolve_logo_entry(self.logo, *key)
+
+
+def resolve_all():
+    for name, variant, allow_fallback in calls:
+        resolve_logo(
+            brand,
+            name,
+            variant,  # type: ignore[arg-type]
+            required=False,
+            allow_fallback=allow_fallback,
+        )
+
+
+def branchy():
+    table = _use_logo.logo_resolution_table
+    _use_logo.logo_resolution_table = BranchyTable  # type: ignore[assignment]
+    try:
+        resolve_all()
+    finally:
+        _use_logo.logo_resolution_table = table
+
+
+def table():
+    resolve_all()
+
+
+def table_lookup():
+    lookup = logo_resolution_table(logo)
+    for key in calls:
+        lookup.get(key)
+
+
+def main(number: int = 2000):
+    n_calls = number * len(calls)
+    print(f"{n_calls} use_logo() resolutions\n")
+    for label, fn in (
+        ("decision table, walked per call", branchy),
+        ("precomputed resolution table", table),
+        ("resolution table (dict lookup only)", table_lookup),
+    ):
+        seconds = min(timeit.repeat(fn, number=number, repeat=5))
+        print(f"{label:<38} {seconds / n_calls * 1e9:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
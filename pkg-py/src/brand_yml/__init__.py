@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Literal
 
-from htmltools import TagAttrValue
+from htmltools import HTMLDependency, TagAttrValue
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -13,6 +13,16 @@ from pydantic import (
 )
 
 from ._defs import BrandLightDark
+from ._extends import brand_from_yaml_data, brand_merge
+from ._fingerprint import (
+    BRAND_FINGERPRINT_SECTIONS,
+    BrandSectionType,
+    brand_fingerprint,
+    section_fingerprint,
+)
+from ._instrument import BrandInstrumentation, BrandSpan, instrument, span
+from ._logo_assets import logos_write_assets
+from ._schema import BrandSchemaError, check_brand_schema
 from ._use_logo import use_logo
 from ._utils import (
     envvar_brand_yml_path,
@@ -20,9 +30,17 @@ from ._utils import (
     recurse_dicts_and_models,
     use_brand_yml_path,
 )
+from ._utils_color import contrast_ratio, parse_color
+from ._utils_memory import deep_sizeof
 from ._utils_yaml import yaml_brand as yaml
-from .base import BrandBase
-from .color import BrandColor
+from .base import BrandBase, freeze_model, is_frozen
+from .color import (
+    BrandColor,
+    BrandColorContrastPair,
+    WcagLevelType,
+    wcag_contrast_threshold,
+)
+from .compact import BrandCompact
 from .file import FileLocation, FileLocationLocal, FileLocationUrl
 from .logo import BrandLogo, BrandLogoResource, BrandLogoResourceLightDark
 from .meta import BrandMeta
@@ -45,6 +63,11 @@ class Brand(BrandBase):
     `brand_yml.Brand.from_yaml_str`. Or create a full brand instance directly
     via this class.
 
+    A Brand YAML file may inherit from another brand file by declaring
+    `extends: path/to/_brand.yml` at the top level. The extending file only
+    needs to include the values that differ from the base brand; see
+    `brand_yml.Brand.merge` for details on how the two brands are combined.
+
     Attributes
     ----------
     meta
@@ -80,7 +103,12 @@ class Brand(BrandBase):
     path: Path | None = Field(None, exclude=True, repr=False)
 
     @classmethod
-    def from_yaml(cls, path: str | Path | None = None):
+    def from_yaml(
+        cls,
+        path: str | Path | None = None,
+        *,
+        validate_schema: bool = False,
+    ):
         """
         Create a Brand instance from a Brand YAML file.
 
@@ -105,6 +133,11 @@ class Brand(BrandBase):
             directory or any of its parent directories. Alternatively, if no
             path is specified, the `BRAND_YML_PATH` environment variable is
             checked for the path to the brand.yml file.
+        validate_schema
+            Whether to check the YAML data against the brand.yml JSON Schema
+            before validating the brand. All structural errors in the file are
+            reported at once, without building the brand. Requires the
+            `jsonschema` package.
 
         Returns
         -------
@@ -117,6 +150,10 @@ class Brand(BrandBase):
         FileNotFoundError
             Raises a `FileNotFoundError` if no brand configuration file is found
             within the given path.
+        BrandSchemaError
+            Raises a `BrandSchemaError`, a subclass of `ValueError` listing
+            every structural error, if `validate_schema` is `True` and the
+            brand.yml file does not match the JSON Schema.
         ValueError
             Raises `ValueError` or other validation errors from
             [pydantic](https://docs.pydantic.dev/latest/) if the brand.yml file
@@ -148,7 +185,7 @@ class Brand(BrandBase):
             # allows users to simply pass `__file__`
             path = find_project_brand_yml(path)
 
-        with open(path, "r") as f:
+        with open(path, "r") as f, span("yaml.load", path=str(path)):
             brand_data = yaml.load(f)
 
         if not isinstance(brand_data, dict):
@@ -156,12 +193,20 @@ class Brand(BrandBase):
                 f"Invalid Brand YAML file {str(path)!r}. Must be a dictionary."
             )
 
-        brand_data["path"] = path
+        if validate_schema:
+            with span("schema.validate", path=str(path)):
+                check_brand_schema(brand_data, path)
 
-        return cls.model_validate(brand_data)
+        return brand_from_yaml_data(cls, brand_data, path)
 
     @classmethod
-    def from_yaml_str(cls, text: str, path: str | Path | None = None):
+    def from_yaml_str(
+        cls,
+        text: str,
+        path: str | Path | None = None,
+        *,
+        validate_schema: bool = False,
+    ):
         """
         Create a Brand instance from a string of YAML.
 
@@ -171,6 +216,9 @@ class Brand(BrandBase):
             The text of the Brand YAML file.
         path
             The optional path on disk for supporting files like logos and fonts.
+        validate_schema
+            Whether to check the YAML data against the brand.yml JSON Schema
+            before validating the brand. Requires the `jsonschema` package.
 
         Returns
         -------
@@ -180,6 +228,10 @@ class Brand(BrandBase):
 
         Raises
         ------
+        BrandSchemaError
+            Raises a `BrandSchemaError` listing every structural error if
+            `validate_schema` is `True` and the text does not match the JSON
+            Schema.
         ValueError
             Raises `ValueError` or other validation errors from
             [pydantic](https://docs.pydantic.dev/latest/) if the Brand YAML file
@@ -209,12 +261,105 @@ class Brand(BrandBase):
         brand.color.primary
         ```
         """
-        data = yaml.load(text)
+        with span("yaml.load", path=None if path is None else str(path)):
+            data = yaml.load(text)
+
+        if validate_schema:
+            with span(
+                "schema.validate", path=None if path is None else str(path)
+            ):
+                check_brand_schema(data, None if path is None else Path(path))
+
+        return brand_from_yaml_data(
+            cls,
+            data,
+            Path(path).absolute() if path is not None else None,
+        )
 
-        if path is not None:
-            data["path"] = Path(path).absolute()
+    @classmethod
+    def merge(
+        cls,
+        base: Brand,
+        override: Brand | dict[str, Any],
+        *,
+        path: str | Path | None = None,
+    ):
+        """
+        Create a new Brand by overlaying brand data on top of a base brand.
+
+        This is the mechanism behind `extends` in Brand YAML files: a shared
+        base brand (e.g. a corporate brand) is combined with a smaller set of
+        overrides (e.g. a product or client brand).
+
+        The data of `override` is deep-merged on top of the data of `base`:
+        dictionaries are merged key by key, while any other value in
+        `override` -- including lists such as `typography.fonts` -- replaces the
+        value from `base`. The sections touched by `override` are validated
+        from the merged data, and the other sections are copied from the
+        already validated `base`. The resolved `color.palette` of `base` is
+        re-used when `override` doesn't change the palette. Because colors used
+        in `typography` are resolved against `color`, `typography` is validated
+        again whenever `override` includes `color`.
+
+        Note that copying a section only skips validation for `logo`,
+        `typography` and `defaults`. The `meta` and `color` models are set to
+        always re-validate their instances, so copies of these sections are
+        validated again, which is cheap compared to `logo` and `typography`.
+
+        Local file paths from `base` continue to point to the same files, even
+        when the merged brand is stored in another directory.
+
+        Parameters
+        ----------
+        base
+            The base brand.
+        override
+            A brand or a dictionary of brand data (as read from a Brand YAML
+            file) with values that take precedence over `base`.
+        path
+            The path of the merged brand. Defaults to the path of `override`, if
+            it has one, or the path of `base`.
+
+        Returns
+        -------
+        :
+            A new, validated `brand_yml.Brand`. Neither `base` nor `override`
+            are modified.
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        base = Brand.from_yaml_str(\"\"\"
+        meta:
+          name: Very Big Corporation of America
+        color:
+          palette:
+            blue: "#447099"
+            orange: "#EE6331"
+          primary: blue
+        \"\"\")
 
-        return cls.model_validate(data)
+        brand = Brand.merge(base, {"color": {"primary": "orange"}})
+        brand.color.primary
+        ```
+
+        In a Brand YAML file, the same result is achieved with `extends`:
+
+        ```{.yaml filename="_brand.yml"}
+        extends: ../corporate/_brand.yml
+        color:
+          primary: orange
+        ```
+        """
+        return brand_merge(
+            cls,
+            base,
+            override,
+            path=Path(path).absolute() if path is not None else None,
+        )
 
     def model_dump_yaml(
         self,
@@ -418,7 +563,10 @@ class Brand(BrandBase):
         :
             A `BrandLogoResource` object, a `BrandLogoResourceLightDark` object,
             or `None` if the requested logo doesn't exist and `required` is
-            `False`.
+            `False`. Results are memoized until `brand.logo` is reassigned, so
+            repeated calls with the same arguments return the same object.
+            Resources created by `use_logo()`, e.g. to attach `**kwargs`, are
+            shared and read-only.
 
         Raises
         ------
@@ -470,6 +618,393 @@ class Brand(BrandBase):
             **kwargs,
         )
 
+    def logos_write_assets(self, path_dir: str | Path) -> Path | None:
+        """
+        Writes copies of the brand's local logo images into a directory.
+
+        Each local image in `brand.logo` is copied into `path_dir` with a
+        content-hashed file name, e.g. `logo-3f2a9c1d7b4e.svg`, so the files
+        can be served with long-lived caching. Pass the URL of the directory
+        as `assets_url` to the `to_html()` or `to_markdown()` methods of a logo
+        to link to these copies instead of embedding the images as data URIs.
+
+        Parameters
+        ----------
+        path_dir
+            Path to the directory where the logo images should be written. If
+            it does not exist it will be created.
+
+        Returns
+        -------
+        :
+            Returns the path to the directory where the files were written, i.e.
+            `path_dir`, or `None` if the brand doesn't have any local logos.
+
+        Examples
+        --------
+
+        ```python
+        brand.logos_write_assets("www/logos")
+        brand.use_logo("small").to_html(assets_url="logos")
+        ```
+        """
+        return logos_write_assets(self.logo, path_dir)
+
+    def logos_html_dependency(
+        self,
+        path_dir: str | Path,
+        name: str = "brand-logos",
+        version: str = "0.0.1",
+    ) -> HTMLDependency | None:
+        """
+        Generate an HTMLDependency for the brand's logo images.
+
+        Writes the logo images with
+        [`.logos_write_assets()`](`brand_yml.Brand.logos_write_assets`) and
+        creates an [HTMLDependency
+        object](https://shiny.posit.co/py/api/core/Htmltools.html#htmltools.HTMLDependency)
+        that serves them, e.g. in [Shiny](https://shiny.posit.co/py)
+        applications.
+
+        Parameters
+        ----------
+        path_dir
+            The directory path where the logo images will be written.
+        name
+            The name of the dependency. Defaults to "brand-logos".
+        version
+            The version of the dependency. Defaults to "0.0.1".
+
+        Returns
+        -------
+        :
+            An [`htmltools.HTMLDependency`](`htmltools.HTMLDependency`) object
+            if `brand.logo` includes local images or `None` otherwise.
+        """
+        subdir = self.logos_write_assets(path_dir)
+        if subdir is None:
+            return
+
+        return HTMLDependency(
+            name=name,
+            version=version,
+            source={"subdir": str(subdir)},
+            all_files=True,
+        )
+
+    def typography_contrast(
+        self,
+        level: WcagLevelType | float | None = None,
+    ) -> list[BrandColorContrastPair]:
+        """
+        WCAG contrast of the text and background colors used in typography.
+
+        Checks the contrast of the colors used for text:
+
+        * `base`: `color.foreground` on `color.background`.
+        * `headings`, `monospace-inline`, `monospace-block` and `link`: the
+          `color` on the `background-color` of each element, for elements that
+          set either color. When one of the two isn't set, the element is
+          assumed to use `color.foreground` or `color.background`, which in
+          turn default to black and white.
+
+        Parameters
+        ----------
+        level
+            If provided, only return pairs with contrast below this WCAG level
+            -- `"AA"`, `"AAA"`, `"AA-large"` or `"AAA-large"` -- or below this
+            minimum contrast ratio.
+
+        Returns
+        -------
+        :
+            A list of
+            [`BrandColorContrastPair`](`brand_yml.color.BrandColorContrastPair`)
+            tuples, named by typography element.
+
+        Raises
+        ------
+        ValueError
+            If a color can't be parsed.
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        color:
+          foreground: "#151515"
+          background: "#FFFFFF"
+        typography:
+          monospace-inline:
+            color: "#7d12ba"
+            background-color: "#f8f9fa"
+          link:
+            color: "#FDD835"
+        \"\"\")
+
+        brand.typography_contrast()
+        ```
+
+        ```{python}
+        brand.typography_contrast("AA")
+        ```
+        """
+        foreground = (self.color.foreground if self.color else None) or "black"
+        background = (self.color.background if self.color else None) or "white"
+
+        pairs: list[tuple[str, str, str]] = []
+        if self.color and (self.color.foreground or self.color.background):
+            pairs.append(("base", foreground, background))
+
+        if self.typography is not None:
+            for field in (
+                "headings",
+                "monospace_inline",
+                "monospace_block",
+                "link",
+            ):
+                node = getattr(self.typography, field)
+                color = getattr(node, "color", None)
+                background_color = getattr(node, "background_color", None)
+                if color is None and background_color is None:
+                    continue
+                pairs.append(
+                    (
+                        field.replace("_", "-"),
+                        color or foreground,
+                        background_color or background,
+                    )
+                )
+
+        result = [
+            BrandColorContrastPair(
+                name,
+                fg,
+                bg,
+                contrast_ratio(parse_color(fg), parse_color(bg)),
+            )
+            for name, fg, bg in pairs
+        ]
+
+        if level is None:
+            return result
+
+        threshold = wcag_contrast_threshold(level)
+        return [pair for pair in result if pair.ratio < threshold]
+
+    def freeze(self) -> Brand:
+        """
+        An immutable, hashable snapshot of the brand.
+
+        Returns a deep copy of the brand in which every section, dictionary and
+        list is read-only: assigning to a field of the snapshot or any of its
+        sections raises a validation error and dictionaries and lists can't be
+        modified. The snapshot is still a `brand_yml.Brand`, so it can be used
+        anywhere a brand is expected and safely shared between threads without
+        copying.
+
+        Frozen brands (and their sections) are hashable, so they can be used as
+        keys in caches, e.g. with `functools.lru_cache`. The hash is computed
+        once from the brand's content and is stable across Python sessions; see
+        `brand_yml.Brand.content_hash`. Use `brand.model_copy(deep=True)` on a
+        frozen brand to get a mutable copy.
+
+        Returns
+        -------
+        :
+            A frozen copy of the brand. If the brand is already frozen, the
+            brand itself is returned.
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        color:
+          primary: "#447099"
+        \"\"\")
+
+        frozen = brand.freeze()
+        frozen.content_hash()
+        ```
+
+        ```{python}
+        try:
+            frozen.color.primary = "#EE6331"
+        except ValueError as e:
+            print(e)
+        ```
+        """
+        if is_frozen(self):
+            return self
+
+        frozen = freeze_model(self.model_copy(deep=True))
+        frozen.content_hash()
+        return frozen  # type: ignore[return-value]
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether the brand is a frozen snapshot created by `.freeze()`."""
+        return is_frozen(self)
+
+    def fingerprint(self, section: BrandSectionType | None = None) -> str:
+        """
+        A stable fingerprint of the brand's content.
+
+        The fingerprint is a SHA-256 hex digest of the brand's data, in a
+        canonical form that doesn't depend on the order of keys in
+        `_brand.yml`, and the contents of the local files (logos and fonts) the
+        brand refers to. Brands with the same content and files have the same
+        fingerprint, even across Python sessions and machines, so fingerprints
+        are useful as keys for render or CDN caches.
+
+        Fingerprints are computed for each section -- `meta`, `logo`, `color`
+        and `typography` -- and the brand's fingerprint combines the section
+        fingerprints and `defaults`. Fingerprints are cached on the brand and
+        are computed again only after the brand or a model in it is modified,
+        or when the modification time or size of a local file changes. Changes
+        to other brands don't affect them. In-place changes to dictionaries or
+        lists in the brand, e.g. `brand.color.palette["red"] =
+        "#FF0000"`, are not detected; assign a new value instead.
+
+        Parameters
+        ----------
+        section
+            The section of the brand to fingerprint: `"meta"`, `"logo"`,
+            `"color"` or `"typography"`. When `None`, the fingerprint of the
+            whole brand is returned.
+
+        Returns
+        -------
+        :
+            A 64 character hex digest.
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        color:
+          primary: "#447099"
+        \"\"\")
+
+        brand.fingerprint("color")
+        ```
+        """
+        if section is None:
+            return brand_fingerprint(self)
+
+        if section not in BRAND_FINGERPRINT_SECTIONS:
+            raise ValueError(
+                f"Unknown brand section {section!r}. "
+                f"Must be one of {', '.join(BRAND_FINGERPRINT_SECTIONS)}."
+            )
+
+        return section_fingerprint(self, section)
+
+    def memory_report(self) -> dict[str, int]:
+        """
+        Estimate the memory used by the brand, by section.
+
+        Measures the deep size in bytes of each section of the brand -- `meta`,
+        `logo`, `color`, `typography` and `defaults` -- including the pydantic
+        models, strings, containers and file paths they hold. Values cached on
+        the brand are reported as `cache`. Each section is measured on its own,
+        so objects shared between sections are counted in each section but only
+        once in `total`.
+
+        If the brand no longer needs to be modified, `brand_yml.Brand.compact`
+        creates a much smaller read-only view of the brand.
+
+        Returns
+        -------
+        :
+            A dictionary with the size in bytes of each section of the brand
+            and the `total` size of the brand.
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        color:
+          palette:
+            blue: "#447099"
+          primary: blue
+        typography:
+          base: Open Sans
+        \"\"\")
+
+        brand.memory_report()
+        ```
+        """
+        report = {
+            section: deep_sizeof(getattr(self, section))
+            for section in ("meta", "logo", "color", "typography", "defaults")
+        }
+        report["cache"] = deep_sizeof(self._cache)
+        report["total"] = deep_sizeof(self)
+        return report
+
+    def compact(self) -> BrandCompact:
+        """
+        A compact, read-only view of the brand.
+
+        Creates a [`BrandCompact`](`brand_yml.compact.BrandCompact`) holding the
+        brand's name and its resolved colors, typography settings and logos in
+        immutable, hashable named tuples of interned strings. The compact view
+        uses much less memory than the brand itself and is useful when many
+        brands are kept in memory but no longer need to be modified or
+        validated. The view is not updated when the brand is modified.
+
+        Returns
+        -------
+        :
+            A `brand_yml.compact.BrandCompact` view of the brand.
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        meta:
+          name: Brand YAML
+        color:
+          palette:
+            blue: "#447099"
+          primary: blue
+        typography:
+          headings:
+            family: Open Sans
+            weight: 600
+        \"\"\")
+
+        compact = brand.compact()
+        compact.color.get("primary")
+        ```
+
+        ```{python}
+        compact.typography.get("headings")
+        ```
+        """
+        return BrandCompact.from_brand(self)
+
+    def _content_data(self) -> Any:
+        data = super()._content_data()
+        data["path"] = None if self.path is None else str(self.path)
+        return data
+
     @model_validator(mode="after")
     def _set_root_path(self):
         """
@@ -485,11 +1020,12 @@ class Brand(BrandBase):
         """
         path = self.path
         if path is not None:
-            recurse_dicts_and_models(
-                self,
-                pred=lambda value: isinstance(value, FileLocationLocal),
-                modify=lambda value: value.set_root_dir(path.parent),
-            )
+            with span("Brand._set_root_path", path=str(path)):
+                recurse_dicts_and_models(
+                    self,
+                    pred=lambda value: isinstance(value, FileLocationLocal),
+                    modify=lambda value: value.set_root_dir(path.parent),
+                )
 
         return self
 
@@ -514,9 +1050,13 @@ __all__ = [
     "BrandLightDark",
     "BrandLogoResource",
     "BrandLogoResourceLightDark",
+    "BrandInstrumentation",
+    "BrandSchemaError",
+    "BrandSpan",
     "FileLocation",
     "FileLocationLocal",
     "FileLocationUrl",
     "find_project_brand_yml",
+    "instrument",
     "use_brand_yml_path",
 ]
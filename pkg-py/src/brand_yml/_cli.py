@@ -0,0 +1,494 @@
+"""
+The `brand-yml` command line tool.
+
+Validates and compiles many brand files at once, e.g. in CI:
+
+```bash
+brand-yml validate --schema "brands/**/_brand.yml"
+brand-yml css -o dist/css brands/
+brand-yml bundle --json -o dist/bundle brands/acme/_brand.yml
+```
+
+Files are processed in parallel threads of a single process, so the caches of
+brand_yml -- validated base brands used with `extends`, the compiled JSON
+Schema, font metadata, subsets and WOFF2 files -- are warmed once and shared by
+every file. Results can be printed as JSON and `--timing` reports the time
+spent in each phase, using `brand_yml.instrument()`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional
+
+from . import Brand
+from ._fingerprint import local_files
+from ._instrument import BrandSpan, instrument, span
+from ._logo_assets import logo_asset_name
+from ._schema import BrandSchemaError, brand_schema_validator
+from ._utils_yaml import yaml_brand
+
+BRAND_YML_FILES = ("_brand.yml", "_brand.yaml")
+"""The brand files found when a directory is given on the command line."""
+
+
+class BrandCliResult(NamedTuple):
+    """The result of running a command on one brand file."""
+
+    path: str
+    """The path of the brand file, as given or found on the command line."""
+
+    ok: bool = True
+
+    error: Optional[str] = None
+    """The error message, if the command failed."""
+
+    errors: Optional[list[dict[str, str]]] = None
+    """Every schema error, if `--schema` was used and the file is invalid."""
+
+    output: Optional[str] = None
+    """The YAML or CSS, for commands printed to stdout."""
+
+    files: Optional[list[str]] = None
+    """The files written, for commands with an output directory."""
+
+    def to_json(self) -> dict[str, Any]:
+        return {k: v for k, v in self._asdict().items() if v is not None}
+
+
+def expand_brand_files(patterns: Sequence[str]) -> tuple[list[Path], list[str]]:
+    """
+    Expand files, directories and glob patterns into brand files.
+
+    Directories are searched recursively for `_brand.yml` or `_brand.yaml`
+    files. Returns the unique files, in order, and the patterns that didn't
+    match any files.
+    """
+    files: dict[Path, None] = {}
+    unmatched: list[str] = []
+
+    for item in patterns:
+        pattern = os.path.expanduser(item)
+        if os.path.isdir(pattern):
+            matches = [
+                path
+                for name in BRAND_YML_FILES
+                for path in glob.glob(
+                    os.path.join(glob.escape(pattern), "**", name),
+                    recursive=True,
+                )
+            ]
+        elif glob.has_magic(pattern):
+            matches = glob.glob(pattern, recursive=True)
+        else:
+            matches = [pattern] if os.path.isfile(pattern) else []
+
+        matches = [path for path in matches if os.path.isfile(path)]
+        if not matches:
+            unmatched.append(item)
+        files.update((Path(path), None) for path in sorted(matches))
+
+    return list(files), unmatched
+
+
+def output_names(paths: Sequence[Path]) -> dict[Path, Path]:
+    """
+    Unique output names for each brand file, relative to their common parent
+    directory and without the file suffix, e.g. `acme/_brand`.
+    """
+    resolved = {path: path.absolute() for path in paths}
+    if len(paths) == 1:
+        return {path: Path(path.stem) for path in paths}
+    root = Path(os.path.commonpath([p.parent for p in resolved.values()]))
+    return {
+        path: full.relative_to(root).with_suffix("")
+        for path, full in resolved.items()
+    }
+
+
+BUNDLE_LOGOS_DIR = "logos"
+"""The directory of logo images in a bundle, relative to its `_brand.yml`."""
+
+
+def bundle_logo_paths(data: Any, assets: dict[str, str]) -> Any:
+    """Replace the paths of local logo images in `data` with their copies."""
+    if isinstance(data, dict):
+        return {
+            key: (
+                assets.get(value, value)
+                if key == "path" and isinstance(value, str)
+                else bundle_logo_paths(value, assets)
+            )
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [bundle_logo_paths(item, assets) for item in data]
+    return data
+
+
+class BrandCli:
+    """Runs a `brand-yml` command on one brand file at a time."""
+
+    def __init__(self, args: argparse.Namespace, paths: Sequence[Path]):
+        self.args = args
+        self.output_dir: Path | None = getattr(args, "output_dir", None)
+        self.names = output_names(paths)
+        self.single = len(paths) == 1
+
+    def run(self, path: Path) -> BrandCliResult:
+        command: Callable[[Brand, Path], BrandCliResult] = getattr(
+            self, f"cmd_{self.args.command}"
+        )
+        try:
+            with span(f"cli.{self.args.command}", path=str(path)):
+                brand = Brand.from_yaml(path, validate_schema=self.args.schema)
+                return command(brand, path)
+        except BrandSchemaError as e:
+            return BrandCliResult(
+                str(path),
+                ok=False,
+                error=str(e),
+                errors=[error._asdict() for error in e.errors],
+            )
+        except Exception as e:
+            return BrandCliResult(str(path), ok=False, error=str(e))
+
+    def output_path(self, path: Path, suffix: str = "") -> Path:
+        assert self.output_dir is not None
+        if not suffix and self.single:
+            return self.output_dir
+        return self.output_dir / (str(self.names[path]) + suffix)
+
+    def cmd_validate(self, brand: Brand, path: Path) -> BrandCliResult:
+        return BrandCliResult(str(path))
+
+    def cmd_dump(self, brand: Brand, path: Path) -> BrandCliResult:
+        if self.args.format == "json":
+            output = brand.model_dump_json(
+                exclude_defaults=True, exclude_none=True, indent=2
+            )
+        else:
+            output = brand.model_dump_yaml()
+        return BrandCliResult(str(path), output=output)
+
+    def cmd_css(self, brand: Brand, path: Path) -> BrandCliResult:
+        css = brand.typography.to_css() if brand.typography else ""
+        if self.output_dir is None:
+            return BrandCliResult(str(path), output=css)
+
+        path_css = self.output_path(path, ".css")
+        path_css.parent.mkdir(parents=True, exist_ok=True)
+        path_css.write_text(css + "\n", encoding="utf-8")
+        return BrandCliResult(
+            str(path), files=[path_css.relative_to(self.output_dir).as_posix()]
+        )
+
+    def cmd_fonts(self, brand: Brand, path: Path) -> BrandCliResult:
+        if self.output_dir is None:
+            css = (
+                brand.typography.fonts_css_include() if brand.typography else ""
+            )
+            return BrandCliResult(str(path), output=css)
+
+        path_dir = self.output_path(path)
+        if brand.typography is not None:
+            path_dir.mkdir(parents=True, exist_ok=True)
+            brand.typography.fonts_write_css(
+                path_dir, subset=self.args.subset, woff2=self.args.woff2
+            )
+        return BrandCliResult(str(path), files=self.files(path_dir))
+
+    def cmd_bundle(self, brand: Brand, path: Path) -> BrandCliResult:
+        path_dir = self.output_path(path)
+        path_dir.parent.mkdir(parents=True, exist_ok=True)
+
+        # The bundle is written to a temporary directory and only moved into
+        # place once it's complete
+        tmp_dir = Path(
+            tempfile.mkdtemp(prefix=f".{path_dir.name}-", dir=path_dir.parent)
+        )
+        try:
+            self.write_bundle(brand, tmp_dir)
+            path_dir.mkdir(exist_ok=True)
+            for item in tmp_dir.iterdir():
+                dest = path_dir / item.name
+                if dest.is_dir() and not dest.is_symlink():
+                    shutil.rmtree(dest)
+                os.replace(item, dest)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        return BrandCliResult(str(path), files=self.files(path_dir))
+
+    def write_bundle(self, brand: Brand, path_dir: Path) -> None:
+        """
+        Write `brand` into `path_dir` with its local fonts and logos, so that
+        the `_brand.yml` in `path_dir` can be used on its own.
+        """
+        data = json.loads(
+            brand.model_dump_json(exclude_defaults=True, exclude_none=True)
+        )
+
+        # Logos are copied under their content-hashed names
+        logo_assets = {
+            file.model_dump(mode="json"): f"{BUNDLE_LOGOS_DIR}/{name}"
+            for file in local_files(brand.logo)
+            if (name := logo_asset_name(file.absolute())) is not None
+        }
+        if brand.logo is not None and logo_assets:
+            data["logo"] = bundle_logo_paths(data["logo"], logo_assets)
+            brand.logos_write_assets(path_dir / BUNDLE_LOGOS_DIR)
+
+        # Local fonts keep their paths relative to the brand file
+        if brand.typography is not None:
+            brand.typography.fonts_write_css(
+                path_dir, subset=self.args.subset, woff2=self.args.woff2
+            )
+            for file in local_files(brand.typography.fonts):
+                dest = path_dir / file.relative()
+                if not dest.exists():
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(file.absolute(), dest)
+
+        with (path_dir / "_brand.yml").open("w", encoding="utf-8") as f:
+            yaml_brand.dump(data, f)
+
+    def files(self, path_dir: Path) -> list[str]:
+        assert self.output_dir is not None
+        if not path_dir.exists():
+            return []
+        return sorted(
+            p.relative_to(self.output_dir).as_posix()
+            for p in path_dir.rglob("*")
+            if p.is_file()
+        )
+
+
+class PhaseTimer:
+    """Collects the spans reported by `brand_yml.instrument()` by phase."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.phases: dict[str, dict[str, float]] = {}
+
+    def __call__(self, span: BrandSpan) -> None:
+        with self._lock:
+            phase = self.phases.setdefault(
+                span.name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            duration = span.duration * 1000
+            phase["count"] += 1
+            phase["total_ms"] += duration
+            phase["max_ms"] = max(phase["max_ms"], duration)
+
+    def to_json(self) -> dict[str, dict[str, float]]:
+        return {
+            name: {k: round(v, 3) for k, v in phase.items()}
+            for name, phase in sorted(
+                self.phases.items(), key=lambda x: -x[1]["total_ms"]
+            )
+        }
+
+    def format(self) -> str:
+        width = max([len(name) for name in self.phases] + [5])
+        lines = [
+            f"{'phase':<{width}}  {'count':>5}  {'total':>10}  {'max':>10}"
+        ]
+        for name, phase in self.to_json().items():
+            lines.append(
+                f"{name:<{width}}  {phase['count']:>5.0f}  "
+                + f"{phase['total_ms']:>8.2f}ms  {phase['max_ms']:>8.2f}ms"
+            )
+        return "\n".join(lines)
+
+
+def cli_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "files",
+        nargs="+",
+        metavar="FILE",
+        help="Brand files, directories to search for _brand.yml files, or "
+        + "glob patterns, e.g. 'brands/**/_brand.yml'.",
+    )
+    common.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="The number of files to process in parallel. "
+        + "Defaults to the number of CPUs.",
+    )
+    common.add_argument(
+        "--schema",
+        action="store_true",
+        help="Check each file against the brand.yml JSON Schema first. "
+        + "Requires the jsonschema package.",
+    )
+    common.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the results as JSON.",
+    )
+    common.add_argument(
+        "--timing",
+        action="store_true",
+        help="Report the time spent in each phase.",
+    )
+
+    output_dir = argparse.ArgumentParser(add_help=False)
+    output_dir.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        default=None,
+        help="The directory to write to. With several brand files, each is "
+        + "written under its path relative to their common parent directory.",
+    )
+
+    fonts = argparse.ArgumentParser(add_help=False)
+    fonts.add_argument(
+        "--subset",
+        type=lambda x: [s.strip() for s in x.split(",") if s.strip()],
+        default=None,
+        help="Split local fonts into subsets, e.g. 'latin,latin-ext'. "
+        + "Requires the fonttools package.",
+    )
+    fonts.add_argument(
+        "--woff2",
+        action="store_true",
+        help="Write WOFF2 versions of local fonts. "
+        + "Requires the fonttools and brotli packages.",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="brand-yml",
+        description="Validate and compile brand.yml files.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser(
+        "validate",
+        parents=[common],
+        help="Validate brand files.",
+    )
+    dump = commands.add_parser(
+        "dump",
+        parents=[common],
+        help="Print the validated brand as YAML or JSON.",
+    )
+    dump.add_argument("--format", choices=["yaml", "json"], default="yaml")
+    commands.add_parser(
+        "css",
+        parents=[common, output_dir],
+        help="Print or write the typography CSS of each brand.",
+    )
+    commands.add_parser(
+        "fonts",
+        parents=[common, output_dir, fonts],
+        help="Print the font CSS, or write it with copies of local fonts.",
+    )
+    bundle = commands.add_parser(
+        "bundle",
+        parents=[common, output_dir, fonts],
+        help="Write the validated brand, font CSS, local fonts and logo "
+        + "images into a directory.",
+    )
+    bundle.set_defaults(output_dir_required=True)
+    return parser
+
+
+def print_results(
+    args: argparse.Namespace,
+    results: Sequence[BrandCliResult],
+    unmatched: Sequence[str],
+) -> None:
+    for pattern in unmatched:
+        print(f"{pattern}: No brand files found", file=sys.stderr)
+
+    comment = {"css": "/* {} */", "fonts": "/* {} */"}.get(args.command, "# {}")
+    for result in results:
+        if not result.ok:
+            print(f"{result.path}: {result.error}", file=sys.stderr)
+        elif result.output is not None:
+            if len(results) > 1:
+                print(comment.format(result.path))
+            print(result.output.rstrip("\n"))
+        elif result.files is not None:
+            for file in result.files:
+                print(file)
+        else:
+            print(f"{result.path}: ok")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the `brand-yml` command line tool and return its exit code."""
+    parser = cli_parser()
+    args = parser.parse_args(argv)
+
+    if getattr(args, "output_dir_required", False) and args.output_dir is None:
+        parser.error(
+            f"{args.command}: the -o/--output-dir argument is required"
+        )
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    paths, unmatched = expand_brand_files(args.files)
+    timer = PhaseTimer()
+    start = time.perf_counter()
+
+    with instrument(timer) if args.timing else nullcontext():
+        if args.schema:
+            try:
+                with span("schema.compile"):
+                    brand_schema_validator()
+            except ImportError as e:
+                parser.exit(2, f"brand-yml: error: {e}\n")
+
+        cli = BrandCli(args, paths) if paths else None
+        jobs = args.jobs or os.cpu_count() or 1
+        if cli is None:
+            results = []
+        elif jobs == 1 or len(paths) == 1:
+            results = [cli.run(path) for path in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+                results = list(pool.map(cli.run, paths))
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    n_failed = sum(not result.ok for result in results) + len(unmatched)
+
+    if args.json:
+        out: dict[str, Any] = {
+            "command": args.command,
+            "ok": n_failed == 0,
+            "results": [result.to_json() for result in results],
+        }
+        if unmatched:
+            out["unmatched"] = list(unmatched)
+        if args.timing:
+            out["timing"] = {
+                "elapsed_ms": round(elapsed_ms, 3),
+                "phases": timer.to_json(),
+            }
+        print(json.dumps(out, indent=2))
+    else:
+        print_results(args, results, unmatched)
+        if args.timing:
+            print(timer.format(), file=sys.stderr)
+            print(
+                f"{len(results)} file(s) in {elapsed_ms:.2f}ms", file=sys.stderr
+            )
+
+    return 1 if n_failed else 0
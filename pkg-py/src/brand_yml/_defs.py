@@ -10,7 +10,9 @@ from pydantic import (
 )
 from typing_extensions import TypeGuard
 
+from ._instrument import span
 from ._utils_logging import logger
+from .base import FreezableModel
 
 DictString = dict[str, str]
 DictStringRecursive = Union[DictString, dict[str, "DictStringRecursive"]]
@@ -19,7 +21,7 @@ DictStringRecursiveBaseModel = Union[DictStringRecursive, dict[str, BaseModel]]
 T = TypeVar("T")
 
 
-class BrandLightDark(BaseModel, Generic[T]):
+class BrandLightDark(FreezableModel, BaseModel, Generic[T]):
     """
     A Light/Dark Variant
 
@@ -125,13 +127,26 @@ def defs_replace_recursively(
         return None
 
     if level == 0:
-        logger.debug("Checking for circular references")
-        check_circular_references(defs, name=name)
+        with span("defs_replace_recursively", name=name):
+            logger.debug("Checking for circular references")
+            check_circular_references(defs, name=name)
+            defs_replace_items(items, defs, level, name, exclude)
+        return
 
     if level > 50:  # pragma: no cover
         logger.error("Hit recursion limit recursing into `items`")
         return
 
+    defs_replace_items(items, defs, level, name, exclude)
+
+
+def defs_replace_items(
+    items: dict | BaseModel,
+    defs: dict,
+    level: int,
+    name: str | None,
+    exclude: str | None,
+):
     for key in item_keys(items):
         value = get_value(items, key)
 
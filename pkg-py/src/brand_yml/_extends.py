@@ -0,0 +1,401 @@
+"""
+Brand inheritance via `extends`.
+
+A brand file may declare `extends: path/to/base/_brand.yml` to inherit from a
+base brand. The base brand is read and validated once and cached (keyed on the
+modification times of the files it was built from). The extending brand's data
+is deep-merged on top of the base brand's data. The sections touched by the
+override are validated from the merged data, while the other sections are
+copied from the validated base brand.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from copy import deepcopy
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Type, TypeVar
+
+from pydantic import BaseModel
+
+from ._instrument import span
+from ._utils_logging import logger
+
+if TYPE_CHECKING:
+    from . import Brand
+
+BrandT = TypeVar("BrandT", bound="Brand")
+
+BRAND_SECTIONS = ("meta", "logo", "color", "typography", "defaults")
+"""Top-level sections of a brand, in the order they are merged."""
+
+BRAND_SECTIONS_WITH_FILES = ("logo", "typography")
+"""Sections that may contain local file paths relative to the brand file."""
+
+
+def deep_merge(base: Any, override: Any) -> Any:
+    """
+    Deep-merge `override` on top of `base`.
+
+    Dictionaries are merged key by key, recursively. Any other value in
+    `override`, including lists and `None`, replaces the value in `base`. The
+    inputs are not modified; the result shares no mutable state with them.
+
+    Parameters
+    ----------
+    base
+        The base value.
+    override
+        The value with higher precedence.
+
+    Returns
+    -------
+    :
+        The merged value.
+    """
+    if not isinstance(base, dict) or not isinstance(override, dict):
+        return deepcopy(override)
+
+    merged = deepcopy(base)
+    for key, value in override.items():
+        if key in merged:
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = deepcopy(value)
+
+    return merged
+
+
+def expand_shorthands(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Expand scalar shorthands in raw brand data into their dictionary form.
+
+    Several brand fields accept a single value as shorthand for a dictionary,
+    e.g. `meta.name: Acme` for `meta.name.full: Acme`. Expanding these before
+    merging lets `{"name": {"short": "ACME"}}` extend `name: Acme` instead of
+    replacing it. `data` is modified in place and returned.
+    """
+    meta = data.get("meta")
+    if isinstance(meta, dict):
+        for key, into in (("name", "full"), ("link", "home")):
+            if isinstance(meta.get(key), str):
+                meta[key] = {into: meta[key]}
+
+    if isinstance(data.get("logo"), str):
+        data["logo"] = {"path": data["logo"]}
+
+    typography = data.get("typography")
+    if isinstance(typography, dict):
+        for key in (
+            "base",
+            "headings",
+            "monospace",
+            "monospace-inline",
+            "monospace_inline",
+            "monospace-block",
+            "monospace_block",
+        ):
+            if isinstance(typography.get(key), str):
+                typography[key] = {"family": typography[key]}
+
+    return data
+
+
+def is_local_path(value: Any) -> bool:
+    return isinstance(value, (str, Path)) and "://" not in str(value)
+
+
+def rebase_path(value: str | Path, from_dir: Path, to_dir: Path) -> str:
+    if Path(value).expanduser().is_absolute():
+        return str(value)
+    return Path(os.path.relpath(from_dir / value, to_dir)).as_posix()
+
+
+def rebase_local_paths(data: dict[str, Any], from_dir: Path, to_dir: Path):
+    """
+    Rewrite local file paths in raw brand data to be relative to `to_dir`.
+
+    Local file paths in `_brand.yml` are relative to the brand file. When data
+    from a base brand is merged into a brand stored in another directory, the
+    paths from the base brand are rewritten so they still point to the same
+    files. Only `logo` resources and font `files` in `typography.fonts` hold
+    local file paths. `data` is modified in place.
+    """
+    if from_dir == to_dir:
+        return
+
+    def rebase(value: Any, refs: set[str] | None = None) -> Any:
+        if isinstance(value, dict):
+            if "path" in value and is_local_path(value["path"]):
+                value["path"] = rebase_path(value["path"], from_dir, to_dir)
+            for k in ("light", "dark"):
+                if k in value:
+                    value[k] = rebase(value[k], refs)
+            return value
+        if is_local_path(value) and str(value) not in (refs or ()):
+            return rebase_path(value, from_dir, to_dir)
+        return value
+
+    logo = data.get("logo")
+    if is_local_path(logo):
+        data["logo"] = rebase(logo)
+    elif isinstance(logo, dict):
+        images = logo.get("images")
+        refs: set[str] = set()
+        if isinstance(images, dict):
+            refs = set(images.keys())
+            for key, value in images.items():
+                images[key] = rebase(value)
+        if "path" in logo:
+            data["logo"] = rebase(logo)
+        for size in ("small", "medium", "large"):
+            if size in logo:
+                logo[size] = rebase(logo[size], refs)
+
+    typography = data.get("typography")
+    if isinstance(typography, dict) and isinstance(
+        typography.get("fonts"), list
+    ):
+        for font in typography["fonts"]:
+            if not isinstance(font, dict) or font.get("source") != "file":
+                continue
+            for file in font.get("files") or []:
+                if isinstance(file, dict) and is_local_path(file.get("path")):
+                    file["path"] = rebase_path(file["path"], from_dir, to_dir)
+
+
+def color_references(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    The parts of raw brand data that may refer to other colors.
+
+    Color references, e.g. `primary: blue` in `color` or `color: primary` in
+    `typography`, are replaced by their values during validation. These are
+    the `color` section and the `color` and `background-color` of typographic
+    elements, with the names used by `Brand.model_dump(by_alias=True)`.
+    """
+    refs: dict[str, Any] = {}
+
+    if isinstance(data.get("color"), dict):
+        refs["color"] = deepcopy(data["color"])
+
+    typography = data.get("typography")
+    if isinstance(typography, dict):
+        elements: dict[str, Any] = {}
+        for element, value in typography.items():
+            if not isinstance(value, dict):
+                continue
+            fields = {
+                field.replace("_", "-"): value[field]
+                for field in ("color", "background-color", "background_color")
+                if isinstance(value.get(field), str)
+            }
+            if fields:
+                elements[element.replace("_", "-")] = fields
+        if elements:
+            refs["typography"] = elements
+
+    return refs
+
+
+def brand_data(brand: Brand) -> dict[str, Any]:
+    """
+    The data used to create `brand`, suitable for merging.
+
+    The data is recovered from the validated brand. Brands read from YAML also
+    keep their color references (see `color_references()`) until they, or a
+    model they contain, are modified, so that references like `primary: blue`
+    or `color: primary` can be resolved again after merging.
+    """
+    data = brand.model_dump(by_alias=True, exclude_none=True)
+
+    refs = brand._cache.get("color_references")
+    if refs:
+        data = deep_merge(data, refs)
+
+    return data
+
+
+def brand_merge(
+    cls: Type[BrandT],
+    base: Brand,
+    override: Brand | dict[str, Any],
+    path: Path | None = None,
+) -> BrandT:
+    """
+    Merge `override` on top of `base`. See `Brand.merge()` for details.
+    """
+    if isinstance(override, BaseModel):
+        if path is None:
+            path = override.path
+        override_data = brand_data(override)
+    else:
+        override_data = deepcopy(override)
+        override_data.pop("extends", None)
+        if path is None and override_data.get("path") is not None:
+            path = Path(override_data["path"])
+
+    override_data.pop("path", None)
+    expand_shorthands(override_data)
+    if path is None:
+        path = base.path
+
+    base_data = expand_shorthands(brand_data(base))
+    needs_rebase = (
+        base.path is not None
+        and path is not None
+        and base.path.parent != path.parent
+    )
+    if needs_rebase:
+        assert base.path is not None and path is not None
+        rebase_local_paths(base_data, base.path.parent, path.parent)
+
+    merged = deep_merge(base_data, override_data)
+
+    changed = {k for k in BRAND_SECTIONS if k in override_data}
+    if "color" in changed:
+        # typography colors are resolved against `color` during validation
+        changed.add("typography")
+    if needs_rebase:
+        changed.update(BRAND_SECTIONS_WITH_FILES)
+
+    data: dict[str, Any] = {}
+    for section in BRAND_SECTIONS:
+        if section not in merged:
+            continue
+
+        base_value = getattr(base, section)
+        if section in changed or base_value is None:
+            data[section] = deepcopy(merged[section])
+        else:
+            logger.debug(f"Re-using validated `{section}` from base brand")
+            data[section] = deepcopy(base_value)
+
+    color = data.get("color")
+    if (
+        isinstance(color, dict)
+        and "palette" not in override_data.get("color", {})
+        and base.color is not None
+        and base.color.palette is not None
+    ):
+        # The base palette has already been resolved
+        color["palette"] = deepcopy(base.color.palette)
+
+    if path is not None:
+        data["path"] = path
+
+    with span("Brand.model_validate", path=None if path is None else str(path)):
+        brand = cls.model_validate(data)
+    brand._cache["color_references"] = color_references(merged)
+    return brand
+
+
+class BaseBrandCache:
+    """
+    Validated base brands, keyed by path.
+
+    Each entry records the modification times of every file the brand was
+    built from (the file itself and the brands it extends), and is reused as
+    long as none of those files have changed.
+
+    Base brands are read and validated outside of the lock, so that threads
+    loading different base brands don't wait for each other. Two threads
+    that load the same brand at once both read it, and the last one wins.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[Path, tuple[list[tuple[Path, int]], Brand]] = {}
+        self._local = threading.local()
+
+    @staticmethod
+    def _is_current(deps: list[tuple[Path, int]]) -> bool:
+        try:
+            return all(p.stat().st_mtime_ns == m for p, m in deps)
+        except OSError:
+            return False
+
+    def _loading(self) -> list[tuple[Path, list[tuple[Path, int]]]]:
+        """The base brands being read by this thread, outermost first."""
+        loading = getattr(self._local, "loading", None)
+        if loading is None:
+            loading = self._local.loading = []
+        return loading
+
+    def get(self, cls: Type[BrandT], path: Path) -> BrandT:
+        loading = self._loading()
+
+        with self._lock:
+            entry = self._entries.get(path)
+
+        if entry is None or not self._is_current(entry[0]):
+            if path in [p for p, _ in loading]:
+                chain = [str(p) for p, _ in loading] + [str(path)]
+                raise ValueError(
+                    "Circular `extends` detected in brand files: "
+                    + " -> ".join(chain)
+                )
+
+            logger.debug(f"Reading base brand from {path}")
+            deps = [(path, path.stat().st_mtime_ns)]
+            loading.append((path, deps))
+            try:
+                brand = cls.from_yaml(path)
+            finally:
+                loading.pop()
+
+            entry = (deps, brand)
+            with self._lock:
+                self._entries[path] = entry
+
+        if loading:
+            loading[-1][1].extend(entry[0])
+
+        return entry[1]  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+base_brand_cache = BaseBrandCache()
+
+
+def brand_from_yaml_data(
+    cls: Type[BrandT],
+    data: dict[str, Any],
+    path: Path | None = None,
+) -> BrandT:
+    """
+    Validate brand data read from `path`, resolving `extends` if present.
+
+    When `path` is `None`, `extends` is resolved relative to the working
+    directory.
+    """
+    if not isinstance(data, dict):
+        with span("Brand.model_validate"):
+            return cls.model_validate(data)
+
+    extends = data.pop("extends", None)
+    if extends is None:
+        refs = color_references(data)
+        if path is not None:
+            data["path"] = path
+        with span(
+            "Brand.model_validate",
+            path=None if path is None else str(path),
+        ):
+            brand = cls.model_validate(data)
+        brand._cache["color_references"] = refs
+        return brand
+
+    if not isinstance(extends, str):
+        raise ValueError(
+            f"Invalid `extends` in {str(path or 'brand YAML')!r}. "
+            "Must be the path to a brand YAML file."
+        )
+
+    root_dir = path.parent if path is not None else Path.cwd()
+    base_path = (root_dir / Path(extends).expanduser()).resolve()
+    base = base_brand_cache.get(cls, base_path)
+    return brand_merge(cls, base, data, path=path)
@@ -0,0 +1,155 @@
+"""
+Content fingerprints for brands and brand sections.
+
+A fingerprint is a SHA-256 digest of a section's canonical data (see
+`BrandBase.content_hash()`) and the contents of the local files it refers to.
+Fingerprints are cached on the brand and reused until a brand model is
+modified or one of the local files changes on disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, Optional
+
+from ._utils import recurse_dicts_and_models
+from .base import BrandBase
+from .file import FileLocationLocal
+
+if TYPE_CHECKING:
+    from . import Brand
+
+BrandSectionType = Literal["meta", "logo", "color", "typography"]
+
+BRAND_FINGERPRINT_SECTIONS: tuple[BrandSectionType, ...] = (
+    "meta",
+    "logo",
+    "color",
+    "typography",
+)
+
+FileStat = tuple[str, Optional[tuple[int, int]]]
+
+
+def file_stat(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class FileDigestCache:
+    """SHA-256 digests of local files, reused while the file is unchanged."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[Path, tuple[tuple[int, int], str]] = {}
+
+    def get(self, path: Path, stat: tuple[int, int] | None) -> str:
+        if stat is None:
+            return "missing"
+
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and entry[0] == stat:
+            return entry[1]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+
+        with self._lock:
+            self._entries[path] = (stat, digest.hexdigest())
+        return digest.hexdigest()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+file_digest_cache = FileDigestCache()
+
+
+def local_files(item: Any) -> list[FileLocationLocal]:
+    """Find the local file locations in a brand or brand section."""
+    files: list[FileLocationLocal] = []
+
+    def add(value: FileLocationLocal) -> bool:
+        files.append(value)
+        return False
+
+    if item is not None:
+        recurse_dicts_and_models(
+            item,
+            pred=lambda value: isinstance(value, FileLocationLocal),
+            modify=add,
+        )
+    return files
+
+
+def files_stat(files: list[FileLocationLocal]) -> tuple[FileStat, ...]:
+    paths = {str(f.relative()): f.absolute() for f in files}
+    return tuple((rel, file_stat(paths[rel])) for rel in sorted(paths))
+
+
+def compute_fingerprint(section: Any, files: list[FileLocationLocal]) -> str:
+    digest = hashlib.sha256()
+    if section is None:
+        digest.update(b"null")
+    elif isinstance(section, BrandBase):
+        digest.update(section.content_hash().encode("ascii"))
+
+    for file in sorted(files, key=lambda f: str(f.relative())):
+        path = file.absolute()
+        file_hash = file_digest_cache.get(path, file_stat(path))
+        digest.update(f"\n{file.relative().as_posix()}:{file_hash}".encode())
+
+    return digest.hexdigest()
+
+
+def section_fingerprint(brand: Brand, section: BrandSectionType) -> str:
+    """
+    The fingerprint of a section of `brand`, cached on the brand.
+
+    The brand's cache is cleared when a model in the brand is modified, so a
+    cached fingerprint is reused while the modification times and sizes of the
+    section's local files are unchanged.
+    """
+    cache: dict[str, Any] = brand._cache.setdefault("fingerprint", {})
+
+    entry = cache.get(section)
+    if entry is not None:
+        files, stats, digest = entry
+        if files_stat(files) == stats:
+            return digest
+
+    value = getattr(brand, section)
+    files = local_files(value)
+    stats = files_stat(files)
+    digest = compute_fingerprint(value, files)
+    cache[section] = (files, stats, digest)
+    return digest
+
+
+def brand_fingerprint(brand: Brand) -> str:
+    """The fingerprint of `brand`, combining its section fingerprints."""
+    digest = hashlib.sha256()
+    for section in BRAND_FINGERPRINT_SECTIONS:
+        fingerprint = section_fingerprint(brand, section)
+        digest.update(f"{section}:{fingerprint}\n".encode("ascii"))
+
+    if brand.defaults is not None:
+        data = json.dumps(
+            brand.model_dump(mode="json", include={"defaults"}),
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        digest.update(f"defaults:{data}".encode())
+
+    return digest.hexdigest()
@@ -0,0 +1,176 @@
+"""
+Font weight and style, read from the tables of a local font file.
+
+Only the table directory and the `fvar` and `OS/2` tables are read, seeking to
+each table rather than reading the whole font. The `wght` axis of the `fvar`
+table gives the weight range of a variable font, otherwise `usWeightClass` in
+the `OS/2` table gives the weight of a static font, and the `fsSelection` flags
+give its style. TrueType and OpenType fonts, font collections (first font only)
+and WOFF fonts are supported, WOFF2 fonts are not. Results are cached and
+reused while the file's modification time and size are unchanged.
+"""
+
+from __future__ import annotations
+
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Literal, NamedTuple, Optional
+
+from ._fingerprint import file_stat
+
+FONT_INFO_TABLES = (b"fvar", b"OS/2")
+"""The font tables read by `read_font_info()`."""
+
+
+class FontInfo(NamedTuple):
+    """The weight and style of a font file."""
+
+    weight: tuple[int, int]
+    """The lowest and highest weight, which differ for variable fonts."""
+
+    style: Literal["normal", "italic", "oblique"] = "normal"
+
+    @property
+    def variable(self) -> bool:
+        return self.weight[0] != self.weight[1]
+
+    def css_weight(self) -> str:
+        """The `font-weight` descriptor for an `@font-face` rule."""
+        low, high = self.weight
+        return str(low) if low == high else f"{low} {high}"
+
+
+def _sfnt_tables(f: BinaryIO, offset: int = 0) -> dict[bytes, tuple[int, int]]:
+    f.seek(offset + 4)
+    (num_tables,) = struct.unpack(">H", f.read(2))
+    f.seek(offset + 12)
+    records = f.read(16 * num_tables)
+    tables = {}
+    for i in range(num_tables):
+        tag, _, table_offset, length = struct.unpack_from(
+            ">4sIII", records, 16 * i
+        )
+        tables[tag] = (table_offset, length)
+    return tables
+
+
+def _read_sfnt_table(f: BinaryIO, entry: tuple[int, int]) -> bytes:
+    offset, length = entry
+    f.seek(offset)
+    return f.read(length)
+
+
+def _woff_tables(f: BinaryIO) -> dict[bytes, bytes]:
+    f.seek(12)
+    (num_tables,) = struct.unpack(">H", f.read(2))
+    f.seek(44)
+    records = f.read(20 * num_tables)
+    tables = {}
+    for i in range(num_tables):
+        tag, offset, comp_length, orig_length, _ = struct.unpack_from(
+            ">4sIIII", records, 20 * i
+        )
+        if tag not in FONT_INFO_TABLES:
+            continue
+        f.seek(offset)
+        data = f.read(comp_length)
+        if comp_length < orig_length:
+            data = zlib.decompress(data)
+        tables[tag] = data
+    return tables
+
+
+def _fvar_weight(fvar: bytes) -> tuple[int, int] | None:
+    axes_offset, _, axis_count, axis_size = struct.unpack_from(">HHHH", fvar, 4)
+    for i in range(axis_count):
+        tag, min_value, _, max_value = struct.unpack_from(
+            ">4siii", fvar, axes_offset + i * axis_size
+        )
+        if tag == b"wght":
+            return round(min_value / 65536), round(max_value / 65536)
+    return None
+
+
+def _os2_weight_style(
+    os2: bytes,
+) -> tuple[int, Literal["normal", "italic", "oblique"]]:
+    (weight_class,) = struct.unpack_from(">H", os2, 4)
+    (fs_selection,) = struct.unpack_from(">H", os2, 62)
+    if fs_selection & 1:
+        style = "italic"
+    elif fs_selection & (1 << 9):
+        style = "oblique"
+    else:
+        style = "normal"
+    return weight_class, style
+
+
+def read_font_info(path: Path) -> FontInfo | None:
+    """Read the weight and style of the font at `path`."""
+    with path.open("rb") as f:
+        signature = f.read(4)
+        if signature == b"wOFF":
+            tables = _woff_tables(f)
+        elif signature in (b"\x00\x01\x00\x00", b"OTTO", b"true", b"ttcf"):
+            offset = 0
+            if signature == b"ttcf":
+                f.seek(12)
+                (offset,) = struct.unpack(">I", f.read(4))
+            entries = _sfnt_tables(f, offset)
+            tables = {
+                tag: _read_sfnt_table(f, entries[tag])
+                for tag in FONT_INFO_TABLES
+                if tag in entries
+            }
+        else:
+            return None
+
+    if b"OS/2" not in tables:
+        return None
+
+    weight, style = _os2_weight_style(tables[b"OS/2"])
+    weights = _fvar_weight(tables[b"fvar"]) if b"fvar" in tables else None
+    return FontInfo(weights or (weight, weight), style)
+
+
+class FontInfoCache:
+    """Font info for local files, reused while the file is unchanged."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[
+            Path, tuple[tuple[int, int], Optional[FontInfo]]
+        ] = {}
+
+    def get(self, path: Path) -> FontInfo | None:
+        stat = file_stat(path)
+        if stat is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and entry[0] == stat:
+            return entry[1]
+
+        try:
+            info = read_font_info(path)
+        except (OSError, struct.error, zlib.error):
+            info = None
+
+        with self._lock:
+            self._entries[path] = (stat, info)
+        return info
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+font_info_cache = FontInfoCache()
+
+
+def font_info(path: Path) -> FontInfo | None:
+    """The cached weight and style of the font at `path`."""
+    return font_info_cache.get(path)
@@ -0,0 +1,348 @@
+"""
+Font subsetting and WOFF2 transcoding for local font files, using the optional
+`fontTools` package.
+
+Each local font can be split into one file per unicode range, e.g. `latin` and
+`latin-ext`, and each file is paired with a `unicode-range` descriptor in its
+`@font-face` rule, so browsers only download the files for the characters used
+on a page. Fonts can also be transcoded to WOFF2, which is listed first in the
+`src` of the `@font-face` rule. Subsets and WOFF2 files are cached in memory by
+the content hash of their source, and WOFF2 files are also cached on disk, see
+`font_cache_dir()`, since transcoding is slow.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import os
+import re
+import shutil
+import threading
+import warnings
+from collections.abc import Mapping
+from io import BytesIO
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, NamedTuple, Optional
+
+from ._fingerprint import file_digest_cache, file_stat
+from ._utils_logging import logger
+
+FONT_TOOLS_CACHE_BYTES = 32 * 1024 * 1024
+"""The maximum total size, in bytes, of font subsets and WOFF2 files kept in
+memory."""
+
+
+class FontFileCopy(NamedTuple):
+    """A copy of a local font file, or a subset of one, written by
+    `fonts_write_css()`."""
+
+    path: str
+    """The path to the copy, relative to the CSS file."""
+
+    unicode_range: Optional[str] = None
+    """The CSS `unicode-range` of a subset."""
+
+    woff2: Optional[str] = None
+    """The path to a WOFF2 version of the copy, relative to the CSS file."""
+
+    size: int = 0
+    """The size of the copy, in bytes."""
+
+    woff2_size: Optional[int] = None
+    """The size of the WOFF2 version, in bytes."""
+
+
+def font_tools(
+    module: str = "fontTools.subset",
+    feature: str = "Font subsetting",
+) -> ModuleType:
+    """Import a `fontTools` module, which is an optional dependency."""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"{feature} requires the `fonttools` package. "
+            + "Install it with `pip install brand_yml[fonts]`."
+        ) from e
+
+
+def require_woff2() -> None:
+    """Check that `fontTools` can write WOFF2 files, which requires brotli."""
+    font_tools("fontTools.ttLib", "WOFF2 transcoding")
+    try:
+        importlib.import_module("brotli")
+    except ImportError as e:
+        raise ImportError(
+            "WOFF2 transcoding requires the `brotli` package. "
+            + "Install it with `pip install brand_yml[fonts]`."
+        ) from e
+
+
+_unicode_range_item = re.compile(
+    r"^U\+([0-9A-F?]{1,6})(?:-([0-9A-F]{1,6}))?$", re.IGNORECASE
+)
+
+
+def parse_unicode_range(value: str) -> frozenset[int]:
+    """
+    Parse a CSS `unicode-range` value, e.g. `"U+0000-00FF, U+0131, U+04??"`,
+    into a set of code points.
+    """
+    codepoints: set[int] = set()
+    for item in value.split(","):
+        match = _unicode_range_item.match(item.strip())
+        if match is None:
+            raise ValueError(f"Invalid unicode range: {item.strip()!r}")
+        start, end = match.groups()
+        if "?" in start:
+            if end is not None:
+                raise ValueError(f"Invalid unicode range: {item.strip()!r}")
+            start, end = start.replace("?", "0"), start.replace("?", "F")
+        first = int(start, 16)
+        last = int(end, 16) if end is not None else first
+        if last < first:
+            raise ValueError(f"Invalid unicode range: {item.strip()!r}")
+        codepoints.update(range(first, last + 1))
+    return frozenset(codepoints)
+
+
+def subset_font_bytes(path: Path, unicode_range: str) -> bytes | None:
+    """
+    Subset the font at `path` to the characters in `unicode_range`.
+
+    Returns the subset font, in the same format as the original, or `None` if
+    the font has no characters in `unicode_range`.
+    """
+    subset = font_tools("fontTools.subset")
+    ttLib = font_tools("fontTools.ttLib")
+
+    font = ttLib.TTFont(path)
+    cmap = font.getBestCmap() or {}
+    unicodes = parse_unicode_range(unicode_range).intersection(cmap)
+    if not unicodes:
+        return None
+
+    options = subset.Options()
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    options.name_languages = ["*"]
+    options.notdef_outline = True
+    options.flavor = font.flavor
+
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=unicodes)
+    subsetter.subset(font)
+
+    out = BytesIO()
+    font.flavor = options.flavor
+    font.save(out)
+    return out.getvalue()
+
+
+def woff2_font_bytes(data: bytes) -> bytes:
+    """Transcode a TrueType, OpenType or WOFF font to WOFF2."""
+    ttLib = font_tools("fontTools.ttLib", "WOFF2 transcoding")
+
+    font = ttLib.TTFont(BytesIO(data))
+    font.flavor = "woff2"
+    out = BytesIO()
+    font.save(out)
+    return out.getvalue()
+
+
+def font_cache_dir() -> Path | None:
+    """
+    The directory where WOFF2 files are cached between processes.
+
+    The directory is set by the `BRAND_YML_CACHE_DIR` environment variable,
+    which can also be set to `0` or `false` to turn the disk cache off, and
+    defaults to `brand_yml` in `XDG_CACHE_HOME` or `~/.cache`.
+    """
+    value = os.getenv("BRAND_YML_CACHE_DIR", "").strip()
+    if value.lower() in ("0", "false", "no", "off"):
+        return None
+    if value:
+        return Path(value).expanduser()
+
+    xdg_cache = os.getenv("XDG_CACHE_HOME", "").strip()
+    root = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return root / "brand_yml"
+
+
+def woff2_cached_bytes(data: bytes, digest: str) -> bytes:
+    """
+    Transcode a font to WOFF2, re-using the file cached on disk for the SHA-256
+    `digest` of `data` if there is one.
+
+    Cache files are written atomically. Errors reading or writing the cache are
+    ignored, the font is transcoded instead.
+    """
+    cache_dir = font_cache_dir()
+    if cache_dir is None:
+        return woff2_font_bytes(data)
+
+    path = cache_dir / "woff2" / f"{digest}.woff2"
+    try:
+        cached = path.read_bytes()
+    except OSError:
+        cached = b""
+    if cached:
+        return cached
+
+    woff2 = woff2_font_bytes(data)
+    tmp_path = path.with_name(
+        f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(woff2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not cache WOFF2 font in {path.parent}: {e}")
+        tmp_path.unlink(missing_ok=True)
+    return woff2
+
+
+class FontToolsCache:
+    """
+    Font subsets and WOFF2 files, keyed by the content hash of the source.
+
+    The least recently used files are dropped once their total size exceeds
+    `FONT_TOOLS_CACHE_BYTES`, and larger files aren't kept at all. WOFF2 files
+    are also cached on disk, so dropping them is cheap.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, ...], Optional[bytes]] = {}
+        self._size = 0
+
+    def get(
+        self,
+        key: tuple[str, ...],
+        compute: Callable[[], bytes | None],
+    ) -> bytes | None:
+        with self._lock:
+            if key in self._entries:
+                data = self._entries.pop(key)
+                self._entries[key] = data
+                return data
+
+        data = compute()
+        size = len(data) if data is not None else 0
+        if size > FONT_TOOLS_CACHE_BYTES:
+            return data
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            self._size -= len(old) if old is not None else 0
+            while self._entries and self._size + size > FONT_TOOLS_CACHE_BYTES:
+                dropped = self._entries.pop(next(iter(self._entries)))
+                self._size -= len(dropped) if dropped is not None else 0
+            self._entries[key] = data
+            self._size += size
+        return data
+
+    def subset(self, path: Path, unicode_range: str) -> bytes | None:
+        stat = file_stat(path)
+        if stat is None:
+            raise FileNotFoundError(path)
+        digest = file_digest_cache.get(path, stat)
+        return self.get(
+            ("subset", digest, unicode_range),
+            lambda: subset_font_bytes(path, unicode_range),
+        )
+
+    def woff2(self, data: bytes) -> bytes:
+        digest = hashlib.sha256(data).hexdigest()
+        woff2 = self.get(
+            ("woff2", digest), lambda: woff2_cached_bytes(data, digest)
+        )
+        assert woff2 is not None
+        return woff2
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+font_tools_cache = FontToolsCache()
+
+
+def write_font_copies(
+    path: Path,
+    rel_path: Path,
+    path_dir: Path,
+    *,
+    ranges: Mapping[str, str] | None = None,
+    woff2: bool = False,
+) -> list[FontFileCopy]:
+    """
+    Copy the font at `path` into `path_dir` at `rel_path`, or write one subset
+    per unicode range in `ranges` next to it, e.g. `fonts/Font.latin.ttf`, and
+    a WOFF2 version of each file if `woff2` is set.
+
+    Subsets without any characters in the font are skipped. If the font can't
+    be subset, or has no characters in any of the `ranges`, it is copied as
+    is. Fonts that can't be transcoded to WOFF2 are only copied.
+    """
+    files: list[tuple[Path, bytes, str | None]] = []
+
+    if ranges:
+        try:
+            for name, unicode_range in ranges.items():
+                data = font_tools_cache.subset(path, unicode_range)
+                if data is not None:
+                    rel_subset = rel_path.with_name(
+                        f"{rel_path.stem}.{name}{rel_path.suffix}"
+                    )
+                    files.append((rel_subset, data, unicode_range))
+        except Exception as e:
+            warnings.warn(
+                f"Could not subset font at {rel_path}, "
+                + f"using the full font instead: {e}"
+            )
+            files = []
+
+    copies: list[FontFileCopy] = []
+
+    if not files:
+        dest_path = path_dir / rel_path
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(path, dest_path)
+        if not woff2 or rel_path.suffix == ".woff2":
+            size = dest_path.stat().st_size
+            return [FontFileCopy(rel_path.as_posix(), size=size)]
+        files.append((rel_path, dest_path.read_bytes(), None))
+    else:
+        for rel_file, data, _ in files:
+            dest_path = path_dir / rel_file
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            dest_path.write_bytes(data)
+
+    for rel_file, data, unicode_range in files:
+        copy = FontFileCopy(
+            rel_file.as_posix(),
+            unicode_range=unicode_range,
+            size=len(data),
+        )
+        if woff2 and rel_file.suffix != ".woff2":
+            try:
+                woff2_data = font_tools_cache.woff2(data)
+            except Exception as e:
+                warnings.warn(
+                    f"Could not transcode font at {rel_file} to WOFF2: {e}"
+                )
+            else:
+                rel_woff2 = rel_file.with_suffix(".woff2")
+                (path_dir / rel_woff2).write_bytes(woff2_data)
+                copy = copy._replace(
+                    woff2=rel_woff2.as_posix(),
+                    woff2_size=len(woff2_data),
+                )
+        copies.append(copy)
+
+    return copies
@@ -6,11 +6,22 @@ import htmltools
 
 from .__version import __version_tuple__
 
+_dep_brand_light_dark = htmltools.HTMLDependency(
+    name="brand-logo-light-dark",
+    version=".".join(map(str, __version_tuple__[:3])),
+    source={"subdir": "www/shiny"},
+    stylesheet={"href": "brand-light-dark.css"},
+    all_files=False,
+)
+
 
 def html_dep_brand_light_dark():
     """
     Generate HTML dependency for brand light/dark CSS.
 
+    The same `htmltools.HTMLDependency` instance is returned on every call, so
+    rendering many logos doesn't create a new dependency for each one.
+
     Returns
     -------
     :
@@ -23,10 +34,4 @@ def html_dep_brand_light_dark():
     # if in_quarto_environment():
     #     return None
 
-    return htmltools.HTMLDependency(
-        name="brand-logo-light-dark",
-        version=".".join(map(str, __version_tuple__[:3])),
-        source={"subdir": "www/shiny"},
-        stylesheet={"href": "brand-light-dark.css"},
-        all_files=False,
-    )
+    return _dep_brand_light_dark
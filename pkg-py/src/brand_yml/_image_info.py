@@ -0,0 +1,208 @@
+"""
+Image dimensions and MIME types, read from the first bytes of an image file.
+
+Only the file header is read: the IHDR chunk of a PNG, the logical screen of a
+GIF, the VP8/VP8L/VP8X header of a WebP, the start-of-frame segment of a JPEG
+(skipping earlier segments without reading them) or the opening `<svg>` tag of
+an SVG. Results are cached and reused while the file's modification time and
+size are unchanged.
+"""
+
+from __future__ import annotations
+
+import re
+import struct
+import threading
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, Optional
+
+from ._fingerprint import file_stat
+
+SVG_HEADER_SIZE = 4096
+"""The number of bytes read to find the opening `<svg>` tag of an SVG."""
+
+
+class ImageInfo(NamedTuple):
+    """The intrinsic size and MIME type of an image."""
+
+    mime_type: str
+    width: Optional[float] = None
+    height: Optional[float] = None
+
+    def html_size(self) -> dict[str, str]:
+        """`width` and `height` attributes for an `<img>` tag, if known."""
+        if not self.width or not self.height:
+            return {}
+        return {
+            "width": str(max(1, round(self.width))),
+            "height": str(max(1, round(self.height))),
+        }
+
+
+def _png(head: bytes, f: BinaryIO) -> ImageInfo | None:
+    if head[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", head[16:24])
+    return ImageInfo("image/png", width, height)
+
+
+def _gif(head: bytes, f: BinaryIO) -> ImageInfo | None:
+    width, height = struct.unpack("<HH", head[6:10])
+    return ImageInfo("image/gif", width, height)
+
+
+def _webp(head: bytes, f: BinaryIO) -> ImageInfo | None:
+    chunk = head[12:16]
+    if chunk == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", head[26:30])
+        return ImageInfo("image/webp", width & 0x3FFF, height & 0x3FFF)
+    if chunk == b"VP8L" and head[20:21] == b"\x2f":
+        bits = int.from_bytes(head[21:25], "little")
+        width = (bits & 0x3FFF) + 1
+        height = ((bits >> 14) & 0x3FFF) + 1
+        return ImageInfo("image/webp", width, height)
+    if chunk == b"VP8X":
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return ImageInfo("image/webp", width, height)
+    return ImageInfo("image/webp")
+
+
+# Start-of-frame markers, excluding DHT (C4), JPG (C8) and DAC (CC)
+_JPEG_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _jpeg(head: bytes, f: BinaryIO) -> ImageInfo | None:
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return ImageInfo("image/jpeg")
+        if marker[1] == 0xFF:
+            # Fill bytes before a marker
+            f.seek(-1, 1)
+            continue
+        if marker[1] == 0x01 or 0xD0 <= marker[1] <= 0xD9:
+            # Markers without a length
+            continue
+        size = f.read(2)
+        if len(size) < 2:
+            return ImageInfo("image/jpeg")
+        (length,) = struct.unpack(">H", size)
+        if marker[1] in _JPEG_SOF:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return ImageInfo("image/jpeg")
+            height, width = struct.unpack(">HH", frame[1:5])
+            return ImageInfo("image/jpeg", width, height)
+        f.seek(length - 2, 1)
+
+
+_svg_tag = re.compile(rb"<svg\b[^>]*>", re.IGNORECASE | re.DOTALL)
+_svg_length = re.compile(
+    r"^\s*([0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s*(px)?\s*$"
+)
+
+
+def _svg_attr(tag: str, name: str) -> str | None:
+    match = re.search(rf"\s{name}\s*=\s*([\"'])(.*?)\1", tag, re.DOTALL)
+    return match.group(2) if match else None
+
+
+def _svg_size(value: str | None) -> float | None:
+    if value is None:
+        return None
+    match = _svg_length.match(value)
+    # Only unitless or pixel sizes are intrinsic, e.g. not `100%` or `2em`
+    return float(match.group(1)) if match else None
+
+
+def _svg(head: bytes, f: BinaryIO) -> ImageInfo | None:
+    match = _svg_tag.search(head)
+    if match is None:
+        return None
+
+    tag = match.group(0).decode("utf-8", errors="replace")
+    width = _svg_size(_svg_attr(tag, "width"))
+    height = _svg_size(_svg_attr(tag, "height"))
+
+    view_box = _svg_attr(tag, "viewBox")
+    if view_box is not None and (width is None or height is None):
+        try:
+            _, _, vb_width, vb_height = map(
+                float, view_box.replace(",", " ").split()
+            )
+        except ValueError:
+            vb_width = vb_height = 0
+        if vb_width > 0 and vb_height > 0:
+            if width is None and height is None:
+                width, height = vb_width, vb_height
+            elif width is None:
+                width = height * vb_width / vb_height  # type: ignore[operator]
+            else:
+                height = width * vb_height / vb_width
+
+    return ImageInfo("image/svg+xml", width, height)
+
+
+def read_image_info(path: Path) -> ImageInfo | None:
+    """
+    Read the size and MIME type of a PNG, JPEG, GIF, WebP or SVG image from
+    the start of the file, or `None` if the format isn't recognized.
+    """
+    with open(path, "rb") as f:
+        head = f.read(32)
+        if head.startswith(b"\x89PNG\r\n\x1a\n"):
+            return _png(head, f)
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            return _gif(head, f)
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            return _webp(head, f)
+        if head[:3] == b"\xff\xd8\xff":
+            return _jpeg(head, f)
+
+        head += f.read(SVG_HEADER_SIZE - len(head))
+        if b"<svg" in head or b"<SVG" in head:
+            return _svg(head, f)
+    return None
+
+
+class ImageInfoCache:
+    """Image info for local files, reused while the file is unchanged."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[
+            Path, tuple[tuple[int, int], Optional[ImageInfo]]
+        ] = {}
+
+    def get(self, path: Path) -> ImageInfo | None:
+        stat = file_stat(path)
+        if stat is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and entry[0] == stat:
+            return entry[1]
+
+        try:
+            info = read_image_info(path)
+        except (OSError, struct.error):
+            info = None
+
+        with self._lock:
+            self._entries[path] = (stat, info)
+        return info
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+image_info_cache = ImageInfoCache()
+
+
+def image_info(path: Path) -> ImageInfo | None:
+    """The cached size and MIME type of the image at `path`."""
+    return image_info_cache.get(path)
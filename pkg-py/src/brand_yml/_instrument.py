@@ -0,0 +1,251 @@
+"""
+Timing instrumentation for brand_yml.
+
+The expensive phases of reading and using a brand -- finding the brand file,
+parsing YAML, validation, resolving definitions, resolving local paths and
+preparing fonts and logos -- are wrapped in named spans. Spans are only timed
+and reported while instrumentation is active (see `instrument()`); otherwise
+`span()` returns a shared no-op context manager.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import ExitStack, nullcontext
+from functools import wraps
+from typing import Any, Callable, ContextManager, NamedTuple, TypeVar
+
+from ._utils_logging import logger
+
+
+class BrandSpan(NamedTuple):
+    """A timed phase of brand_yml's work, reported by `instrument()`."""
+
+    name: str
+    """The name of the phase, e.g. `"yaml.load"`."""
+
+    start: float
+    """The start time, from `time.perf_counter()`."""
+
+    duration: float
+    """The duration of the phase, in seconds."""
+
+    attributes: dict[str, Any]
+    """Additional details about the phase, e.g. the file path."""
+
+    error: BaseException | None = None
+    """The exception raised during the phase, if any."""
+
+
+SpanCallbackType = Callable[[BrandSpan], Any]
+
+
+class BrandInstrumentation:
+    """
+    An active set of instrumentation handlers.
+
+    Returned by [`brand_yml.instrument()`](`brand_yml.instrument`). Use it as a
+    context manager or call `.stop()` to stop reporting spans.
+    """
+
+    def __init__(
+        self,
+        callback: SpanCallbackType | None = None,
+        *,
+        log: bool | int = False,
+        tracer: Any = None,
+    ):
+        self.callback = callback
+        self.log_level: int | None = (
+            None if log is False else logging.DEBUG if log is True else int(log)
+        )
+        self.tracer = tracer
+
+    def start(self) -> BrandInstrumentation:
+        """Start reporting spans to this instrumentation's handlers."""
+        with _registry.lock:
+            if self not in _registry.active:
+                _registry.active = (*_registry.active, self)
+        return self
+
+    def stop(self) -> None:
+        """Stop reporting spans to this instrumentation's handlers."""
+        with _registry.lock:
+            _registry.active = tuple(
+                x for x in _registry.active if x is not self
+            )
+
+    def __enter__(self) -> BrandInstrumentation:
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def report(self, span: BrandSpan) -> None:
+        if self.log_level is not None:
+            logger.log(
+                self.log_level,
+                f"{span.name} took {span.duration * 1000:.3f}ms"
+                + "".join(f" {k}={v!r}" for k, v in span.attributes.items())
+                + (f" error={span.error!r}" if span.error else ""),
+            )
+        if self.callback is not None:
+            self.callback(span)
+
+
+class InstrumentationRegistry:
+    """The instrumentation that is currently active."""
+
+    __slots__ = ("active", "lock")
+
+    def __init__(self):
+        self.active: tuple[BrandInstrumentation, ...] = ()
+        self.lock = threading.Lock()
+
+
+_registry = InstrumentationRegistry()
+_null_span: ContextManager[None] = nullcontext()
+
+
+def instrument(
+    callback: SpanCallbackType | None = None,
+    *,
+    log: bool | int = False,
+    tracer: Any = None,
+) -> BrandInstrumentation:
+    """
+    Time the phases of loading and using a brand.
+
+    Reports timing spans for finding brand files (`find_project_brand_yml`),
+    parsing YAML (`yaml.load`), checking the JSON Schema (`schema.validate`),
+    validation (`Brand.model_validate`), resolving color and logo definitions
+    (`defs_replace_recursively`), resolving local file paths
+    (`Brand._set_root_path`), writing font CSS
+    (`BrandTypography.fonts_write_css`) and encoding local logo images
+    (`BrandLogoResource._maybe_base64_encode_image`).
+
+    Instrumentation starts when `instrument()` is called and stops at the end
+    of a `with` block or when `.stop()` is called on the returned object. When
+    instrumentation isn't active, brand_yml skips timing entirely.
+
+    Parameters
+    ----------
+    callback
+        A function called with a [`BrandSpan`](`brand_yml.BrandSpan`) when
+        each phase finishes.
+    log
+        Whether to log a message to the `brand_yml` logger when each phase
+        finishes. Use `True` to log at the `DEBUG` level or pass a logging
+        level, e.g. `logging.INFO`.
+    tracer
+        An [OpenTelemetry](https://opentelemetry.io/docs/languages/python/)
+        tracer, or any object with a compatible
+        `start_as_current_span(name, attributes=...)` method. A span is started
+        with the tracer for each phase.
+
+    Returns
+    -------
+    :
+        A `BrandInstrumentation` object that can be used as a context manager.
+
+    Examples
+    --------
+
+    ```python
+    import brand_yml
+
+    spans = []
+    with brand_yml.instrument(spans.append):
+        brand = brand_yml.Brand.from_yaml(__file__)
+
+    for span in spans:
+        print(f"{span.name}: {span.duration * 1000:.2f}ms")
+    ```
+
+    ```python
+    from opentelemetry import trace
+
+    brand_yml.instrument(tracer=trace.get_tracer("brand_yml"))
+    ```
+    """
+    return BrandInstrumentation(callback, log=log, tracer=tracer).start()
+
+
+class InstrumentedSpan:
+    """Times a block of code and reports it to the active instrumentation."""
+
+    __slots__ = ("_active", "_stack", "_start", "attributes", "name")
+
+    def __init__(
+        self,
+        name: str,
+        attributes: dict[str, Any],
+        active: tuple[BrandInstrumentation, ...],
+    ):
+        self.name = name
+        self.attributes = attributes
+        self._active = active
+        self._stack = ExitStack()
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        for inst in self._active:
+            if inst.tracer is not None:
+                self._stack.enter_context(
+                    inst.tracer.start_as_current_span(
+                        self.name,
+                        attributes={
+                            k: str(v) for k, v in self.attributes.items()
+                        },
+                    )
+                )
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type: Any, exc: BaseException | None, tb: Any):
+        duration = time.perf_counter() - self._start
+        span = BrandSpan(self.name, self._start, duration, self.attributes, exc)
+        try:
+            for inst in self._active:
+                inst.report(span)
+        finally:
+            self._stack.__exit__(exc_type, exc, tb)
+        return False
+
+
+def span(name: str, /, **attributes: Any) -> ContextManager[None]:
+    """
+    Time a block of code, if instrumentation is active.
+
+    Parameters
+    ----------
+    name
+        The name of the span.
+    **attributes
+        Details to report with the span.
+    """
+    active = _registry.active
+    if not active:
+        return _null_span
+    return InstrumentedSpan(name, attributes, active)
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def instrumented(name: str) -> Callable[[F], F]:
+    """Decorate a function to report a span each time it is called."""
+
+    def decorator(fn: F) -> F:
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            active = _registry.active
+            if not active:
+                return fn(*args, **kwargs)
+            with InstrumentedSpan(name, {}, active):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,49 @@
+"""
+Copies of local logo images with content-hashed file names, for serving logos
+as static files rather than embedding them in every page.
+"""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Any
+
+from ._fingerprint import file_digest_cache, file_stat, local_files
+
+LOGO_ASSET_HASH_LENGTH = 12
+"""The number of hex digits of the content hash in logo asset file names."""
+
+
+def logo_asset_name(path: Path) -> str | None:
+    """
+    The content-hashed file name of the image at `path`, e.g.
+    `logo-3f2a9c1d7b4e.svg`, or `None` if the file doesn't exist.
+    """
+    stat = file_stat(path)
+    if stat is None:
+        return None
+    digest = file_digest_cache.get(path, stat)
+    return f"{path.stem}-{digest[:LOGO_ASSET_HASH_LENGTH]}{path.suffix}"
+
+
+def logos_write_assets(logo: Any, path_dir: str | Path) -> Path | None:
+    """
+    Copy the local images in `logo` into `path_dir` under their content-hashed
+    names. Files that are already in `path_dir` aren't copied again.
+    """
+    files = {f.absolute() for f in local_files(logo)}
+    assets = {path: logo_asset_name(path) for path in sorted(files)}
+    assets = {path: name for path, name in assets.items() if name is not None}
+    if not assets:
+        return None
+
+    path_dir = Path(path_dir).expanduser().resolve()
+    path_dir.mkdir(parents=True, exist_ok=True)
+
+    for path, name in assets.items():
+        dest_path = path_dir / name
+        if not dest_path.exists():
+            shutil.copyfile(path, dest_path)
+
+    return path_dir
@@ -0,0 +1,249 @@
+"""
+Structural validation of raw brand YAML data against the brand.yml JSON Schema.
+
+The schema in `schema/brand.schema.json` is exported from Quarto's schema for
+`_brand.yml`. It is read, adapted and compiled once, and the compiled validator
+is reused for every file. Checking the raw YAML data against the schema is much
+cheaper than building the brand models and reports every structural error in a
+file at once, which makes it a useful first pass when checking many files,
+e.g. in CI. The models still do the full validation.
+
+The schema is adapted in a few ways. Quarto's `object: {properties: ...}` form
+is rewritten as standard JSON Schema. Definitions where the exported schema is
+narrower than the brand models -- logo shorthands, `{path, alt}` logo resources,
+font weight ranges, `auto` weights and lists of styles -- are widened so that
+the schema never rejects a file the models accept. A few constraints that were
+lost in the export, e.g. the named logo images and palette colors, are
+restored.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from ._utils import find_project_file
+
+BRAND_SCHEMA_FILE = "brand.schema.json"
+"""The file name of the brand.yml JSON Schema."""
+
+# Definitions that replace the exported schema where it differs from the brand
+# models.
+brand_schema_overrides: dict[str, dict[str, Any]] = {
+    "BrandStringLightDark": {
+        "anyOf": [
+            {"$ref": "#/$defs/BrandLogoResource"},
+            {
+                "type": "object",
+                "properties": {
+                    "light": {"$ref": "#/$defs/BrandLogoResource"},
+                    "dark": {"$ref": "#/$defs/BrandLogoResource"},
+                },
+            },
+        ]
+    },
+    "BrandLogoExplicitResource": {
+        "type": "object",
+        "properties": {
+            "path": {"type": "string"},
+            "alt": {"type": "string"},
+        },
+        "required": ["path"],
+    },
+    "BrandFontWeight": {
+        "anyOf": [
+            {"type": ["integer", "number", "string"]},
+            {"type": "array", "items": {"type": ["integer", "string"]}},
+        ]
+    },
+    "BrandFontStyle": {
+        "anyOf": [
+            {"enum": ["normal", "italic", "oblique"]},
+            {"type": "array", "items": {"enum": ["normal", "italic"]}},
+        ]
+    },
+}
+
+# Properties added to, or replacing, the properties of exported definitions.
+brand_schema_property_overrides: dict[str, dict[str, Any]] = {
+    "Brand": {
+        "logo": {
+            "anyOf": [
+                {"$ref": "#/$defs/BrandLogoResource"},
+                {"$ref": "#/$defs/BrandLogo"},
+            ]
+        },
+        "extends": {"type": "string"},
+    },
+    "BrandLogo": {
+        "images": {
+            "type": "object",
+            "additionalProperties": {"$ref": "#/$defs/BrandLogoResource"},
+        },
+    },
+    "BrandColor": {
+        "palette": {
+            "type": "object",
+            "additionalProperties": {"$ref": "#/$defs/BrandColorValue"},
+        },
+    },
+    "BrandFontCommon": {
+        "source": {"enum": ["file", "google", "bunny", "system"]},
+    },
+}
+
+
+class BrandSchemaIssue(NamedTuple):
+    """A structural error in brand YAML data."""
+
+    path: str
+    """The location of the error, e.g. `"typography.fonts[0].source"`."""
+
+    message: str
+    """A description of the error."""
+
+    def __str__(self) -> str:
+        return f"{self.path or '<root>'}: {self.message}"
+
+
+class BrandSchemaError(ValueError):
+    """
+    Brand YAML data that does not match the brand.yml JSON Schema.
+
+    All structural errors in the data are collected in `errors`.
+    """
+
+    def __init__(
+        self, errors: list[BrandSchemaIssue], path: Path | None = None
+    ):
+        self.errors = errors
+        self.path = path
+        where = f" in {str(path)!r}" if path is not None else ""
+        n = len(errors)
+        lines = [f"{n} schema error{'s' if n != 1 else ''}{where}:"]
+        lines += [f"  {error}" for error in errors]
+        super().__init__("\n".join(lines))
+
+
+def json_schema() -> Any:
+    """Import `jsonschema`, which is an optional dependency."""
+    try:
+        return importlib.import_module("jsonschema")
+    except ImportError as e:
+        raise ImportError(
+            "Schema validation requires the `jsonschema` package. "
+            + "Install it with `pip install brand_yml[schema]`."
+        ) from e
+
+
+def normalize_schema(node: Any) -> Any:
+    """
+    Rewrite Quarto's `{object: {properties: ...}}` form as standard JSON
+    Schema, i.e. `{type: object, properties: ...}`.
+    """
+    if isinstance(node, list):
+        return [normalize_schema(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    node = {key: normalize_schema(value) for key, value in node.items()}
+    if isinstance(node.get("object"), dict):
+        node = {"type": "object", **node.pop("object"), **node}
+    return node
+
+
+def prepare_brand_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Adapt the exported brand.yml schema for validating raw brand data."""
+    schema = normalize_schema(schema)
+    defs: dict[str, Any] = schema.setdefault("$defs", {})
+
+    defs.update(brand_schema_overrides)
+    for name, properties in brand_schema_property_overrides.items():
+        defs[name].setdefault("properties", {}).update(properties)
+
+    # The export only keeps `Brand*` definitions, so references to anything
+    # else, e.g. `LineHeightNumberString`, are left unconstrained.
+    refs = {
+        value.removeprefix("#/$defs/")
+        for value in iter_refs(schema)
+        if value.startswith("#/$defs/")
+    }
+    for ref in refs - defs.keys():
+        defs[ref] = {}
+
+    return schema
+
+
+def iter_refs(node: Any):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "$ref" and isinstance(value, str):
+                yield value
+            else:
+                yield from iter_refs(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from iter_refs(item)
+
+
+def brand_schema_path() -> Path:
+    """The path to the brand.yml JSON Schema, in the package or the repo."""
+    return find_project_file(BRAND_SCHEMA_FILE, Path(__file__), ("schema",))
+
+
+@lru_cache(maxsize=1)
+def brand_schema_validator() -> Any:
+    """The compiled brand.yml JSON Schema validator, created once."""
+    jsonschema = json_schema()
+
+    with brand_schema_path().open("r", encoding="utf-8") as f:
+        schema = prepare_brand_schema(json.load(f))
+
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def format_schema_path(path: Any) -> str:
+    out = ""
+    for part in path:
+        if isinstance(part, int):
+            out += f"[{part}]"
+        else:
+            out += f".{part}" if out else str(part)
+    return out
+
+
+def brand_schema_errors(data: Any) -> list[BrandSchemaIssue]:
+    """
+    Check raw brand YAML data against the brand.yml JSON Schema.
+
+    Returns every structural error in `data`, ordered by location. For errors
+    in an `anyOf`, the most relevant error of the alternatives is reported.
+    """
+    validator = brand_schema_validator()
+    best_match = json_schema().exceptions.best_match
+
+    issues = []
+    for error in validator.iter_errors(data):
+        best = best_match([error])
+        issues.append(
+            BrandSchemaIssue(
+                format_schema_path(best.absolute_path),
+                best.message,
+            )
+        )
+    return sorted(issues)
+
+
+def check_brand_schema(data: Any, path: Path | None = None) -> None:
+    """
+    Raise a `BrandSchemaError` listing all structural errors in raw brand YAML
+    data, if there are any.
+    """
+    errors = brand_schema_errors(data)
+    if errors:
+        raise BrandSchemaError(errors, path)
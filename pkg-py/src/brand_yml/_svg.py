@@ -0,0 +1,239 @@
+"""
+SVG minification and data URIs for inlined SVG logos.
+
+Minification only makes changes that don't affect how the SVG is rendered:
+comments, the XML declaration, `<metadata>`, editor data (Inkscape and
+Sodipodi elements and attributes) and unused namespace declarations are
+removed, whitespace is collapsed and decimal numbers are written in their
+shortest form, e.g. `0.50` becomes `.5`. Whitespace between elements is kept
+if the SVG contains text.
+
+Whitespace inside quoted attribute values is only collapsed for numeric
+attributes, and the content of `<script>`, `<style>` and CDATA sections is
+left as-is.
+
+SVGs are inlined as URL-encoded `data:image/svg+xml` URIs, which are smaller
+than base64 for most SVGs, falling back to base64 when it is shorter.
+Minification is optional and off by default.
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Optional
+from urllib.parse import quote
+
+from ._fingerprint import file_stat
+
+EDITOR_NAMESPACES = ("sodipodi", "inkscape")
+"""Namespace prefixes of editor-only SVG elements and attributes."""
+
+NUMERIC_ATTRIBUTES = frozenset(
+    {
+        "d",
+        "points",
+        "viewBox",
+        "transform",
+        "gradientTransform",
+        "patternTransform",
+        "x",
+        "y",
+        "x1",
+        "x2",
+        "y1",
+        "y2",
+        "cx",
+        "cy",
+        "fx",
+        "fy",
+        "r",
+        "rx",
+        "ry",
+        "width",
+        "height",
+        "offset",
+        "opacity",
+        "fill-opacity",
+        "stroke-opacity",
+        "stroke-width",
+        "stroke-miterlimit",
+        "stroke-dasharray",
+        "stroke-dashoffset",
+    }
+)
+"""Attributes whose numbers are written in their shortest form."""
+
+_comment = re.compile(r"<!--.*?-->", re.DOTALL)
+_xml_declaration = re.compile(r"<\?xml\b.*?\?>", re.DOTALL)
+_metadata = re.compile(r"<metadata\b[^>]*?(?:/>|>.*?</metadata\s*>)", re.DOTALL)
+_editor_element = re.compile(
+    rf"<({'|'.join(EDITOR_NAMESPACES)}):([\w.-]+)\b[^>]*?(?:/>|>.*?</\1:\2\s*>)",
+    re.DOTALL,
+)
+_editor_attr = re.compile(
+    rf"""\s(?:{"|".join(EDITOR_NAMESPACES)}):[\w.-]+\s*=\s*(["']).*?\1""",
+    re.DOTALL,
+)
+_xmlns_attr = re.compile(r"""\sxmlns:([\w.-]+)\s*=\s*(["']).*?\2""")
+_tag = re.compile(r"<[^!?][^>]*>")
+_attr_value = re.compile(r"""([\w:.-]+)(\s*=\s*)(["'])(.*?)\3""", re.DOTALL)
+_quoted = re.compile(r"""("[^"]*"|'[^']*')""")
+_space_in_tag = re.compile(r"\s+(?=/?>)|(?<=\s)\s+|(?<==)\s+|\s+(?==)")
+_raw_text = re.compile(
+    r"<!--.*?-->|<!\[CDATA\[.*?\]\]>|<(script|style)\b[^>]*>.*?</\1\s*>",
+    re.DOTALL | re.IGNORECASE,
+)
+_between_tags = re.compile(r"(?<=>)\s+(?=<|$)|^\s+(?=<|$)")
+_whitespace = re.compile(r"\s+")
+_number = re.compile(r"(?<![\w.#])(\d*)\.(\d+)(?![\w.])")
+
+
+def _short_number(match: re.Match[str]) -> str:
+    whole, fraction = match.group(1), match.group(2).rstrip("0")
+    whole = whole.lstrip("0")
+    if not fraction:
+        return whole or "0"
+    return f"{whole}.{fraction}"
+
+
+def _minify_attr_value(match: re.Match[str]) -> str:
+    name, _, quote_char, value = match.groups()
+    if name in NUMERIC_ATTRIBUTES:
+        value = _whitespace.sub(" ", value).strip()
+        value = _number.sub(_short_number, value)
+    return f"{name}={quote_char}{value}{quote_char}"
+
+
+def _minify_tag(match: re.Match[str]) -> str:
+    tag = _attr_value.sub(_minify_attr_value, match.group(0))
+    # Quoted values are at odd indices and are kept as they are
+    parts = _quoted.split(tag)
+    parts[::2] = [
+        _space_in_tag.sub("", _whitespace.sub(" ", p)) for p in parts[::2]
+    ]
+    return "".join(parts)
+
+
+def _remove_editor_data(svg: str) -> str:
+    svg = _xml_declaration.sub("", svg)
+    svg = _metadata.sub("", svg)
+    svg = _editor_element.sub("", svg)
+    return _editor_attr.sub("", svg)
+
+
+def _minify_markup(svg: str, *, text: bool) -> str:
+    svg = _tag.sub(_minify_tag, svg)
+    if not text:
+        svg = _between_tags.sub("", svg)
+    return svg
+
+
+def minify_svg(svg: str) -> str:
+    """Minify an SVG document without changing how it renders."""
+    if "<!DOCTYPE" in svg or 'xml:space="preserve"' in svg:
+        # Entities or significant whitespace: only remove comments
+        return _comment.sub("", svg).strip()
+
+    # Comments are removed and `<script>`, `<style>` and CDATA content is
+    # kept as-is, so only the markup in between is minified
+    markup: list[str] = []
+    raw: list[str] = []
+    start = 0
+    for match in _raw_text.finditer(svg):
+        markup.append(svg[start : match.start()])
+        raw.append("" if match.group(0).startswith("<!--") else match.group(0))
+        start = match.end()
+    markup.append(svg[start:])
+
+    markup = [_remove_editor_data(part) for part in markup]
+    all_markup = "".join(markup)
+    for name, _ in set(_xmlns_attr.findall(all_markup)):
+        used = re.search(
+            rf"[<\s/]{re.escape(name)}:", _xmlns_attr.sub("", all_markup)
+        )
+        if not used:
+            unused = rf"""\sxmlns:{re.escape(name)}\s*=\s*(["']).*?\1"""
+            markup = [re.sub(unused, "", part) for part in markup]
+
+    text = "<text" in all_markup
+    markup = [_minify_markup(part, text=text) for part in markup]
+    return "".join(
+        part for pair in zip(markup, raw + [""]) for part in pair
+    ).strip()
+
+
+def svg_data_uri(svg: str, *, markdown: bool = False) -> str:
+    """
+    A `data:image/svg+xml` URI for `svg`.
+
+    The SVG is URL-encoded, escaping only characters that aren't allowed in a
+    URL or that would be escaped in an HTML attribute, unless base64 encoding
+    is shorter. Set `markdown` for URIs used in markdown, where spaces must be
+    escaped but quotes don't need to be.
+    """
+    if markdown:
+        if '"' in svg and "'" not in svg:
+            svg = svg.replace('"', "'")
+        safe = "'=:/;,.-()!*$+?@_~"
+    else:
+        safe = " =:/;,.-()!*$+?@_~"
+    encoded = "data:image/svg+xml," + quote(svg, safe=safe)
+
+    b64 = base64.b64encode(svg.encode("utf-8")).decode("ascii")
+    b64 = f"data:image/svg+xml;base64,{b64}"
+    return b64 if len(b64) < len(encoded) else encoded
+
+
+def svg_minify_enabled() -> bool:
+    """
+    Whether inlined SVG logos are minified, which is off unless the
+    `BRAND_YML_SVG_MINIFY` environment variable is set to `1` or `true`.
+    """
+    value = os.getenv("BRAND_YML_SVG_MINIFY", "")
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class SvgDataUriCache:
+    """SVG data URIs for local files, reused while the file is unchanged."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[
+            tuple[Path, bool, bool],
+            tuple[Optional[tuple[int, int]], str],
+        ] = {}
+
+    def get(
+        self,
+        path: Path,
+        *,
+        markdown: bool = False,
+        minify: bool = False,
+    ) -> str:
+        key = (path, minify, markdown)
+        stat = file_stat(path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and stat is not None and entry[0] == stat:
+            return entry[1]
+
+        svg = path.read_text(encoding="utf-8")
+        if minify:
+            svg = minify_svg(svg)
+        uri = svg_data_uri(svg, markdown=markdown)
+
+        with self._lock:
+            self._entries[key] = (stat, uri)
+        return uri
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+svg_data_uri_cache = SvgDataUriCache()
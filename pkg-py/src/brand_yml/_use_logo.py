@@ -1,13 +1,29 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal, cast, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    NamedTuple,
+    Union,
+    cast,
+    overload,
+)
 
 import htmltools
+from pydantic import BaseModel
 
 if TYPE_CHECKING:
     from . import Brand
 from ._defs import BrandLightDark
-from .logo import BrandLogo, BrandLogoResource, BrandLogoResourceLightDark
+from ._utils import recurse_dicts_and_models
+from .base import freeze_model
+from .logo import (
+    BrandLogo,
+    BrandLogoResource,
+    BrandLogoResourceLightDark,
+    attrs_key,
+)
 
 
 class BrandLogoMissingError(Exception):
@@ -23,6 +39,13 @@ def raise_if_required(prefix: str, required_reason: str | None) -> None:
     return None
 
 
+USE_LOGO_VARIANTS = ("auto", "light", "dark", "light-dark")
+USE_LOGO_SIZES = ("small", "medium", "large", "smallest", "largest")
+
+USE_LOGO_CACHE_SIZE = 256
+"""The maximum number of `use_logo()` results memoized per logo."""
+
+
 def use_logo(
     brand: Brand,
     name: str,
@@ -31,6 +54,97 @@ def use_logo(
     required: bool | str | None = None,
     allow_fallback: bool = True,
     **kwargs: htmltools.TagAttrValue,
+) -> BrandLogoResource | BrandLogoResourceLightDark | None:
+    """
+    Extract a logo resource from a brand, memoizing the result.
+
+    Results are cached on `brand.logo`, keyed by the arguments, so the cache is
+    dropped when a field of `brand.logo`, or of a model it contains, is
+    reassigned. Results are shared between calls, so resources and light/dark
+    wrappers created for a call are frozen; resources taken as-is from
+    `brand.logo` are returned unchanged, as before. Names that aren't in the
+    resolution table, e.g. images added to `brand.logo.images` in place, are
+    resolved on every call. See `Brand.use_logo()` for full documentation.
+    """
+    logo = brand.logo
+    key = use_logo_key(name, variant, required, allow_fallback, kwargs)
+    if (
+        logo is None
+        or key is None
+        or (name, variant, bool(allow_fallback))
+        not in logo_resolution_table(logo)
+    ):
+        return resolve_logo(
+            brand,
+            name,
+            variant,
+            required=required,
+            allow_fallback=allow_fallback,
+            **kwargs,
+        )
+
+    cache: dict[tuple[Any, ...], Any] = logo._cache.setdefault("use_logo", {})
+    if key in cache:
+        return cache[key]
+
+    result = resolve_logo(
+        brand,
+        name,
+        variant,
+        required=required,
+        allow_fallback=allow_fallback,
+        **kwargs,
+    )
+    if result is not None:
+        freeze_model(result, skip=logo_model_ids(logo))
+
+    if len(cache) >= USE_LOGO_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = result
+    return result
+
+
+def use_logo_key(
+    name: str,
+    variant: str,
+    required: bool | str | None,
+    allow_fallback: bool,
+    attrs: dict[str, Any],
+) -> tuple[Any, ...] | None:
+    """A hashable key for `use_logo()` arguments, or `None` if not hashable."""
+    attrs_frozen = attrs_key(attrs)
+    if attrs_frozen is None:
+        return None
+    key = (name, variant, required, allow_fallback, attrs_frozen)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def logo_model_ids(logo: BrandLogo | BrandLogoResource) -> set[int]:
+    """The `id()` of every model in `logo`, cached on `logo`."""
+    ids = logo._cache.get("model_ids")
+    if ids is None:
+        ids = {id(logo)}
+        recurse_dicts_and_models(
+            logo,
+            pred=lambda value: isinstance(value, BaseModel),
+            modify=lambda value: ids.add(id(value)) or True,
+        )
+        logo._cache["model_ids"] = ids
+    return ids
+
+
+def resolve_logo(
+    brand: Brand,
+    name: str,
+    variant: Literal["auto", "light", "dark", "light-dark"] = "auto",
+    *,
+    required: bool | str | None = None,
+    allow_fallback: bool = True,
+    **kwargs: htmltools.TagAttrValue,
 ) -> BrandLogoResource | BrandLogoResourceLightDark | None:
     """
     Extract a logo resource from a brand.
@@ -38,13 +152,30 @@ def use_logo(
     See `Brand.use_logo()` for full documentation.
     """
 
-    if not isinstance(variant, str) or (
-        variant not in {"auto", "light", "dark", "light-dark"}
-    ):
+    if not isinstance(variant, str) or variant not in USE_LOGO_VARIANTS:
         raise ValueError(
             "variant must be one of 'auto', 'light', 'dark', or 'light-dark'."
         )
 
+    logo = brand.logo
+    if logo is None:
+        entry: LogoEntryType = LogoMissing(f"brand.logo.{name}")
+    else:
+        table = logo_resolution_table(logo)
+        key = (name, variant, bool(allow_fallback))
+        if key in table:
+            entry = table[key]
+        else:
+            # Images added to `logo.images` in place aren't in the table
+            entry = resolve_logo_entry(
+                logo, name, variant, bool(allow_fallback)
+            )
+
+    if entry is None:
+        return None
+    if not isinstance(entry, LogoMissing):
+        return logo_attach_attrs(entry, kwargs)
+
     if required is True:
         required_reason = ""
     elif required is False:
@@ -58,16 +189,72 @@ def use_logo(
         else:
             required_reason = ""
 
-    if brand.logo is None:
-        return raise_if_required(f"brand.logo.{name}", required_reason)
+    return raise_if_required(entry.prefix, required_reason)
+
+
+class LogoMissing(NamedTuple):
+    """A logo that can't be found, described by `prefix` in error messages."""
+
+    prefix: str
+
+
+LogoEntryType = Union[
+    BrandLogoResource, BrandLogoResourceLightDark, LogoMissing, None
+]
+
+
+def logo_resolution_table(
+    logo: BrandLogo | BrandLogoResource,
+) -> dict[tuple[str, str, bool], LogoEntryType]:
+    """
+    Resolve every logo that `use_logo()` can return for `logo`, once.
+
+    The table maps each `(name, variant, allow_fallback)` combination, for
+    every size, `"smallest"`, `"largest"` and image name, to the result of
+    `resolve_logo_entry()`. It's cached on `logo` and dropped when `logo` or a
+    model it contains is modified. Light/dark wrappers created for the table
+    are frozen, since they're shared between calls.
+    """
+    table = logo._cache.get("resolution_table")
+    if table is not None:
+        return table
+
+    names = [*USE_LOGO_SIZES]
+    if isinstance(logo, BrandLogo) and logo.images:
+        names.extend(n for n in logo.images if n not in USE_LOGO_SIZES)
+
+    table = {}
+    owned = logo_model_ids(logo)
+    for name in names:
+        for variant in USE_LOGO_VARIANTS:
+            for allow_fallback in (True, False):
+                entry = resolve_logo_entry(logo, name, variant, allow_fallback)
+                if isinstance(entry, BaseModel) and id(entry) not in owned:
+                    freeze_model(entry, skip=owned)
+                table[(name, variant, allow_fallback)] = entry
+
+    logo._cache["resolution_table"] = table
+    return table
+
+
+def resolve_logo_entry(
+    logo: BrandLogo | BrandLogoResource,
+    name: str,
+    variant: str,
+    allow_fallback: bool,
+) -> LogoEntryType:
+    """
+    Find the logo resource for `name` and `variant` in `logo`.
+
+    Walks the decision table below to find the resource, without attaching
+    attributes. Returns `LogoMissing` if the logo isn't available.
+    """
 
-    if isinstance(brand.logo, BrandLogoResource):
+    if isinstance(logo, BrandLogoResource):
         if name in {"small", "medium", "large", "smallest", "largest"}:
-            return logo_attach_attrs(brand.logo, kwargs)
+            return logo
         else:
-            return raise_if_required(
-                f"brand.logo.images['{name}']", required_reason
-            )
+            return LogoMissing(f"brand.logo.images['{name}']")
 
     # Handle "smallest" and "largest" convenience options
     if name in {"smallest", "largest"}:
@@ -75,51 +262,39 @@ def use_logo(
         available = []
 
         # Check what sizes are available in the logo
-        if isinstance(brand.logo, BrandLogo):
+        if isinstance(logo, BrandLogo):
             for size in sizes:
-                if getattr(brand.logo, size, None) is not None:
+                if getattr(logo, size, None) is not None:
                     available.append(size)
 
         # Also check in images
-        if (
-            isinstance(brand.logo, BrandLogo)
-            and brand.logo.images
-            and name in brand.logo.images
-        ):
+        if isinstance(logo, BrandLogo) and logo.images and name in logo.images:
             # If name exists in images, use it directly
-            resource = brand.logo.images[name]
-            return logo_attach_attrs(resource, kwargs)
+            resource = logo.images[name]
+            return resource
 
         if not available:
-            return raise_if_required(
-                "A 'small', 'medium' or 'large' logo", required_reason
-            )
+            return LogoMissing("A 'small', 'medium' or 'large' logo")
 
         name = available[0] if name == "smallest" else available[-1]
 
     # Check if name exists in images
-    if (
-        isinstance(brand.logo, BrandLogo)
-        and brand.logo.images
-        and name in brand.logo.images
-    ):
-        resource = brand.logo.images[name]
-        return logo_attach_attrs(resource, kwargs)
+    if isinstance(logo, BrandLogo) and logo.images and name in logo.images:
+        resource = logo.images[name]
+        return resource
 
     # Check if name is a standard size
     if name not in {"small", "medium", "large"}:
-        return raise_if_required(
-            f"brand.logo.images['{name}']", required_reason
-        )
+        return LogoMissing(f"brand.logo.images['{name}']")
 
     # Handle standard sizes (small, medium, large)
-    if not isinstance(brand.logo, BrandLogo):
+    if not isinstance(logo, BrandLogo):
         # logo is a single BrandLogoResource, not a BrandLogo with sizes
-        return raise_if_required(f"brand.logo.{name}", required_reason)
+        return LogoMissing(f"brand.logo.{name}")
 
-    size_logo = getattr(brand.logo, name, None)
+    size_logo = getattr(logo, name, None)
     if size_logo is None:
-        return raise_if_required(f"brand.logo.{name}", required_reason)
+        return LogoMissing(f"brand.logo.{name}")
 
     has_light_dark = isinstance(
         size_logo, (BrandLightDark, BrandLogoResourceLightDark)
@@ -147,7 +322,7 @@ def use_logo(
         if isinstance(size_logo, BrandLogoResource):
             # Case A.1: Return single value as-is
             # size_logo must be BrandLogoResource here since has_light_dark is False
-            return logo_attach_attrs(size_logo, kwargs)
+            return size_logo
 
         # size_logo must be BrandLogoResourceLightDark here since has_light_dark is True
         light_dark_logo = cast(BrandLogoResourceLightDark, size_logo)
@@ -156,38 +331,31 @@ def use_logo(
             and light_dark_logo.dark is not None
         ):
             # Case A.2: Return light_dark if both variants exist
-            return logo_attach_attrs(light_dark_logo, kwargs)
+            return light_dark_logo
 
         if light_dark_logo.light is not None:
             # Case A.3: Return light if only light exists
-            return logo_attach_attrs(light_dark_logo.light, kwargs)
+            return light_dark_logo.light
 
         if light_dark_logo.dark is not None:
             # Case A.4: Return dark if only dark exists
-            return logo_attach_attrs(light_dark_logo.dark, kwargs)
+            return light_dark_logo.dark
 
     elif variant == "light-dark":
         if has_light_dark:
             # Case B.1: Return light_dark if both variants exist
-            return logo_attach_attrs(
-                cast(BrandLogoResourceLightDark, size_logo), kwargs
-            )
+            return cast(BrandLogoResourceLightDark, size_logo)
 
         if allow_fallback:
             # Case B.2: Promote single to light_dark if fallback allowed
             # At this point we know size_logo is a single BrandLogoResource
             single_resource = cast(BrandLogoResource, size_logo)
-            return logo_attach_attrs(
-                BrandLogoResourceLightDark(
-                    light=single_resource, dark=single_resource
-                ),
-                kwargs,
+            return BrandLogoResourceLightDark(
+                light=single_resource, dark=single_resource
             )
 
         # Case B.3: No fallback allowed, error or return NULL
-        return raise_if_required(
-            f"brand.logo.{name} with light/dark variants", required_reason
-        )
+        return LogoMissing(f"brand.logo.{name} with light/dark variants")
 
     else:  # variant is "light" or "dark"
         if has_light_dark:
@@ -195,18 +363,14 @@ def use_logo(
             light_dark_logo = cast(BrandLogoResourceLightDark, size_logo)
             variant_resource = getattr(light_dark_logo, variant, None)
             if variant_resource is not None:
-                return logo_attach_attrs(variant_resource, kwargs)
+                return variant_resource
         else:
             # Case D: return single if fallback allowed
             if allow_fallback:
-                return logo_attach_attrs(
-                    cast(BrandLogoResource, size_logo), kwargs
-                )
+                return cast(BrandLogoResource, size_logo)
 
         # Case X: specific variant doesn't exist and can't fallback
-        return raise_if_required(
-            f"brand.logo.{name}.{variant}", required_reason
-        )
+        return LogoMissing(f"brand.logo.{name}.{variant}")
 
 
 @overload
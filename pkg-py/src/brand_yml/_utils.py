@@ -3,13 +3,31 @@ from __future__ import annotations
 import os
 import re
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, Iterable, List, Literal, Union
 
 from pydantic import BaseModel
 
+from ._instrument import instrumented
+
 rgx_css_value_unit = re.compile(r"^(-?\d*\.?\d+)\s*([a-zA-Z%]*)$")
 
+CssLengthUnit = Literal["rem", "em", "px", "pt"]
+"""The units that CSS lengths can be converted to by `convert_css_length()`."""
+
+# The size of each CSS length unit in `px`, for a root font size of `16px`
+css_length_px: dict[str, float] = {
+    "rem": 16,
+    "em": 16,
+    "%": 16 / 100,
+    "px": 1,
+    "pt": 16 / 12,
+    "in": 96,  # 96 px/inch
+    "cm": 96 / 2.54,  # inch -> cm
+    "mm": 96 / 25.4,  # cm -> mm
+}
+
 
 def envvar_brand_yml_path() -> Path | None:
     """
@@ -56,6 +74,7 @@ def find_project_file(
     )
 
 
+@instrumented("find_project_brand_yml")
 def find_project_brand_yml(path: Path | str) -> Path:
     """
     Find a project's `_brand.yml` file
@@ -235,33 +254,44 @@ def maybe_convert_font_size_to_rem(x: str) -> str:
     6. `4.234cm` is `1rem`.
     7. `42.3mm` is `1rem`.
     """
-    x_og = f"{x}"
+    return convert_css_length(x, "rem")
+
+
+@lru_cache(maxsize=1024)
+def convert_css_length(x: str, to: CssLengthUnit = "rem") -> str:
+    """
+    Convert a CSS length to `rem`, `em`, `px` or `pt` units.
 
+    Lengths are converted using the scales in `css_length_px`, assuming a root
+    font size of `16px`. Lengths in `em` and `rem` are treated alike, e.g.
+    `1.5em` becomes `1.5rem`, and lengths already in the target unit are
+    returned unchanged. Converted values are rounded to 4 decimal places.
+    Results are cached, so converting the same length again is cheap.
+    """
     value, unit = split_css_value_and_unit(x)
 
-    if unit == "rem":
+    if unit == to:
         return x
 
-    if unit == "em":
-        return f"{value}rem"
-
-    scale = {
-        "%": 100,
-        "px": 16,
-        "pt": 12,
-        "in": 16 / 96,  # 96 px/inch
-        "cm": 16 / 96 * 2.54,  # inch -> cm
-        "mm": 16 / 96 * 25.4,  # cm -> mm
-    }
-
-    if unit in scale:
-        ret = f"{float(value) / scale[unit]:.4f}rem".replace(".0000", "")
-        ret = re.sub("[.]?0+rem", "rem", ret)
-        return ret
-
-    raise ValueError(
-        f"Could not convert font size {x_og!r} from {unit} units to a relative unit."
-    )
+    if unit in ("em", "rem") and to in ("em", "rem"):
+        return f"{value}{to}"
+
+    if unit not in css_length_px or to not in css_length_px:
+        raise ValueError(
+            f"Could not convert font size {x!r} from {unit} units to {to} units."
+        )
+
+    converted = float(value) * css_length_px[unit] / css_length_px[to]
+    number = f"{converted:.4f}".rstrip("0").rstrip(".")
+    return f"{'0' if number == '-0' else number}{to}"
+
+
+def convert_css_lengths(
+    values: Iterable[str],
+    to: CssLengthUnit = "rem",
+) -> list[str]:
+    """Convert many CSS lengths to the same unit, see `convert_css_length()`."""
+    return [convert_css_length(x, to) for x in values]
 
 
 def split_css_value_and_unit(x: str) -> tuple[str, str]:
@@ -0,0 +1,370 @@
+"""
+Color parsing and color math.
+
+Colors are parsed from CSS color strings into tuples of `(red, green, blue,
+alpha)` floats between 0 and 1. The functions in this module operate on these
+tuples; `brand_yml.color.BrandColorArray` applies them across a whole palette.
+"""
+
+from __future__ import annotations
+
+import colorsys
+import math
+import re
+from functools import lru_cache
+from typing import Tuple
+
+RGBA = Tuple[float, float, float, float]
+"""A color as red, green, blue and alpha channels, each between 0 and 1."""
+
+Triple = Tuple[float, float, float]
+
+# https://developer.mozilla.org/en-US/docs/Web/CSS/named-color
+css_named_colors: dict[str, str] = {
+    "aliceblue": "#f0f8ff",
+    "antiquewhite": "#faebd7",
+    "aqua": "#00ffff",
+    "aquamarine": "#7fffd4",
+    "azure": "#f0ffff",
+    "beige": "#f5f5dc",
+    "bisque": "#ffe4c4",
+    "black": "#000000",
+    "blanchedalmond": "#ffebcd",
+    "blue": "#0000ff",
+    "blueviolet": "#8a2be2",
+    "brown": "#a52a2a",
+    "burlywood": "#deb887",
+    "cadetblue": "#5f9ea0",
+    "chartreuse": "#7fff00",
+    "chocolate": "#d2691e",
+    "coral": "#ff7f50",
+    "cornflowerblue": "#6495ed",
+    "cornsilk": "#fff8dc",
+    "crimson": "#dc143c",
+    "cyan": "#00ffff",
+    "darkblue": "#00008b",
+    "darkcyan": "#008b8b",
+    "darkgoldenrod": "#b8860b",
+    "darkgray": "#a9a9a9",
+    "darkgreen": "#006400",
+    "darkgrey": "#a9a9a9",
+    "darkkhaki": "#bdb76b",
+    "darkmagenta": "#8b008b",
+    "darkolivegreen": "#556b2f",
+    "darkorange": "#ff8c00",
+    "darkorchid": "#9932cc",
+    "darkred": "#8b0000",
+    "darksalmon": "#e9967a",
+    "darkseagreen": "#8fbc8f",
+    "darkslateblue": "#483d8b",
+    "darkslategray": "#2f4f4f",
+    "darkslategrey": "#2f4f4f",
+    "darkturquoise": "#00ced1",
+    "darkviolet": "#9400d3",
+    "deeppink": "#ff1493",
+    "deepskyblue": "#00bfff",
+    "dimgray": "#696969",
+    "dimgrey": "#696969",
+    "dodgerblue": "#1e90ff",
+    "firebrick": "#b22222",
+    "floralwhite": "#fffaf0",
+    "forestgreen": "#228b22",
+    "fuchsia": "#ff00ff",
+    "gainsboro": "#dcdcdc",
+    "ghostwhite": "#f8f8ff",
+    "gold": "#ffd700",
+    "goldenrod": "#daa520",
+    "gray": "#808080",
+    "green": "#008000",
+    "greenyellow": "#adff2f",
+    "grey": "#808080",
+    "honeydew": "#f0fff0",
+    "hotpink": "#ff69b4",
+    "indianred": "#cd5c5c",
+    "indigo": "#4b0082",
+    "ivory": "#fffff0",
+    "khaki": "#f0e68c",
+    "lavender": "#e6e6fa",
+    "lavenderblush": "#fff0f5",
+    "lawngreen": "#7cfc00",
+    "lemonchiffon": "#fffacd",
+    "lightblue": "#add8e6",
+    "lightcoral": "#f08080",
+    "lightcyan": "#e0ffff",
+    "lightgoldenrodyellow": "#fafad2",
+    "lightgray": "#d3d3d3",
+    "lightgreen": "#90ee90",
+    "lightgrey": "#d3d3d3",
+    "lightpink": "#ffb6c1",
+    "lightsalmon": "#ffa07a",
+    "lightseagreen": "#20b2aa",
+    "lightskyblue": "#87cefa",
+    "lightslategray": "#778899",
+    "lightslategrey": "#778899",
+    "lightsteelblue": "#b0c4de",
+    "lightyellow": "#ffffe0",
+    "lime": "#00ff00",
+    "limegreen": "#32cd32",
+    "linen": "#faf0e6",
+    "magenta": "#ff00ff",
+    "maroon": "#800000",
+    "mediumaquamarine": "#66cdaa",
+    "mediumblue": "#0000cd",
+    "mediumorchid": "#ba55d3",
+    "mediumpurple": "#9370db",
+    "mediumseagreen": "#3cb371",
+    "mediumslateblue": "#7b68ee",
+    "mediumspringgreen": "#00fa9a",
+    "mediumturquoise": "#48d1cc",
+    "mediumvioletred": "#c71585",
+    "midnightblue": "#191970",
+    "mintcream": "#f5fffa",
+    "mistyrose": "#ffe4e1",
+    "moccasin": "#ffe4b5",
+    "navajowhite": "#ffdead",
+    "navy": "#000080",
+    "oldlace": "#fdf5e6",
+    "olive": "#808000",
+    "olivedrab": "#6b8e23",
+    "orange": "#ffa500",
+    "orangered": "#ff4500",
+    "orchid": "#da70d6",
+    "palegoldenrod": "#eee8aa",
+    "palegreen": "#98fb98",
+    "paleturquoise": "#afeeee",
+    "palevioletred": "#db7093",
+    "papayawhip": "#ffefd5",
+    "peachpuff": "#ffdab9",
+    "peru": "#cd853f",
+    "pink": "#ffc0cb",
+    "plum": "#dda0dd",
+    "powderblue": "#b0e0e6",
+    "purple": "#800080",
+    "rebeccapurple": "#663399",
+    "red": "#ff0000",
+    "rosybrown": "#bc8f8f",
+    "royalblue": "#4169e1",
+    "saddlebrown": "#8b4513",
+    "salmon": "#fa8072",
+    "sandybrown": "#f4a460",
+    "seagreen": "#2e8b57",
+    "seashell": "#fff5ee",
+    "sienna": "#a0522d",
+    "silver": "#c0c0c0",
+    "skyblue": "#87ceeb",
+    "slateblue": "#6a5acd",
+    "slategray": "#708090",
+    "slategrey": "#708090",
+    "snow": "#fffafa",
+    "springgreen": "#00ff7f",
+    "steelblue": "#4682b4",
+    "tan": "#d2b48c",
+    "teal": "#008080",
+    "thistle": "#d8bfd8",
+    "tomato": "#ff6347",
+    "turquoise": "#40e0d0",
+    "violet": "#ee82ee",
+    "wheat": "#f5deb3",
+    "white": "#ffffff",
+    "whitesmoke": "#f5f5f5",
+    "yellow": "#ffff00",
+    "yellowgreen": "#9acd32",
+    "transparent": "#00000000",
+}
+
+css_hue_units = {"deg": 360, "grad": 400, "rad": 2 * math.pi, "turn": 1}
+
+rgx_hex_color = re.compile(r"^#([0-9a-f]{3,4}|[0-9a-f]{6}|[0-9a-f]{8})$")
+rgx_color_function = re.compile(r"^(rgba?|hsla?)\((.*)\)$")
+rgx_color_args = re.compile(r"\s*[,/]\s*|\s+")
+
+
+class BrandColorParseError(ValueError):
+    def __init__(self, value: str):
+        super().__init__(
+            f"Could not parse color {value!r}. Expected a hex color, "
+            "`rgb()`, `rgba()`, `hsl()`, `hsla()` or a CSS named color."
+        )
+
+
+def _clamp(x: float) -> float:
+    return min(1.0, max(0.0, x))
+
+
+def _parse_channel(x: str, scale: float) -> float:
+    if x.endswith("%"):
+        return _clamp(float(x[:-1]) / 100)
+    return _clamp(float(x) / scale)
+
+
+def _parse_hue(x: str) -> float:
+    for unit, scale in css_hue_units.items():
+        if x.endswith(unit):
+            return (float(x[: -len(unit)]) / scale) % 1
+    return (float(x) / 360) % 1
+
+
+@lru_cache(maxsize=1024)
+def parse_color(value: str) -> RGBA:
+    """
+    Parse a CSS color string.
+
+    Supports hex colors (`#rgb`, `#rgba`, `#rrggbb`, `#rrggbbaa`), `rgb()`,
+    `rgba()`, `hsl()` and `hsla()` in both the legacy comma-separated and the
+    modern space-separated syntax, and CSS named colors.
+
+    Parameters
+    ----------
+    value
+        A CSS color string.
+
+    Returns
+    -------
+    :
+        The color as a `(red, green, blue, alpha)` tuple of floats between 0
+        and 1.
+
+    Raises
+    ------
+    BrandColorParseError
+        If `value` isn't a supported color format.
+    """
+    x = value.strip().lower()
+    x = css_named_colors.get(x, x)
+
+    if rgx_hex_color.match(x):
+        x = x[1:]
+        if len(x) <= 4:
+            x = "".join(c * 2 for c in x)
+        channels = [int(x[i : i + 2], 16) / 255 for i in range(0, len(x), 2)]
+        if len(channels) == 3:
+            channels.append(1.0)
+        return (channels[0], channels[1], channels[2], channels[3])
+
+    match = rgx_color_function.match(x)
+    if not match:
+        raise BrandColorParseError(value)
+
+    fn, args_str = match.groups()
+    args = [a for a in rgx_color_args.split(args_str.strip()) if a]
+    if len(args) not in (3, 4):
+        raise BrandColorParseError(value)
+
+    try:
+        alpha = _parse_channel(args[3], 1) if len(args) == 4 else 1.0
+        if fn.startswith("rgb"):
+            r, g, b = (_parse_channel(a, 255) for a in args[:3])
+        else:
+            h = _parse_hue(args[0])
+            s = _parse_channel(args[1], 100)
+            light = _parse_channel(args[2], 100)
+            r, g, b = colorsys.hls_to_rgb(h, light, s)
+    except ValueError:
+        raise BrandColorParseError(value)
+
+    return (r, g, b, alpha)
+
+
+def to_hex(color: RGBA) -> str:
+    """Format a color as `#rrggbb`, or `#rrggbbaa` if it isn't opaque."""
+    channels = [round(_clamp(c) * 255) for c in color]
+    if channels[3] == 255:
+        channels = channels[:3]
+    return "#" + "".join(f"{c:02x}" for c in channels)
+
+
+def srgb_to_linear(c: float) -> float:
+    if c <= 0.04045:
+        return c / 12.92
+    return ((c + 0.055) / 1.055) ** 2.4
+
+
+def linear_to_srgb(c: float) -> float:
+    if c <= 0.0031308:
+        return c * 12.92
+    return 1.055 * c ** (1 / 2.4) - 0.055
+
+
+def relative_luminance(color: RGBA) -> float:
+    """
+    Relative luminance of a color, as defined by WCAG 2.
+
+    The alpha channel is ignored.
+    """
+    r, g, b = (srgb_to_linear(c) for c in color[:3])
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def contrast_ratio_luminance(lum_x: float, lum_y: float) -> float:
+    """WCAG 2 contrast ratio from the relative luminance of two colors."""
+    if lum_x < lum_y:
+        lum_x, lum_y = lum_y, lum_x
+    return (lum_x + 0.05) / (lum_y + 0.05)
+
+
+def contrast_ratio(x: RGBA, y: RGBA) -> float:
+    """WCAG 2 contrast ratio of two colors, between 1 and 21."""
+    return contrast_ratio_luminance(
+        relative_luminance(x), relative_luminance(y)
+    )
+
+
+def mix(x: RGBA, y: RGBA, ratio: float = 0.5) -> RGBA:
+    """
+    Mix two colors in sRGB space.
+
+    A `ratio` of 0 returns `x`, 1 returns `y`, and values in between blend
+    the two colors, including their alpha channels.
+    """
+    return (
+        x[0] + (y[0] - x[0]) * ratio,
+        x[1] + (y[1] - x[1]) * ratio,
+        x[2] + (y[2] - x[2]) * ratio,
+        x[3] + (y[3] - x[3]) * ratio,
+    )
+
+
+def rgb_to_hsl(color: RGBA) -> Triple:
+    """Convert a color to hue (degrees), saturation and lightness (0 to 1)."""
+    h, light, s = colorsys.rgb_to_hls(*color[:3])
+    return (h * 360, s, light)
+
+
+def rgb_to_oklab(color: RGBA) -> Triple:
+    """
+    Convert a color to [OKLab](https://bottosson.github.io/posts/oklab/).
+
+    Returns the perceptual lightness `L` (0 to 1) and the `a` (green-red) and
+    `b` (blue-yellow) axes.
+    """
+    r, g, b = (srgb_to_linear(c) for c in color[:3])
+
+    lms = (
+        0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b,
+        0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b,
+        0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b,
+    )
+    l_, m_, s_ = (c ** (1 / 3) for c in lms)
+
+    return (
+        0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_,
+        1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_,
+        0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_,
+    )
+
+
+def oklab_to_rgb(lab: Triple, alpha: float = 1.0) -> RGBA:
+    """Convert an OKLab color to sRGB, clamping to the sRGB gamut."""
+    L, a, b = lab
+    l_ = L + 0.3963377774 * a + 0.2158037573 * b
+    m_ = L - 0.1055613458 * a - 0.0638541728 * b
+    s_ = L - 0.0894841775 * a - 1.2914855480 * b
+    lc, mc, sc = l_**3, m_**3, s_**3
+
+    rgb = (
+        +4.0767416621 * lc - 3.3077115913 * mc + 0.2309699292 * sc,
+        -1.2684380046 * lc + 2.6097574011 * mc - 0.3413193965 * sc,
+        -0.0041960863 * lc - 0.7034186147 * mc + 1.7076147010 * sc,
+    )
+    r, g, b = (_clamp(linear_to_srgb(_clamp(c))) for c in rgb)
+    return (r, g, b, alpha)
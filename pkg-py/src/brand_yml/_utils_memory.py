@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sys
+from types import FunctionType, ModuleType
+from typing import Any
+
+from pydantic import BaseModel
+
+_model_slots = (
+    "__dict__",
+    "__pydantic_fields_set__",
+    "__pydantic_extra__",
+    "__pydantic_private__",
+)
+
+_skip_types = (type, ModuleType, FunctionType)
+
+
+def deep_sizeof(obj: Any, seen: set[int] | None = None) -> int:
+    """
+    Estimate the memory used by `obj` and everything it references, in bytes.
+
+    Containers, pydantic models and objects with `__dict__` or `__slots__` are
+    followed; classes, modules and functions are not. Objects are counted once,
+    even if they're referenced more than once. Pass the same `seen` set to
+    several calls to avoid counting objects shared between them twice.
+    """
+    seen = set() if seen is None else seen
+    size = 0
+    stack = [obj]
+
+    while stack:
+        x = stack.pop()
+        if id(x) in seen or isinstance(x, _skip_types):
+            continue
+        seen.add(id(x))
+        size += sys.getsizeof(x)
+
+        if isinstance(x, (str, bytes, int, float, bool)) or x is None:
+            continue
+        if isinstance(x, dict):
+            stack.extend(x.keys())
+            stack.extend(x.values())
+        elif isinstance(x, (list, tuple, set, frozenset)):
+            stack.extend(x)
+        elif isinstance(x, BaseModel):
+            for attr in _model_slots:
+                value = getattr(x, attr, None)
+                if value is not None:
+                    stack.append(value)
+        else:
+            if hasattr(x, "__dict__"):
+                stack.append(x.__dict__)
+            for cls in type(x).__mro__:
+                slots = cls.__dict__.get("__slots__", ())
+                if isinstance(slots, str):
+                    slots = (slots,)
+                for slot in slots:
+                    if slot in ("__dict__", "__weakref__"):
+                        continue
+                    try:
+                        stack.append(getattr(x, slot))
+                    except AttributeError:
+                        pass
+
+    return size
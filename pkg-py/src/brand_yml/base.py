@@ -4,23 +4,350 @@ Base Pydantic model for Brand-related classes.
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+import hashlib
+import json
+import threading
+import weakref
+from copy import deepcopy
+from functools import partial
+from typing import Any, Container, NoReturn
 
+from pydantic import BaseModel, PrivateAttr, ValidationError
 
-class BrandBase(BaseModel):
+_frozen_models: weakref.WeakValueDictionary[int, BaseModel] = (
+    weakref.WeakValueDictionary()
+)
+"""Models frozen by `freeze_model()`, keyed by `id()`."""
+
+
+def is_frozen(model: object) -> bool:
+    """Whether `model` has been frozen by `freeze_model()`."""
+    return _frozen_models.get(id(model)) is model
+
+
+def freeze_model(
+    model: BaseModel,
+    skip: Container[int] = (),
+) -> BaseModel:
+    """
+    Freeze `model` and every model, dictionary and list it contains, in place.
+
+    Field assignment is blocked on frozen models that inherit from
+    `FreezableModel`, and dictionaries and lists are replaced with
+    `FrozenDict` and `FrozenList`. Use a deep copy of a model if the original
+    should stay mutable. Models whose `id()` is in `skip` are left as they are.
+    """
+
+    def freeze(value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            if not is_frozen(value) and id(value) not in skip:
+                for key, item in value.__dict__.items():
+                    value.__dict__[key] = freeze(item)
+                _frozen_models[id(value)] = value
+            return value
+        if isinstance(value, dict) and not isinstance(value, BrandCache):
+            return FrozenDict({k: freeze(v) for k, v in value.items()})
+        if isinstance(value, list):
+            return FrozenList(freeze(v) for v in value)
+        return value
+
+    return freeze(model)
+
+
+def _raise_frozen(model: BaseModel, name: str, value: Any) -> NoReturn:
+    raise ValidationError.from_exception_data(
+        model.__class__.__name__,
+        [{"type": "frozen_instance", "loc": (name,), "input": value}],
+    )
+
+
+def _raise_immutable(self: object, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(f"{type(self).__name__!r} object is immutable")
+
+
+class FrozenDict(dict):
+    """
+    A read-only dictionary used in frozen brand models.
+
+    Copies of a `FrozenDict` are regular, mutable dictionaries.
+    """
+
+    __setitem__ = __delitem__ = __ior__ = _raise_immutable
+    clear = pop = popitem = setdefault = update = _raise_immutable
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(tuple(self.items()))
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> dict:
+        return {k: deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    """
+    A read-only list used in frozen brand models.
+
+    Copies of a `FrozenList` are regular, mutable lists.
+    """
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _raise_immutable
+    append = extend = insert = pop = remove = _raise_immutable
+    clear = sort = reverse = _raise_immutable
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(tuple(self))
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> list:
+        return [deepcopy(v, memo) for v in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+class ModelParents:
+    """
+    Links brand models to the models that contain them.
+
+    Values derived from a tree of models, e.g. fingerprints or CSS, are cached
+    on the model at the top of the tree. Assigning a field of any model in the
+    tree clears the caches of the models above it, see `invalidate_parents()`.
+    Models are linked to their parents by `link_model_tree()` when the cache of
+    a parent is first used. Entries are dropped when a child model is garbage
+    collected.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._parents: dict[
+            int, tuple[weakref.ref[BaseModel], list[weakref.ref[BaseModel]]]
+        ] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._parents)
+
+    def link(self, child: BaseModel, parent: BaseModel) -> None:
+        key = id(child)
+        with self._lock:
+            entry = self._parents.get(key)
+            if entry is None or entry[0]() is not child:
+                entry = (weakref.ref(child, partial(self._drop, key)), [])
+                self._parents[key] = entry
+            if not any(ref() is parent for ref in entry[1]):
+                entry[1].append(weakref.ref(parent))
+
+    def get(self, child: BaseModel) -> list[BaseModel]:
+        entry = self._parents.get(id(child))
+        if entry is None or entry[0]() is not child:
+            return []
+        parents = (ref() for ref in list(entry[1]))
+        return [parent for parent in parents if parent is not None]
+
+    def _drop(self, key: int, ref: weakref.ref[BaseModel]) -> None:
+        with self._lock:
+            entry = self._parents.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._parents[key]
+
+
+_model_parents = ModelParents()
+
+
+def iter_child_models(value: Any):
+    """Yield the models held in `value`, looking into dictionaries and lists."""
+    if isinstance(value, BaseModel):
+        yield value
+    elif isinstance(value, dict) and not isinstance(value, BrandCache):
+        for item in value.values():
+            yield from iter_child_models(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from iter_child_models(item)
+
+
+def link_model_tree(model: BaseModel) -> None:
+    """
+    Link every model below `model` to the model that contains it.
+
+    Brand models whose cache is already linked have linked their own children,
+    so the walk stops there.
+    """
+    stack = [model]
+    while stack:
+        parent = stack.pop()
+        for child in iter_child_models(list(parent.__dict__.values())):
+            _model_parents.link(child, parent)
+            cache = (child.__pydantic_private__ or {}).get("_brand_cache")
+            if cache is None:
+                stack.append(child)
+            elif not cache.linked:
+                cache.linked = True
+                stack.append(child)
+
+
+def invalidate_parents(model: BaseModel) -> None:
+    """Clear the caches of every brand model that contains `model`."""
+    if not _model_parents:
+        return
+
+    seen: set[int] = set()
+    stack = [model]
+    while stack:
+        for parent in _model_parents.get(stack.pop()):
+            if id(parent) in seen:
+                continue
+            seen.add(id(parent))
+            if isinstance(parent, BrandBase):
+                parent._cache_clear()
+            stack.append(parent)
+
+
+class FreezableModel:
+    """
+    A mixin for pydantic models that blocks field assignment once frozen.
+
+    See `freeze_model()`. Assignments also clear the caches of the brand models
+    that contain the model, see `invalidate_parents()`. In-place changes to
+    dictionaries and lists held by a model are not tracked.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if _frozen_models and is_frozen(self):
+            _raise_frozen(self, name, value)  # type: ignore[arg-type]
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            invalidate_parents(self)  # type: ignore[arg-type]
+
+    def __delattr__(self, name: str) -> None:
+        if _frozen_models and is_frozen(self):
+            _raise_frozen(self, name, None)  # type: ignore[arg-type]
+        super().__delattr__(name)
+        if not name.startswith("_"):
+            invalidate_parents(self)  # type: ignore[arg-type]
+
+
+class BrandCache(dict):
+    """
+    Per-instance storage for values derived from a brand model.
+
+    The cache is ignored when comparing models for equality and is never
+    shared between copies of a model, so cached values can't leak into a copy
+    that is later modified.
+
+    `linked` records whether the models below the owner of the cache have been
+    linked to it by `link_model_tree()`. Clearing the cache resets it, since
+    the models may have been replaced.
+    """
+
+    linked: bool = False
+
+    def clear(self) -> None:
+        self.linked = False
+        super().clear()
+
+    def __reduce__(self):
+        return (BrandCache, ())
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, BrandCache)
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __copy__(self) -> BrandCache:
+        return BrandCache()
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> BrandCache:
+        return BrandCache()
+
+
+class BrandBase(FreezableModel, BaseModel):
     """
     A base model for brand-related data.
 
     This class inherits from Pydantic's BaseModel and provides a basic structure
-    that can be extended with additional fields as needed. Currently, its
-    primary purpose is to standardize the printed format of brand classes.
+    that can be extended with additional fields as needed. Its primary purposes
+    are to standardize the printed format of brand classes and to provide a
+    per-instance cache for derived values that is cleared whenever a field of
+    the instance, or of a model it contains, is assigned.
     """
 
+    _brand_cache: BrandCache = PrivateAttr(default_factory=BrandCache)
+
+    @property
+    def _cache(self) -> BrandCache:
+        # Read the private attribute directly: pydantic's `__getattr__` is
+        # slow enough to dominate cached lookups.
+        cache = self.__pydantic_private__["_brand_cache"]  # type: ignore[index]
+        if not cache.linked:
+            cache.linked = True
+            link_model_tree(self)
+        return cache
+
+    def __copy__(self):
+        m = super().__copy__()
+        if m.__pydantic_private__ is not None:
+            m.__pydantic_private__["_brand_cache"] = BrandCache()
+        return m
+
     def __repr_args__(self):
         """
         Automatically exclude arguments whose values are `None` from the
         representation string.
         """
-        fields = [f for f in self.model_fields.keys()]
+        fields = [f for f in self.__class__.model_fields.keys()]
         values = [getattr(self, f) for f in fields]
         return ((f, v) for f, v in zip(fields, values) if v is not None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.__class__.model_fields:
+            self._cache_clear()
+
+    def __hash__(self) -> int:
+        if not is_frozen(self):
+            raise TypeError(
+                f"unhashable type: {type(self).__name__!r}. "
+                "Use `.freeze()` on the brand for a hashable snapshot."
+            )
+        return int(self.content_hash()[:16], 16)
+
+    def content_hash(self) -> str:
+        """
+        A stable hash of the content of this model.
+
+        The hash is a SHA-256 hex digest of the model's data, serialized as
+        JSON with sorted keys. For frozen models, the hash is computed once.
+        """
+        cached = self._cache.get("content_hash")
+        if cached is not None:
+            return cached
+
+        data = json.dumps(
+            self._content_data(),
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        digest = hashlib.sha256(data.encode("utf-8")).hexdigest()
+        if is_frozen(self):
+            self._cache["content_hash"] = digest
+        return digest
+
+    def _content_data(self) -> Any:
+        return self.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+    def _cache_clear(self) -> None:
+        """Drop all values cached on this instance."""
+        private = self.__pydantic_private__
+        if private is not None and "_brand_cache" in private:
+            private["_brand_cache"].clear()
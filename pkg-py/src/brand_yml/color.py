@@ -9,7 +9,16 @@ from __future__ import annotations
 
 import re
 from copy import deepcopy
-from typing import Literal, Optional
+from typing import (
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
 
 from pydantic import (
     ConfigDict,
@@ -18,11 +27,38 @@ from pydantic import (
 )
 
 from ._defs import check_circular_references, defs_replace_recursively
+from ._utils_color import (
+    RGBA,
+    Triple,
+    contrast_ratio_luminance,
+    mix,
+    parse_color,
+    relative_luminance,
+    rgb_to_hsl,
+    rgb_to_oklab,
+    to_hex,
+)
 from ._utils_docs import add_example_yaml
-from .base import BrandBase
+from .base import BrandBase, FrozenDict
 
 rgx_valid_sass_name = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_-]*$")
 
+ColorType = Union[str, RGBA]
+"""A CSS color string or a parsed `(red, green, blue, alpha)` tuple."""
+
+BrandColorIncludeType = Literal["all", "theme", "palette"]
+
+WcagLevelType = Literal["AA", "AAA", "AA-large", "AAA-large"]
+
+# https://www.w3.org/WAI/WCAG22/Understanding/contrast-minimum.html
+wcag_contrast_thresholds: dict[str, float] = {
+    "AA": 4.5,
+    "AAA": 7.0,
+    "AA-large": 3.0,
+    "AAA-large": 4.5,
+}
+"""Minimum WCAG 2 contrast ratios for normal and large text."""
+
 
 @add_example_yaml(
     {
@@ -247,7 +283,7 @@ class BrandColor(BrandBase):
 
     def to_dict(
         self,
-        include: Literal["all", "theme", "palette"] = "all",
+        include: BrandColorIncludeType = "all",
     ) -> dict[str, str]:
         """
         Returns a flat dictionary of color definitions.
@@ -290,3 +326,722 @@ class BrandColor(BrandBase):
             exclude="palette",
         )
         return self
+
+    def to_array(
+        self,
+        include: BrandColorIncludeType = "all",
+    ) -> BrandColorArray:
+        """
+        Parse the brand's colors for use in color calculations.
+
+        The colors from [`.to_dict()`](`brand_yml.BrandColor.to_dict`) are
+        parsed once into a
+        [`BrandColorArray`](`brand_yml.color.BrandColorArray`). The result is
+        cached and re-used until a field of `brand.color` is assigned a new
+        value. (Changes made in-place to the `palette` dictionary are not
+        detected, assign a new palette instead.)
+
+        Parameters
+        ----------
+        include
+            Which colors to include: all brand colors (`"all"`), the brand's
+            theme colors (`"theme"`) or the brand's color palette (`"palette"`).
+
+        Returns
+        -------
+        :
+            A [`BrandColorArray`](`brand_yml.color.BrandColorArray`) of the
+            brand's colors.
+
+        Raises
+        ------
+        ValueError
+            If any of the colors can't be parsed.
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        color:
+          palette:
+            blue: "#447099"
+            orange: "#EE6331"
+          foreground: "#151515"
+          background: white
+          primary: blue
+        \"\"\")
+
+        colors = brand.color.to_array()
+        colors.contrast("background")
+        ```
+        """
+        key = ("array", include)
+        if key not in self._cache:
+            self._cache[key] = BrandColorArray(self.to_dict(include))
+        return self._cache[key]
+
+    def scale(self, name: str, steps: int = 9) -> dict[str, str]:
+        """
+        A tint and shade scale for a brand color.
+
+        Creates a scale from light to dark for a theme or palette color, keyed
+        by `"100"`, `"200"`, and so on. With the default 9 steps, the scale
+        follows Bootstrap's conventions: `"500"` is the brand color, `"100"` to
+        `"400"` are mixed with 80% to 20% white and `"600"` to `"900"` are mixed
+        with 20% to 80% black.
+
+        Scales are computed for all brand colors at once (see `.scales()`) and
+        cached until a field of `brand.color`, such as `palette`, is assigned a
+        new value.
+
+        Parameters
+        ----------
+        name
+            The name of a theme color or a color in `color.palette`.
+        steps
+            The number of colors in the scale.
+
+        Returns
+        -------
+        :
+            A read-only dictionary of hex colors, from lightest to darkest. Use
+            `dict()` for a copy that can be modified.
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        color:
+          palette:
+            blue: "#447099"
+          primary: blue
+        \"\"\")
+
+        brand.color.scale("primary")
+        ```
+        """
+        scales = self.scales(steps, include="all")
+        if name not in scales:
+            raise ValueError(
+                f"`{name}` is not a theme color or a color in `color.palette`."
+            )
+        return scales[name]
+
+    def scales(
+        self,
+        steps: int = 9,
+        include: BrandColorIncludeType = "all",
+    ) -> dict[str, dict[str, str]]:
+        """
+        Tint and shade scales for all brand colors.
+
+        Computes the scales described in `.scale()` for many colors at once.
+        The result is cached until a field of `brand.color` is assigned a new
+        value.
+
+        Parameters
+        ----------
+        steps
+            The number of colors in each scale.
+        include
+            Which colors to include: all brand colors (`"all"`), the theme
+            colors (`"theme"`) or the palette (`"palette"`).
+
+        Returns
+        -------
+        :
+            A read-only dictionary with a scale for each color. Each scale is
+            a read-only dictionary of hex colors keyed by `"100"`, `"200"`, etc.
+            Copies of the dictionaries, e.g. with `dict()`, can be modified.
+
+        Examples
+        --------
+
+        Scales can be turned into CSS custom properties:
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        color:
+          primary: "#447099"
+          secondary: "#707073"
+        \"\"\")
+
+        print("\\n".join(
+            f"--brand-{name}-{step}: {value};"
+            for name, scale in brand.color.scales(steps=5).items()
+            for step, value in scale.items()
+        ))
+        ```
+        """
+        key = ("scales", steps, include)
+        if key not in self._cache:
+            labels = [str((i + 1) * 100) for i in range(steps)]
+            # Read-only, since the cached scales are shared between calls
+            self._cache[key] = FrozenDict(
+                (name, FrozenDict(zip(labels, ramp)))
+                for name, ramp in self.to_array(include).ramp(steps).items()
+            )
+        return self._cache[key]
+
+    @overload
+    def nearest(
+        self,
+        colors: str | RGBA,
+        include: BrandColorIncludeType = "all",
+    ) -> BrandColorMatch: ...
+
+    @overload
+    def nearest(
+        self,
+        colors: Sequence[ColorType],
+        include: BrandColorIncludeType = "all",
+    ) -> list[BrandColorMatch]: ...
+
+    def nearest(
+        self,
+        colors: ColorType | Sequence[ColorType],
+        include: BrandColorIncludeType = "all",
+    ) -> BrandColorMatch | list[BrandColorMatch]:
+        """
+        Snap colors to the nearest brand color.
+
+        Finds the perceptually nearest brand color, using distances in the
+        OKLab color space. The brand colors are parsed and converted once; the
+        lookup index is re-used until a field of `brand.color` is assigned a
+        new value. Palette colors come first, so when a theme color and a
+        palette color are identical, the palette color's name is returned.
+
+        Parameters
+        ----------
+        colors
+            A CSS color string or a parsed color, i.e. a tuple of RGB(A) values
+            between 0 and 1, or a list of color strings or parsed colors.
+        include
+            Which brand colors can be matched: all brand colors (`"all"`), the
+            theme colors (`"theme"`) or the palette (`"palette"`).
+
+        Returns
+        -------
+        :
+            A [`BrandColorMatch`](`brand_yml.color.BrandColorMatch`) with the
+            `name` of the nearest brand color and its `distance`, or a list of
+            matches if `colors` is a list of colors.
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        color:
+          palette:
+            blue: "#447099"
+            orange: "#EE6331"
+            green: "#72994E"
+        \"\"\")
+
+        brand.color.nearest(["#4682b4", "tomato", "rgb(100, 160, 80)"])
+        ```
+        """
+        return self.to_array(include).nearest(colors)
+
+    def contrast_matrix(
+        self,
+        rows: BrandColorIncludeType = "palette",
+        cols: BrandColorIncludeType = "theme",
+    ) -> BrandColorContrastMatrix:
+        """
+        WCAG contrast ratios of all pairs of brand colors.
+
+        Computes the contrast ratio of every color in `rows` with every color
+        in `cols`, by default the colors in `color.palette` against the theme
+        colors. Colors are parsed and their luminance is computed once per
+        color, and the matrix is cached until a field of `brand.color` is
+        assigned a new value.
+
+        Parameters
+        ----------
+        rows
+            The colors used for the rows of the matrix: all brand colors
+            (`"all"`), the theme colors (`"theme"`) or the palette
+            (`"palette"`).
+        cols
+            The colors used for the columns of the matrix, as in `rows`.
+
+        Returns
+        -------
+        :
+            A [`BrandColorContrastMatrix`](`brand_yml.color.BrandColorContrastMatrix`).
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        color:
+          palette:
+            blue: "#447099"
+            orange: "#EE6331"
+          foreground: "#151515"
+          background: "#FFFFFF"
+        \"\"\")
+
+        contrast = brand.color.contrast_matrix()
+        contrast.to_dict()
+        ```
+
+        ```{python}
+        contrast.below("AA")
+        ```
+        """
+        key = ("contrast_matrix", rows, cols)
+        if key not in self._cache:
+            self._cache[key] = self.to_array(rows).contrast_matrix(
+                self.to_array(cols)
+            )
+        return self._cache[key]
+
+
+class BrandColorArray:
+    """
+    A parsed array of named colors.
+
+    Parses a dictionary of CSS color strings once into `(red, green, blue,
+    alpha)` tuples and applies color calculations across all colors at once.
+    Colors may be given as hex colors (`#rgb`, `#rrggbb`, `#rrggbbaa`),
+    `rgb()`/`rgba()`, `hsl()`/`hsla()` or as CSS named colors.
+
+    Typically created from a brand with
+    [`brand.color.to_array()`](`brand_yml.BrandColor.to_array`).
+
+    Parameters
+    ----------
+    colors
+        A dictionary mapping color names to CSS color strings or parsed
+        `(red, green, blue, alpha)` tuples.
+    """
+
+    __slots__ = ("_index", "_luminance", "_oklab", "names", "values")
+
+    names: tuple[str, ...]
+    """The names of the colors."""
+
+    values: tuple[RGBA, ...]
+    """The parsed colors, as `(red, green, blue, alpha)` floats from 0 to 1."""
+
+    def __init__(self, colors: dict[str, ColorType]):
+        self.names = tuple(colors.keys())
+        self.values = tuple(as_rgba(v) for v in colors.values())
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self._luminance: tuple[float, ...] | None = None
+        self._oklab: tuple[Triple, ...] | None = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __getitem__(self, name: str) -> RGBA:
+        return self.values[self._index[name]]
+
+    def __repr__(self) -> str:
+        return f"BrandColorArray({self.to_hex()!r})"
+
+    def _resolve(self, color: ColorType) -> RGBA:
+        """Resolve a color in this array by name, or parse `color`."""
+        if isinstance(color, str) and color in self._index:
+            return self[color]
+        return as_rgba(color)
+
+    def _map(self, values: Iterable[RGBA]) -> BrandColorArray:
+        return BrandColorArray(dict(zip(self.names, values)))
+
+    def to_hex(self) -> dict[str, str]:
+        """
+        Format the colors as hex colors.
+
+        Returns
+        -------
+        :
+            A dictionary of `#rrggbb` colors (or `#rrggbbaa` for colors that
+            aren't fully opaque).
+        """
+        return {n: to_hex(v) for n, v in zip(self.names, self.values)}
+
+    def to_hsl(self) -> dict[str, Triple]:
+        """
+        Convert the colors to HSL.
+
+        Returns
+        -------
+        :
+            A dictionary of `(hue, saturation, lightness)` tuples, with hue in
+            degrees and saturation and lightness from 0 to 1.
+        """
+        return {n: rgb_to_hsl(v) for n, v in zip(self.names, self.values)}
+
+    def to_oklab(self) -> dict[str, Triple]:
+        """
+        Convert the colors to the perceptual OKLab color space.
+
+        Returns
+        -------
+        :
+            A dictionary of `(L, a, b)` tuples.
+        """
+        return dict(zip(self.names, self._oklab_values()))
+
+    def _oklab_values(self) -> tuple[Triple, ...]:
+        if self._oklab is None:
+            self._oklab = tuple(rgb_to_oklab(v) for v in self.values)
+        return self._oklab
+
+    @overload
+    def nearest(self, colors: str | RGBA) -> BrandColorMatch: ...
+
+    @overload
+    def nearest(self, colors: Sequence[ColorType]) -> list[BrandColorMatch]: ...
+
+    def nearest(
+        self,
+        colors: ColorType | Sequence[ColorType],
+    ) -> BrandColorMatch | list[BrandColorMatch]:
+        """
+        Find the nearest color in this array.
+
+        Distances are measured in the perceptual OKLab color space (i.e. the
+        `ΔE` OK color difference) and ignore alpha channels. The OKLab values of
+        this array are computed once and re-used for every lookup. When two
+        colors are equally near, the first color in the array wins.
+
+        Parameters
+        ----------
+        colors
+            A CSS color string or a parsed color, i.e. a tuple of RGB(A) values
+            between 0 and 1, or a list of color strings or parsed colors.
+
+        Returns
+        -------
+        :
+            A [`BrandColorMatch`](`brand_yml.color.BrandColorMatch`) for a
+            single color or a list of matches, one per item in `colors`.
+        """
+        if len(self) == 0:
+            raise ValueError("Can't find the nearest color in an empty array.")
+
+        if is_single_color(colors):
+            return self._nearest(as_rgba(colors))  # type: ignore[arg-type]
+        return [self._nearest(as_rgba(color)) for color in colors]
+
+    def _nearest(self, color: RGBA) -> BrandColorMatch:
+        L, a, b = rgb_to_oklab(color)
+        best_dist, best_i = min(
+            (
+                (x[0] - L) ** 2 + (x[1] - a) ** 2 + (x[2] - b) ** 2,
+                i,
+            )
+            for i, x in enumerate(self._oklab_values())
+        )
+        return BrandColorMatch(self.names[best_i], best_dist**0.5)
+
+    def luminance(self) -> dict[str, float]:
+        """
+        The WCAG 2 relative luminance of each color.
+
+        Alpha channels are ignored. Luminance values are computed once and
+        cached.
+
+        Returns
+        -------
+        :
+            A dictionary of relative luminance values from 0 (black) to 1
+            (white).
+        """
+        return dict(zip(self.names, self._luminance_values()))
+
+    def _luminance_values(self) -> tuple[float, ...]:
+        if self._luminance is None:
+            self._luminance = tuple(relative_luminance(v) for v in self.values)
+        return self._luminance
+
+    def contrast(self, color: ColorType) -> dict[str, float]:
+        """
+        The WCAG 2 contrast ratio of each color with `color`.
+
+        Parameters
+        ----------
+        color
+            A color name in this array, a CSS color string or a parsed color.
+
+        Returns
+        -------
+        :
+            A dictionary of contrast ratios, from 1 to 21.
+        """
+        lum = relative_luminance(self._resolve(color))
+        return {
+            n: contrast_ratio_luminance(x, lum)
+            for n, x in zip(self.names, self._luminance_values())
+        }
+
+    def contrast_matrix(
+        self,
+        other: BrandColorArray | None = None,
+    ) -> BrandColorContrastMatrix:
+        """
+        The WCAG 2 contrast ratio of each color with each color in `other`.
+
+        Parameters
+        ----------
+        other
+            The colors for the columns of the matrix. Defaults to this array.
+
+        Returns
+        -------
+        :
+            A [`BrandColorContrastMatrix`](`brand_yml.color.BrandColorContrastMatrix`)
+            with a row for each color in this array and a column for each
+            color in `other`.
+        """
+        if other is None:
+            other = self
+
+        lum_cols = other._luminance_values()
+        values = tuple(
+            tuple(contrast_ratio_luminance(x, y) for y in lum_cols)
+            for x in self._luminance_values()
+        )
+        return BrandColorContrastMatrix(
+            self.names,
+            other.names,
+            values,
+            row_colors=self.values,
+            col_colors=other.values,
+        )
+
+    def mix(self, color: ColorType, ratio: float = 0.5) -> BrandColorArray:
+        """
+        Mix each color with `color`.
+
+        Parameters
+        ----------
+        color
+            A color name in this array, a CSS color string or a parsed color.
+        ratio
+            The amount of `color` to mix in: 0 returns the original colors and 1
+            returns `color`.
+
+        Returns
+        -------
+        :
+            A new `BrandColorArray` with the mixed colors.
+        """
+        other = self._resolve(color)
+        return self._map(mix(v, other, ratio) for v in self.values)
+
+    def tint(self, ratio: float) -> BrandColorArray:
+        """Mix each color with white. See `.mix()`."""
+        return self.mix((1.0, 1.0, 1.0, 1.0), ratio)
+
+    def shade(self, ratio: float) -> BrandColorArray:
+        """Mix each color with black. See `.mix()`."""
+        return self.mix((0.0, 0.0, 0.0, 1.0), ratio)
+
+    def ramp(self, steps: int = 9) -> dict[str, list[str]]:
+        """
+        Tint and shade ramps for each color.
+
+        Creates `steps` colors for each color, ordered from lightest to
+        darkest. The lighter half are tints (mixed with white), the darker half
+        are shades (mixed with black) and, for an odd number of steps, the
+        middle step is the original color. Tints and shades are evenly spaced:
+        with the default 9 steps, the colors are mixed with 80%, 60%, 40% and
+        20% white, then 20%, 40%, 60% and 80% black, following the conventions
+        used by Bootstrap's `100` to `900` color scales.
+
+        Parameters
+        ----------
+        steps
+            The number of colors in each ramp.
+
+        Returns
+        -------
+        :
+            A dictionary of lists of hex colors.
+        """
+        if steps < 1:
+            raise ValueError("`steps` must be a positive integer.")
+
+        white = (1.0, 1.0, 1.0, 1.0)
+        black = (0.0, 0.0, 0.0, 1.0)
+        center = (steps - 1) / 2
+        spacing = (steps + 1) / 2
+        ratios = [(i - center) / spacing for i in range(steps)]
+
+        return {
+            n: [
+                to_hex(mix(v, white if r < 0 else black, abs(r)))
+                for r in ratios
+            ]
+            for n, v in zip(self.names, self.values)
+        }
+
+
+class BrandColorMatch(NamedTuple):
+    """The nearest color found by `BrandColorArray.nearest()`."""
+
+    name: str
+    """The name of the nearest color."""
+
+    distance: float
+    """The distance to the nearest color in OKLab (0 is an exact match)."""
+
+
+class BrandColorContrastPair(NamedTuple):
+    """A pair of colors and their WCAG 2 contrast ratio."""
+
+    name: str
+    """The name of the pair, e.g. `"primary/background"`."""
+
+    color: str
+    """The foreground color."""
+
+    background_color: str
+    """The background color."""
+
+    ratio: float
+    """The contrast ratio, from 1 to 21."""
+
+
+class BrandColorContrastMatrix:
+    """
+    WCAG 2 contrast ratios between two sets of named colors.
+
+    Created by
+    [`BrandColor.contrast_matrix()`](`brand_yml.BrandColor.contrast_matrix`).
+
+    Attributes
+    ----------
+    rows
+        The names of the colors in the rows of the matrix.
+    cols
+        The names of the colors in the columns of the matrix.
+    values
+        The contrast ratios, as a tuple of rows, each a tuple with the contrast
+        ratio of the row color with each column color.
+    row_colors
+        The RGBA values of the colors in the rows, if known.
+    col_colors
+        The RGBA values of the colors in the columns, if known.
+    """
+
+    __slots__ = ("col_colors", "cols", "row_colors", "rows", "values")
+
+    def __init__(
+        self,
+        rows: tuple[str, ...],
+        cols: tuple[str, ...],
+        values: tuple[tuple[float, ...], ...],
+        *,
+        row_colors: tuple[RGBA, ...] | None = None,
+        col_colors: tuple[RGBA, ...] | None = None,
+    ):
+        self.rows = rows
+        self.cols = cols
+        self.values = values
+        self.row_colors = row_colors
+        self.col_colors = col_colors
+
+    def __repr__(self) -> str:
+        return (
+            f"BrandColorContrastMatrix(rows={self.rows!r}, cols={self.cols!r})"
+        )
+
+    def __getitem__(self, key: tuple[str, str]) -> float:
+        row, col = key
+        return self.values[self.rows.index(row)][self.cols.index(col)]
+
+    def to_dict(self) -> dict[str, dict[str, float]]:
+        """The contrast ratios as a nested dictionary, by row and column."""
+        return {
+            row: dict(zip(self.cols, values))
+            for row, values in zip(self.rows, self.values)
+        }
+
+    def below(
+        self,
+        level: WcagLevelType | float = "AA",
+    ) -> list[tuple[str, str, float]]:
+        """
+        Pairs of colors with a contrast ratio below a threshold.
+
+        Parameters
+        ----------
+        level
+            A WCAG level -- `"AA"` (4.5), `"AAA"` (7), `"AA-large"` (3) or
+            `"AAA-large"` (4.5) -- or a minimum contrast ratio.
+
+        Returns
+        -------
+        :
+            A list of `(row, col, ratio)` tuples for each pair of colors with
+            a contrast ratio below the threshold. Pairs of a color with itself
+            are not included, nor are pairs of different names for the same
+            color, e.g. `primary` and the palette color it refers to.
+        """
+        threshold = wcag_contrast_threshold(level)
+        row_colors = self.row_colors or (None,) * len(self.rows)
+        col_colors = self.col_colors or (None,) * len(self.cols)
+        return [
+            (row, col, ratio)
+            for row, row_color, values in zip(
+                self.rows, row_colors, self.values
+            )
+            for col, col_color, ratio in zip(self.cols, col_colors, values)
+            if ratio < threshold
+            and row != col
+            and (row_color is None or row_color != col_color)
+        ]
+
+
+def wcag_contrast_threshold(level: WcagLevelType | float) -> float:
+    if isinstance(level, (int, float)):
+        return float(level)
+    if level not in wcag_contrast_thresholds:
+        raise ValueError(
+            f"Unknown WCAG level {level!r}. Expected one of "
+            f"{', '.join(wcag_contrast_thresholds)} or a number."
+        )
+    return wcag_contrast_thresholds[level]
+
+
+def is_single_color(colors: ColorType | Sequence[ColorType]) -> bool:
+    """Whether `colors` is one color, i.e. a string or a tuple of numbers."""
+    if isinstance(colors, str):
+        return True
+    return isinstance(colors, tuple) and all(
+        isinstance(x, (int, float)) for x in colors
+    )
+
+
+def as_rgba(color: ColorType) -> RGBA:
+    if isinstance(color, str):
+        return parse_color(color)
+    if len(color) == 3:
+        return (color[0], color[1], color[2], 1.0)
+    return (color[0], color[1], color[2], color[3])
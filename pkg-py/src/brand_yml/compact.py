@@ -0,0 +1,259 @@
+"""
+Compact, Read-Only Brand Views
+
+This module defines lightweight, immutable views of a brand's resolved colors,
+typography and logos, created by
+[`Brand.compact()`](`brand_yml.Brand.compact`). The views are tuple-backed
+(`NamedTuple`) and share interned strings, so they use a fraction of the memory
+of the equivalent pydantic models and are hashable. Use them when many brands
+are kept in memory and no longer need to be modified or validated.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
+
+from ._defs import BrandLightDark
+from .file import FileLocationLocal
+from .logo import BrandLogo, BrandLogoResource
+
+if TYPE_CHECKING:
+    from . import Brand
+    from .color import BrandColor
+    from .typography import BrandTypography
+
+Pairs = tuple[tuple[str, Any], ...]
+
+
+def _intern(x: Any) -> Any:
+    return sys.intern(x) if isinstance(x, str) else x
+
+
+def _freeze(x: Any) -> Any:
+    """Intern strings and make containers hashable, recursively."""
+    if isinstance(x, str):
+        return sys.intern(x)
+    if isinstance(x, dict):
+        return _pairs(x)
+    if isinstance(x, (list, tuple)):
+        return tuple(_freeze(v) for v in x)
+    if isinstance(x, (set, frozenset)):
+        return frozenset(_freeze(v) for v in x)
+    return x
+
+
+def _pairs(items: dict[str, Any]) -> Pairs:
+    return tuple((sys.intern(k), _freeze(v)) for k, v in items.items())
+
+
+def _get(pairs: Pairs, name: str) -> Any:
+    for key, value in pairs:
+        if key == name:
+            return value
+    return None
+
+
+class BrandCompactColor(NamedTuple):
+    """Resolved brand colors, as `(name, color)` pairs."""
+
+    palette: tuple[tuple[str, str], ...]
+    """The colors in `brand.color.palette`."""
+
+    theme: tuple[tuple[str, str], ...]
+    """The theme colors that are set, e.g. `("primary", "#447099")`."""
+
+    def get(self, name: str) -> str | None:
+        """Get a theme or palette color by name."""
+        return _get(self.theme, name) or _get(self.palette, name)
+
+    def to_dict(self) -> dict[str, str]:
+        """All colors as a dictionary, with theme colors overlaid on the palette."""
+        return {**dict(self.palette), **dict(self.theme)}
+
+    @classmethod
+    def from_color(cls, color: BrandColor) -> BrandCompactColor:
+        return cls(
+            palette=_pairs(color.palette or {}),
+            theme=_pairs(color.to_dict(include="theme")),
+        )
+
+
+class BrandCompactTypography(NamedTuple):
+    """Resolved typography settings, as `(element, options)` pairs."""
+
+    fonts: tuple[tuple[str, str], ...]
+    """The font families in `brand.typography.fonts`, as `(family, source)`."""
+
+    elements: tuple[tuple[str, Pairs], ...]
+    """
+    The options for each element that is set, e.g. `base` or `headings`, as
+    `(option, value)` pairs using the option names in `_brand.yml`. Lists of
+    values, e.g. `style: [normal, italic]`, are stored as tuples.
+    """
+
+    def get(self, element: str) -> dict[str, Any] | None:
+        """Get the options for a typography element, e.g. `"headings"`."""
+        options = _get(self.elements, element)
+        return None if options is None else dict(options)
+
+    @classmethod
+    def from_typography(
+        cls,
+        typography: BrandTypography,
+    ) -> BrandCompactTypography:
+        data = typography.model_dump(by_alias=True, exclude_none=True)
+        fonts = tuple(
+            (sys.intern(font.family), sys.intern(font.source))
+            for font in typography.fonts
+        )
+        elements = tuple(
+            (sys.intern(name), _pairs(options))
+            for name, options in data.items()
+            if name != "fonts" and isinstance(options, dict)
+        )
+        return cls(fonts=fonts, elements=elements)
+
+
+class BrandCompactLogoResource(NamedTuple):
+    """A logo image."""
+
+    path: str
+    """The path to the image, as written in `_brand.yml`, or its URL."""
+
+    absolute_path: Optional[str]
+    """The absolute path to a local image, or `None` for URLs."""
+
+    alt: Optional[str]
+    """Alternative text for the image."""
+
+    attrs: Pairs = ()
+    """
+    Additional HTML attributes, as `(name, value)` pairs. Lists are stored as
+    tuples and dictionaries as `(key, value)` pairs.
+    """
+
+    @classmethod
+    def from_resource(
+        cls,
+        resource: BrandLogoResource,
+    ) -> BrandCompactLogoResource:
+        path = resource.path
+        absolute = (
+            str(path.absolute())
+            if isinstance(path, FileLocationLocal)
+            else None
+        )
+        return cls(
+            path=sys.intern(str(path)),
+            absolute_path=absolute,
+            alt=_intern(resource.alt),
+            attrs=_pairs(resource.attrs or {}),
+        )
+
+
+class BrandCompactLogoLightDark(NamedTuple):
+    """A logo with light and dark variants."""
+
+    light: Optional[BrandCompactLogoResource]
+    dark: Optional[BrandCompactLogoResource]
+
+
+BrandCompactLogoFile = Union[
+    BrandCompactLogoResource, BrandCompactLogoLightDark
+]
+
+
+def _compact_logo_file(
+    value: BrandLogoResource | BrandLightDark[BrandLogoResource] | None,
+    seen: dict[int, BrandCompactLogoResource],
+) -> BrandCompactLogoFile | None:
+    if value is None:
+        return None
+    if isinstance(value, BrandLightDark):
+        return BrandCompactLogoLightDark(
+            light=_compact_logo_file(value.light, seen),  # type: ignore[arg-type]
+            dark=_compact_logo_file(value.dark, seen),  # type: ignore[arg-type]
+        )
+    if id(value) not in seen:
+        seen[id(value)] = BrandCompactLogoResource.from_resource(value)
+    return seen[id(value)]
+
+
+class BrandCompactLogo(NamedTuple):
+    """Brand logos, with named `images` and `small`, `medium` and `large` sizes."""
+
+    images: tuple[tuple[str, BrandCompactLogoResource], ...]
+    small: Optional[BrandCompactLogoFile] = None
+    medium: Optional[BrandCompactLogoFile] = None
+    large: Optional[BrandCompactLogoFile] = None
+
+    def get(self, name: str) -> BrandCompactLogoFile | None:
+        """Get a logo by size (`"small"`, etc.) or by name from `images`."""
+        if name in ("small", "medium", "large"):
+            return getattr(self, name)
+        return _get(self.images, name)
+
+    @classmethod
+    def from_logo(cls, logo: BrandLogo) -> BrandCompactLogo:
+        seen: dict[int, BrandCompactLogoResource] = {}
+        images = tuple(
+            (sys.intern(name), _compact_logo_file(image, seen))
+            for name, image in (logo.images or {}).items()
+        )
+        return cls(
+            images=images,  # type: ignore[arg-type]
+            small=_compact_logo_file(logo.small, seen),
+            medium=_compact_logo_file(logo.medium, seen),
+            large=_compact_logo_file(logo.large, seen),
+        )
+
+
+class BrandCompact(NamedTuple):
+    """
+    A compact, read-only view of a brand.
+
+    Created by [`Brand.compact()`](`brand_yml.Brand.compact`).
+    """
+
+    name: Optional[str]
+    """The brand's full name, from `brand.meta.name.full`."""
+
+    color: Optional[BrandCompactColor]
+    """The brand's resolved colors."""
+
+    typography: Optional[BrandCompactTypography]
+    """The brand's resolved typography settings."""
+
+    logo: Union[BrandCompactLogo, BrandCompactLogoResource, None]
+    """The brand's logos."""
+
+    path: Optional[str] = None
+    """The path to the brand's source file."""
+
+    @classmethod
+    def from_brand(cls, brand: Brand) -> BrandCompact:
+        meta = brand.meta
+        name = meta.name.full if meta is not None and meta.name else None
+
+        logo: BrandCompactLogo | BrandCompactLogoResource | None = None
+        if isinstance(brand.logo, BrandLogo):
+            logo = BrandCompactLogo.from_logo(brand.logo)
+        elif isinstance(brand.logo, BrandLogoResource):
+            logo = BrandCompactLogoResource.from_resource(brand.logo)
+
+        return cls(
+            name=_intern(name),
+            color=(
+                BrandCompactColor.from_color(brand.color)
+                if brand.color is not None
+                else None
+            ),
+            typography=(
+                BrandCompactTypography.from_typography(brand.typography)
+                if brand.typography is not None
+                else None
+            ),
+            logo=logo,
+            path=None if brand.path is None else str(brand.path),
+        )
@@ -6,8 +6,10 @@ from typing import Any, Union
 
 from pydantic import HttpUrl, RootModel, field_validator
 
+from .base import FreezableModel
 
-class FileLocation(RootModel):
+
+class FileLocation(FreezableModel, RootModel):
     """
     The base class for a file location, either a local or an online file.
 
@@ -11,7 +11,7 @@ import base64
 import mimetypes
 import warnings
 from pathlib import Path
-from typing import Annotated, Any, Literal, Union
+from typing import Annotated, Any, Callable, Literal, Union
 
 import htmltools
 from pydantic import (
@@ -24,11 +24,37 @@ from pydantic import (
 )
 
 from ._defs import BrandLightDark, defs_replace_recursively
+from ._fingerprint import file_stat
 from ._html_deps import html_dep_brand_light_dark
+from ._image_info import ImageInfo, image_info
+from ._instrument import instrumented
+from ._logo_assets import logo_asset_name
+from ._svg import svg_data_uri_cache, svg_minify_enabled
 from ._utils_docs import add_example_yaml
 from .base import BrandBase
 from .file import FileLocation, FileLocationLocal, FileLocationLocalOrUrlType
 
+LOGO_RENDER_CACHE_SIZE = 64
+"""The maximum number of rendered HTML or markdown strings cached per logo."""
+
+
+def attrs_key(attrs: dict[str, Any] | None) -> tuple[Any, ...] | None:
+    """A hashable version of `attrs`, or `None` if a value isn't hashable."""
+
+    def freeze(value: Any) -> Any:
+        if isinstance(value, (list, tuple)):
+            return tuple(freeze(v) for v in value)
+        if isinstance(value, dict):
+            return tuple((k, freeze(v)) for k, v in value.items())
+        return value
+
+    key = freeze(attrs or {})
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
 
 class BrandLogoResource(BrandBase):
     """A logo resource, a file with optional alternative text"""
@@ -52,12 +78,22 @@ class BrandLogoResource(BrandBase):
     Values should be compatible with htmltools.TagAttrValue types when using HTML output.
     """
 
-    def to_html(self, **kwargs: Any) -> htmltools.Tag:
+    def to_html(
+        self,
+        *,
+        assets_url: str | None = None,
+        **kwargs: Any,
+    ) -> htmltools.Tag:
         """
         Generate HTML img tag for the logo resource.
 
         Parameters
         ----------
+        assets_url
+            The URL of the directory with the logo files written by
+            [`Brand.logos_write_assets()`](`brand_yml.Brand.logos_write_assets`).
+            If set, local images are linked to their copy in this directory
+            rather than embedded as data URIs.
         **kwargs
             Additional HTML attributes to include in the img tag. Values should be
             compatible with htmltools.TagAttrValue types.
@@ -67,33 +103,43 @@ class BrandLogoResource(BrandBase):
         :
             HTML img tag as a string.
         """
-        # Get image source, handling base64 encoding for local files if needed
-        if isinstance(self.path, FileLocationLocal):
-            img_src = self._maybe_base64_encode_image(self.path)
-        else:
-            img_src = str(self.path)
-
         attrs, _ = htmltools.consolidate_attrs(self.attrs, kwargs)
 
         # Set src and alt on attrs to ensure they aren't overridden
-        attrs["src"] = img_src
+        attrs["src"] = self._img_src(assets_url=assets_url)
         if self.alt:
             attrs["alt"] = self.alt
         elif not attrs.get("alt"):
             attrs["alt"] = ""
 
+        # Use the intrinsic size of local images to reserve space for the logo
+        if "width" not in attrs and "height" not in attrs:
+            info = self._image_info()
+            if info is not None:
+                attrs.update(info.html_size())
+
         return htmltools.tags.img(
             {"class": "brand-logo"},
             attrs,
             html_dep_brand_light_dark(),
         )
 
-    def to_markdown(self, **kwargs: Any) -> str:
+    def to_markdown(
+        self,
+        *,
+        assets_url: str | None = None,
+        **kwargs: Any,
+    ) -> str:
         """
         Generate markdown image syntax for the logo resource.
 
         Parameters
         ----------
+        assets_url
+            The URL of the directory with the logo files written by
+            [`Brand.logos_write_assets()`](`brand_yml.Brand.logos_write_assets`).
+            If set, local images are linked to their copy in this directory
+            rather than embedded as data URIs.
         **kwargs
             Additional attributes to include in the markdown image syntax.
 
@@ -102,12 +148,18 @@ class BrandLogoResource(BrandBase):
         :
             Markdown image syntax as a string.
         """
-        # Get image source, handling base64 encoding for local files if needed
-        if isinstance(self.path, FileLocationLocal):
-            img_src = self._maybe_base64_encode_image(self.path)
-        else:
-            img_src = str(self.path)
+        return self._rendered(
+            ("markdown", assets_url),
+            kwargs,
+            lambda: self._render_markdown(kwargs, assets_url),
+            self,
+        )
 
+    def _render_markdown(
+        self,
+        kwargs: dict[str, Any],
+        assets_url: str | None = None,
+    ) -> str:
         all_attrs, _ = htmltools.consolidate_attrs(
             {"alt": self.alt or "", "class": "brand-logo"},
             self.attrs,
@@ -115,9 +167,16 @@ class BrandLogoResource(BrandBase):
         )
         attrs_str = self._attrs_as_markdown(all_attrs)
 
+        img_src = self._img_src(markdown=True, assets_url=assets_url)
         return f"![]({img_src}){{{attrs_str}}}"
 
-    def to_str(self, format_type: str = "html", **kwargs: Any) -> str:
+    def to_str(
+        self,
+        format_type: str = "html",
+        *,
+        assets_url: str | None = None,
+        **kwargs: Any,
+    ) -> str:
         """
         Convert logo resource to string representation.
 
@@ -125,6 +184,11 @@ class BrandLogoResource(BrandBase):
         ----------
         format_type
             Output format, either "html" or "markdown".
+        assets_url
+            The URL of the directory with the logo files written by
+            [`Brand.logos_write_assets()`](`brand_yml.Brand.logos_write_assets`).
+            If set, local images are linked to their copy in this directory
+            rather than embedded as data URIs.
         **kwargs
             Additional attributes for the output format.
 
@@ -134,9 +198,14 @@ class BrandLogoResource(BrandBase):
             String representation in the specified format.
         """
         if format_type == "html":
-            return str(self.to_html(**kwargs))
+            return self._rendered(
+                ("html", assets_url),
+                kwargs,
+                lambda: str(self.to_html(assets_url=assets_url, **kwargs)),
+                self,
+            )
         elif format_type == "markdown":
-            return self.to_markdown(**kwargs)
+            return self.to_markdown(assets_url=assets_url, **kwargs)
         else:
             raise ValueError("format_type must be 'html' or 'markdown'")
 
@@ -153,20 +222,144 @@ class BrandLogoResource(BrandBase):
 
     def _repr_html_(self) -> str:
         """Jupyter notebook HTML representation."""
-        return str(self.to_html())
+        return self.to_str("html")
 
     def __str__(self) -> str:
         """String representation defaults to markdown."""
         return self.to_markdown()
 
-    def _maybe_base64_encode_image(self, path: FileLocationLocal) -> str:
+    def _file_key(self) -> tuple[str, tuple[int, int] | None, bool] | None:
+        """
+        The absolute path, modification time and size of a local image, and
+        whether SVGs are minified.
+        """
+        if not isinstance(self.path, FileLocationLocal):
+            return None
+        path = self.path.absolute()
+        return (str(path), file_stat(path), svg_minify_enabled())
+
+    def _render_key(self) -> tuple[Any, ...] | None:
+        """
+        Identifies what this resource renders to, or `None` if its `attrs`
+        aren't hashable: its path, alt text and attributes, and the
+        modification time and size of a local image.
+        """
+        attrs = attrs_key(self.attrs)
+        if attrs is None:
+            return None
+        return (str(self.path), self.alt, attrs, self._file_key())
+
+    def _rendered(
+        self,
+        kind: tuple[str, str | None],
+        kwargs: dict[str, Any],
+        render: Callable[[], str],
+        *resources: BrandLogoResource | None,
+    ) -> str:
+        """
+        Render with `render()`, or reuse the string cached for `kind` (the
+        output format and `assets_url`) and `kwargs`.
+
+        The key includes `resources`, the resources being rendered, e.g. this
+        resource or both variants of a light/dark logo, so cached strings are
+        reused while a local image's modification time and size are
+        unchanged. Nothing is cached if `kwargs` or any `attrs` aren't
+        hashable.
+        """
+        keys = [attrs_key(kwargs)]
+        keys.extend(() if x is None else x._render_key() for x in resources)
+        if any(k is None for k in keys):
+            return render()
+
+        key = (kind, *keys)
+        cache: dict[Any, str] = self._cache.setdefault("rendered", {})
+        value = cache.get(key)
+        if value is None:
+            value = render()
+            if len(cache) >= LOGO_RENDER_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = value
+        return value
+
+    def _image_info(self) -> ImageInfo | None:
+        """The intrinsic size and MIME type of a local image."""
+        if not isinstance(self.path, FileLocationLocal):
+            return None
+        return image_info(self.path.absolute())
+
+    def asset_name(self) -> str | None:
+        """
+        The content-hashed file name of a local logo image.
+
+        This is the name of the image's copy written by
+        [`Brand.logos_write_assets()`](`brand_yml.Brand.logos_write_assets`),
+        e.g. `logo-3f2a9c1d7b4e.svg`.
+
+        Returns
+        -------
+        :
+            The file name, or `None` if the logo is a URL or the file doesn't
+            exist.
+        """
+        if not isinstance(self.path, FileLocationLocal):
+            return None
+        return logo_asset_name(self.path.absolute())
+
+    def _img_src(
+        self,
+        *,
+        markdown: bool = False,
+        assets_url: str | None = None,
+    ) -> str:
+        """
+        The image source: a URL, or a data URI for a local image that is
+        re-encoded only when the file's modification time or size changes.
+        """
+        if not isinstance(self.path, FileLocationLocal):
+            return str(self.path)
+
+        if assets_url is not None:
+            asset_name = self.asset_name()
+            if asset_name is not None:
+                return f"{assets_url.rstrip('/')}/{asset_name}"
+
+        file_key = self._file_key()
+        cache_key = ("img_src", markdown)
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+
+        img_src = self._maybe_base64_encode_image(
+            self.path,
+            markdown=markdown,
+            minify=svg_minify_enabled(),
+        )
+        if img_src.startswith("data:"):
+            self._cache[cache_key] = (file_key, img_src)
+        return img_src
+
+    @instrumented("BrandLogoResource._maybe_base64_encode_image")
+    def _maybe_base64_encode_image(
+        self,
+        path: FileLocationLocal,
+        *,
+        markdown: bool = False,
+        minify: bool = False,
+    ) -> str:
         """
         Encode local images as base64 data URIs for embedding.
 
+        SVG images are URL-encoded rather than base64 encoded if that is
+        shorter.
+
         Parameters
         ----------
         path
             The image file path.
+        markdown
+            Whether the data URI is used in markdown rather than HTML.
+        minify
+            Whether SVG images are minified before they are encoded.
 
         Returns
         -------
@@ -177,11 +370,18 @@ class BrandLogoResource(BrandBase):
             return str(path.relative())
 
         try:
+            info = image_info(path.absolute())
             mime_type = (
-                mimetypes.guess_type(path.absolute())[0]
+                (info.mime_type if info is not None else None)
+                or mimetypes.guess_type(path.absolute())[0]
                 or "application/octet-stream"
             )
 
+            if mime_type == "image/svg+xml":
+                return svg_data_uri_cache.get(
+                    path.absolute(), markdown=markdown, minify=minify
+                )
+
             with open(path.absolute(), "rb") as f:
                 encoded = base64.b64encode(f.read()).decode("ascii")
 
@@ -233,7 +433,12 @@ class BrandLogoResourceLightDark(BrandLightDark[BrandLogoResource]):
     def __repr__(self) -> str:
         return super().__repr__()
 
-    def to_html(self, **kwargs: Any) -> htmltools.Tag:
+    def to_html(
+        self,
+        *,
+        assets_url: str | None = None,
+        **kwargs: Any,
+    ) -> htmltools.Tag:
         """
         Generate HTML for light/dark logo resources.
 
@@ -242,6 +447,11 @@ class BrandLogoResourceLightDark(BrandLightDark[BrandLogoResource]):
 
         Parameters
         ----------
+        assets_url
+            The URL of the directory with the logo files written by
+            [`Brand.logos_write_assets()`](`brand_yml.Brand.logos_write_assets`).
+            If set, local images are linked to their copy in this directory
+            rather than embedded as data URIs.
         **kwargs
             Additional HTML attributes for the images.
 
@@ -253,12 +463,12 @@ class BrandLogoResourceLightDark(BrandLightDark[BrandLogoResource]):
         children = []
 
         if self.light:
-            light_tag = self.light.to_html(**kwargs)
+            light_tag = self.light.to_html(assets_url=assets_url, **kwargs)
             light_tag.add_class("light-content")
             children.append(light_tag)
 
         if self.dark:
-            dark_tag = self.dark.to_html(**kwargs)
+            dark_tag = self.dark.to_html(assets_url=assets_url, **kwargs)
             dark_tag.add_class("dark-content")
             children.append(dark_tag)
 
@@ -270,7 +480,12 @@ class BrandLogoResourceLightDark(BrandLightDark[BrandLogoResource]):
 
         return span_tag
 
-    def to_markdown(self, **kwargs: Any) -> str:
+    def to_markdown(
+        self,
+        *,
+        assets_url: str | None = None,
+        **kwargs: Any,
+    ) -> str:
         """
         Generate markdown for light/dark logo resources.
 
@@ -278,6 +493,11 @@ class BrandLogoResourceLightDark(BrandLightDark[BrandLogoResource]):
 
         Parameters
         ----------
+        assets_url
+            The URL of the directory with the logo files written by
+            [`Brand.logos_write_assets()`](`brand_yml.Brand.logos_write_assets`).
+            If set, local images are linked to their copy in this directory
+            rather than embedded as data URIs.
         **kwargs
             Additional attributes for the markdown images.
 
@@ -286,6 +506,17 @@ class BrandLogoResourceLightDark(BrandLightDark[BrandLogoResource]):
         :
             Markdown with both light and dark images.
         """
+        return self._rendered(
+            ("light-dark-markdown", assets_url),
+            kwargs,
+            lambda: self._render_markdown(kwargs, assets_url),
+        )
+
+    def _render_markdown(
+        self,
+        kwargs: dict[str, Any],
+        assets_url: str | None = None,
+    ) -> str:
         light_md = ""
         dark_md = ""
 
@@ -294,18 +525,28 @@ class BrandLogoResourceLightDark(BrandLightDark[BrandLogoResource]):
                 {"class": "light-content"},
                 kwargs,
             )
-            light_md = self.light.to_markdown(**light_class_attrs)
+            light_md = self.light.to_markdown(
+                assets_url=assets_url, **light_class_attrs
+            )
 
         if self.dark:
             dark_class_attrs, _ = htmltools.consolidate_attrs(
                 {"class": "dark-content"},
                 kwargs,
             )
-            dark_md = self.dark.to_markdown(**dark_class_attrs)
+            dark_md = self.dark.to_markdown(
+                assets_url=assets_url, **dark_class_attrs
+            )
 
         return f"{light_md} {dark_md}".strip()
 
-    def to_str(self, format_type: str = "html", **kwargs: Any) -> str:
+    def to_str(
+        self,
+        format_type: str = "html",
+        *,
+        assets_url: str | None = None,
+        **kwargs: Any,
+    ) -> str:
         """
         Convert light/dark logo resources to string representation.
 
@@ -313,6 +554,11 @@ class BrandLogoResourceLightDark(BrandLightDark[BrandLogoResource]):
         ----------
         format_type
             Output format, either "html" or "markdown".
+        assets_url
+            The URL of the directory with the logo files written by
+            [`Brand.logos_write_assets()`](`brand_yml.Brand.logos_write_assets`).
+            If set, local images are linked to their copy in this directory
+            rather than embedded as data URIs.
         **kwargs
             Additional attributes for the output format.
 
@@ -322,9 +568,13 @@ class BrandLogoResourceLightDark(BrandLightDark[BrandLogoResource]):
             String representation in the specified format.
         """
         if format_type == "html":
-            return str(self.to_html(**kwargs))
+            return self._rendered(
+                ("light-dark-html", assets_url),
+                kwargs,
+                lambda: str(self.to_html(assets_url=assets_url, **kwargs)),
+            )
         elif format_type == "markdown":
-            return self.to_markdown(**kwargs)
+            return self.to_markdown(assets_url=assets_url, **kwargs)
         else:
             raise ValueError("format_type must be 'html' or 'markdown'")
 
@@ -341,12 +591,26 @@ class BrandLogoResourceLightDark(BrandLightDark[BrandLogoResource]):
 
     def _repr_html_(self) -> str:
         """Jupyter notebook HTML representation."""
-        return str(self.to_html())
+        return self.to_str("html")
 
     def __str__(self) -> str:
         """String representation defaults to markdown."""
         return self.to_markdown()
 
+    def _rendered(
+        self,
+        kind: tuple[str, str | None],
+        kwargs: dict[str, Any],
+        render: Callable[[], str],
+    ) -> str:
+        # Rendered strings are cached on the light (or dark) resource, keyed
+        # by the content of both variants, so they stay valid when `light` or
+        # `dark` is replaced.
+        resource = self.light or self.dark
+        if resource is None:
+            return render()
+        return resource._rendered(kind, kwargs, render, self.light, self.dark)
+
 
 def brand_logo_type_discriminator(
     x: Any,
@@ -14,24 +14,29 @@ from __future__ import annotations
 
 import itertools
 import os
-import shutil
+import posixpath
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping, Sequence
 from pathlib import Path
+from re import fullmatch as re_fullmatch
 from re import split as re_split
+from re import sub as re_sub
 from textwrap import indent
 from typing import (
     TYPE_CHECKING,
     Annotated,
     Any,
     Literal,
+    NamedTuple,
     TypeVar,
     Union,
     cast,
+    get_args,
     overload,
 )
-from urllib.parse import urlencode, urljoin
+from urllib.parse import quote, urlencode, urljoin
 
-from htmltools import HTMLDependency
+from htmltools import HTMLDependency, TagList, tags
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -42,6 +47,7 @@ from pydantic import (
     PositiveInt,
     RootModel,
     SerializationInfo,
+    SerializerFunctionWrapHandler,
     Tag,
     field_serializer,
     field_validator,
@@ -49,9 +55,20 @@ from pydantic import (
     model_validator,
 )
 
-from ._utils import maybe_convert_font_size_to_rem
+from ._fingerprint import file_stat, local_files
+from ._font_info import FontInfo, font_info
+from ._font_tools import (
+    FontFileCopy,
+    font_tools,
+    parse_unicode_range,
+    require_woff2,
+    write_font_copies,
+)
+from ._instrument import instrumented
+from ._utils import CssLengthUnit, convert_css_length
 from ._utils_docs import BaseDocAttributeModel, add_example_yaml
-from .base import BrandBase
+from ._utils_logging import logger
+from .base import BrandBase, FreezableModel
 from .file import FileLocationLocal, FileLocationLocalOrUrlType
 
 # Types ------------------------------------------------------------------------
@@ -135,6 +152,53 @@ font_formats = {
     ".woff2": "woff2",
 }
 
+# https://www.iana.org/assignments/media-types/media-types.xhtml#font
+font_mime_types = {
+    "opentype": "font/otf",
+    "truetype": "font/ttf",
+    "woff": "font/woff",
+    "woff2": "font/woff2",
+}
+
+# https://fonts.googleapis.com/css2 unicode ranges, by Google Fonts subset name
+FONT_SUBSET_RANGES: dict[str, str] = {
+    "latin": (
+        "U+0000-00FF, U+0131, U+0152-0153, U+02BB-02BC, U+02C6, U+02DA, "
+        "U+02DC, U+0304, U+0308, U+0329, U+2000-206F, U+20AC, U+2122, "
+        "U+2191, U+2193, U+2212, U+2215, U+FEFF, U+FFFD"
+    ),
+    "latin-ext": (
+        "U+0100-02BA, U+02BD-02C5, U+02C7-02CC, U+02CE-02D7, U+02DD-02FF, "
+        "U+0304, U+0308, U+0329, U+1D00-1DBF, U+1E00-1E9F, U+1EF2-1EFF, "
+        "U+2020, U+20A0-20AB, U+20AD-20C0, U+2113, U+2C60-2C7F, U+A720-A7FF"
+    ),
+    "cyrillic": "U+0301, U+0400-045F, U+0490-0491, U+04B0-04B1, U+2116",
+    "cyrillic-ext": (
+        "U+0460-052F, U+1C80-1C8A, U+20B4, U+2DE0-2DFF, U+A640-A69F, "
+        "U+FE2E-FE2F"
+    ),
+    "greek": (
+        "U+0370-0377, U+037A-037F, U+0384-038A, U+038C, U+038E-03A1, "
+        "U+03A3-03FF"
+    ),
+    "greek-ext": "U+1F00-1FFF",
+    "vietnamese": (
+        "U+0102-0103, U+0110-0111, U+0128-0129, U+0168-0169, U+01A0-01A1, "
+        "U+01AF-01B0, U+0300-0301, U+0303-0304, U+0308-0309, U+0323, "
+        "U+0329, U+1EA0-1EF9, U+20AB"
+    ),
+}
+"""
+Named unicode ranges for font subsetting, matching the subsets used by Google
+Fonts.
+"""
+
+FontSubsetType = Union[Sequence[str], Mapping[str, str]]
+"""
+Font subsets, either names from `FONT_SUBSET_RANGES` or a mapping from subset
+names to CSS `unicode-range` values.
+"""
+
 
 # Custom Errors ----------------------------------------------------------------
 
@@ -161,7 +225,13 @@ class BrandUnsupportedFontFileFormat(ValueError):
         )
 
 
+class BrandFontSubsetError(ValueError):
+    """An invalid font subset or unicode range."""
+
+
 # Font Weights -----------------------------------------------------------------
+
+
 @overload
 def validate_font_weight(
     value: Any,
@@ -211,7 +281,7 @@ def validate_font_weight(
 # Fonts (Files) ----------------------------------------------------------------
 
 
-class BrandTypographyFontFileWeight(RootModel):
+class BrandTypographyFontFileWeight(FreezableModel, RootModel):
     root: (
         BrandTypographyFontWeightSimpleAutoType
         | BrandTypographyFontWeightSimplePairedType
@@ -284,7 +354,7 @@ FontSourceType = Union[
 FontSourceDefaultsType = Literal["file", "google", "bunny"]
 
 
-class BrandTypographyFontSource(BaseModel, ABC):
+class BrandTypographyFontSource(BrandBase, ABC):
     """
     A base class representing a font source.
 
@@ -308,6 +378,17 @@ class BrandTypographyFontSource(BaseModel, ABC):
     such as `base`, `headings`, `monospace`, etc.
     """
 
+    @model_serializer(mode="wrap")
+    def _serialize_with_source(
+        self, handler: SerializerFunctionWrapHandler
+    ) -> Any:
+        # `source` selects the font class when the data is read again, so it's
+        # kept even when defaults are excluded, e.g. by `model_dump_yaml()`
+        data = handler(self)
+        if isinstance(data, dict) and "source" not in data:
+            data = {"family": self.family, "source": self.source, **data}
+        return data
+
     @abstractmethod
     def to_css(self) -> str:
         """Create the CSS declarations needed to use the font family."""
@@ -330,6 +411,145 @@ class BrandTypographyFontSystem(BrandTypographyFontSource):
         return ""
 
 
+def resolve_font_subsets(subset: FontSubsetType) -> dict[str, str]:
+    """Resolve `subset` into a mapping from subset names to unicode ranges."""
+    if isinstance(subset, str):
+        subset = [subset]
+    if isinstance(subset, Mapping):
+        ranges = dict(subset)
+    else:
+        unknown = [name for name in subset if name not in FONT_SUBSET_RANGES]
+        if unknown:
+            raise BrandFontSubsetError(
+                f"Unknown font subset(s): {', '.join(map(repr, unknown))}. "
+                + f"Use one of {', '.join(map(repr, FONT_SUBSET_RANGES))} "
+                + "or a dictionary of subset names and unicode ranges."
+            )
+        ranges = {name: FONT_SUBSET_RANGES[name] for name in subset}
+
+    for name, value in ranges.items():
+        if not re_fullmatch(r"[\w-]+", name):
+            raise BrandFontSubsetError(f"Invalid font subset name: {name!r}")
+        try:
+            parse_unicode_range(value)
+        except ValueError as e:
+            raise BrandFontSubsetError(f"Font subset {name!r}: {e}") from e
+    return ranges
+
+
+def log_woff2_savings(copies: Mapping[str, list[FontFileCopy]]) -> None:
+    """Log the bytes saved by the WOFF2 versions of local fonts."""
+    transcoded = [
+        copy
+        for font_copies in copies.values()
+        for copy in font_copies
+        if copy.woff2_size is not None
+    ]
+    if not transcoded:
+        return
+
+    size = sum(copy.size for copy in transcoded)
+    woff2_size = sum(copy.woff2_size or 0 for copy in transcoded)
+    saved = size - woff2_size
+    logger.info(
+        f"WOFF2 fonts: {size:,} bytes -> {woff2_size:,} bytes, "
+        + f"saved {saved:,} bytes ({saved / size:.0%})"
+    )
+
+
+def font_weight_number(value: Any) -> int | None:
+    """The numeric value of a font weight, or `None` for `auto`."""
+    if isinstance(value, int):
+        return value
+    return font_weight_map.get(value)
+
+
+def match_font_file(
+    files: list[BrandTypographyFontFilesPath],
+    weight: int,
+    style: str,
+) -> BrandTypographyFontFilesPath | None:
+    """
+    The font file a browser would use for text with `weight` and `style`: the
+    file of the same style whose weight, or weight range, is closest. Files
+    with an `auto` weight use the weight and style read from the font file, or
+    are treated as `normal` (400) if it can't be read.
+    """
+
+    def distance(file: BrandTypographyFontFilesPath) -> int:
+        low, high = file.weight_range()
+        return max(low - weight, weight - high, 0)
+
+    candidates = [file for file in files if file.font_style() == style]
+    return min(candidates, key=distance, default=None)
+
+
+class BrandTypographyFontFace(NamedTuple):
+    """A single `@font-face` rule."""
+
+    family: str
+    weight: str
+    style: str
+    src: str
+    unicode_range: str | None = None
+
+    def weight_range(self) -> tuple[int, int] | None:
+        """The lowest and highest weight of the face, or `None` for `auto`."""
+        values = [
+            int(v) if v.isdigit() else font_weight_number(v)
+            for v in self.weight.split()
+        ]
+        if not values or None in values:
+            return None
+        return cast(int, min(values)), cast(int, max(values))
+
+    def to_css(self) -> str:
+        lines = [
+            f"font-family: '{self.family}';",
+            f"font-weight: {self.weight};",
+            f"font-style: {self.style};",
+            f"src: {self.src};",
+        ]
+        if self.unicode_range is not None:
+            lines.append(f"unicode-range: {self.unicode_range};")
+        return "\n".join(["@font-face {", indent("\n".join(lines), "  "), "}"])
+
+
+def plan_font_faces(
+    faces: Iterable[BrandTypographyFontFace],
+) -> list[BrandTypographyFontFace]:
+    """
+    Plan the `@font-face` rules for `faces`.
+
+    Identical faces are only kept once, and faces that differ only by their
+    weight, i.e. the same file listed for several weights of a variable font,
+    are merged into one face covering all of the weights, e.g. `font-weight:
+    100 900`. Faces are kept in the order they first appear.
+    """
+    planned: dict[tuple[Any, ...], BrandTypographyFontFace] = {}
+    for face in faces:
+        weights = face.weight_range()
+        key = (
+            face.family,
+            face.style,
+            face.src,
+            face.unicode_range,
+            face.weight if weights is None else None,
+        )
+        prev = planned.get(key)
+        prev_weights = prev.weight_range() if prev is not None else None
+        if prev is None or weights is None or prev_weights is None:
+            planned.setdefault(key, face)
+            continue
+
+        low = min(weights[0], prev_weights[0])
+        high = max(weights[1], prev_weights[1])
+        weight = str(low) if low == high else f"{low} {high}"
+        planned[key] = prev._replace(weight=weight)
+
+    return list(planned.values())
+
+
 class BrandTypographyFontFiles(BrandTypographyFontSource):
     """
     A font family defined by a collection of font files.
@@ -369,24 +589,37 @@ class BrandTypographyFontFiles(BrandTypographyFontSource):
     source: Literal["file"] = Field("file", frozen=True)  # type: ignore[reportIncompatibleVariableOverride]
     files: list[BrandTypographyFontFilesPath] = Field(default_factory=list)
 
-    def to_css(self) -> str:
-        if len(self.files) == 0:
-            return ""
+    def to_css(
+        self,
+        copies: Mapping[str, list[FontFileCopy]] | None = None,
+    ) -> str:
+        faces = plan_font_faces(self.font_faces(copies))
+        return "\n".join(face.to_css() for face in faces)
 
-        return "\n".join(
-            "\n".join(
-                [
-                    "@font-face {",
-                    f"  font-family: '{self.family}';",
-                    indent(font.to_css(), 2 * " "),
-                    "}",
-                ]
-            )
-            for font in self.files
-        )
+    def font_faces(
+        self,
+        copies: Mapping[str, list[FontFileCopy]] | None = None,
+    ) -> list[BrandTypographyFontFace]:
+        """
+        The `@font-face` rules for the font files, one per file, or one per
+        copy of a local file written by `fonts_write_css()`.
+        """
+        faces = []
+        for font in self.files:
+            font_copies = (copies or {}).get(str(font.path.root))
+            if not font_copies:
+                faces.append(font.font_face(self.family))
+                continue
+            for copy in font_copies:
+                faces.append(
+                    font.font_face(
+                        self.family, copy.path, copy.unicode_range, copy.woff2
+                    )
+                )
+        return faces
 
 
-class BrandTypographyFontFilesPath(BaseModel):
+class BrandTypographyFontFilesPath(FreezableModel, BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     path: FileLocationLocalOrUrlType
@@ -396,17 +629,91 @@ class BrandTypographyFontFilesPath(BaseModel):
     )
     style: BrandTypographyFontStyleType = "normal"
 
-    def to_css(self) -> str:
+    def to_css(
+        self,
+        path: str | None = None,
+        unicode_range: str | None = None,
+        woff2: str | None = None,
+    ) -> str:
+        """
+        The descriptors of the `@font-face` rule for this font file.
+
+        Parameters
+        ----------
+        path
+            The URL of the font file, if not `path`, e.g. a subset of the font.
+        unicode_range
+            The `unicode-range` of the characters in the font file, if the file
+            is a subset of the font.
+        woff2
+            The URL of a WOFF2 version of the font file, which is listed first
+            in `src` so that browsers prefer it.
+        """
+        face = self.font_face("", path, unicode_range, woff2)
+        lines = [
+            f"font-weight: {face.weight};",
+            f"font-style: {face.style};",
+            f"src: {face.src};",
+        ]
+        if face.unicode_range is not None:
+            lines.append(f"unicode-range: {face.unicode_range};")
+        return "\n".join(lines)
+
+    def font_face(
+        self,
+        family: str,
+        path: str | None = None,
+        unicode_range: str | None = None,
+        woff2: str | None = None,
+    ) -> BrandTypographyFontFace:
+        """The `@font-face` rule for this font file in `family`, see
+        `.to_css()`."""
         # TODO: Handle `file://` vs `https://` or move to correct location
-        src = f"url('{self.path.root}') format('{self.format}')"
-        return "\n".join(
-            [
-                f"font-weight: {self.weight};",
-                f"font-style: {self.style};",
-                f"src: {src};",
-            ]
+        src = f"url('{path or self.path.root}') format('{self.format}')"
+        if woff2 is not None:
+            src = f"url('{woff2}') format('woff2'), {src}"
+        info = self.font_info()
+        return BrandTypographyFontFace(
+            family=family,
+            weight=info.css_weight() if info is not None else str(self.weight),
+            style=self.font_style(),
+            src=src,
+            unicode_range=unicode_range,
         )
 
+    def font_info(self) -> FontInfo | None:
+        """
+        The weight and style read from a local font file with `weight: auto`.
+
+        Returns `None` for font files with an explicit weight, font files
+        online, or if the file can't be read.
+        """
+        if self.weight.root != "auto":
+            return None
+        if not isinstance(self.path, FileLocationLocal):
+            return None
+        return font_info(self.path.absolute())
+
+    def font_style(self) -> BrandTypographyFontStyleType:
+        """The font style, read from the font file if `style` isn't set."""
+        if "style" not in self.model_fields_set:
+            info = self.font_info()
+            if info is not None and info.style != "oblique":
+                return info.style
+        return self.style
+
+    def weight_range(self) -> tuple[int, int]:
+        """The lowest and highest weight of the font file."""
+        info = self.font_info()
+        if info is not None:
+            return info.weight
+        value = self.weight.root
+        if isinstance(value, tuple):
+            low, high = (font_weight_number(v) or 400 for v in value)
+            return low, high
+        weight = font_weight_number(value) or 400
+        return weight, weight
+
     @field_validator("path", mode="after")
     @classmethod
     def validate_path(
@@ -439,7 +746,7 @@ class BrandTypographyFontFilesPath(BaseModel):
 # Fonts (Google) ---------------------------------------------------------------
 
 
-class BrandTypographyGoogleFontsWeightRange(RootModel):
+class BrandTypographyGoogleFontsWeightRange(FreezableModel, RootModel):
     """
     Represents a range of font weights for Google Fonts.
 
@@ -516,7 +823,7 @@ class BrandTypographyGoogleFontsWeightRange(RootModel):
         ) -> str: ...
 
 
-class BrandTypographyGoogleFontsWeight(RootModel):
+class BrandTypographyGoogleFontsWeight(FreezableModel, RootModel):
     root: (
         BrandTypographyFontWeightSimpleAutoType
         | list[BrandTypographyFontWeightSimpleType]
@@ -643,9 +950,17 @@ class BrandTypographyGoogleFontsApi(BrandTypographyFontSource):
 
     def to_import_url(self) -> str:
         """Returns the URL for the font family to be used in a CSS `@import` statement."""
+        # Changes to nested models like `weight` also clear the cache
+        url = self._cache.get("import_url")
+        if url is not None:
+            return url
+
         if self.version == 1:
-            return self._import_url_v1()
-        return self._import_url_v2()
+            url = self._import_url_v1()
+        else:
+            url = self._import_url_v2()
+        self._cache["import_url"] = url
+        return url
 
     def _import_url_v1(self) -> str:
         weight = self.weight.to_url_list()
@@ -870,8 +1185,8 @@ class BrandTypographyBase(
     (i.e. a font size relative to the root element's font size). Use
     `typography_base_size_unit` in
     [pydantic's serialization context](https://docs.pydantic.dev/2.9/concepts/serialization/#serialization-context)
-    to request the units for the base font size. (Note that currently only
-    `"rem"` is supported.)
+    to request the units for the base font size, one of `"rem"`, `"em"`, `"px"`
+    or `"pt"`.
 
     ```{python}
     from brand_yml import Brand
@@ -913,8 +1228,8 @@ class BrandTypographyBase(
 
         convert_to: str = info.context.get("typography_base_size_unit", "")
         if convert_to:
-            if convert_to == "rem":
-                v = maybe_convert_font_size_to_rem(v)
+            if convert_to in get_args(CssLengthUnit):
+                v = convert_css_length(v, cast(CssLengthUnit, convert_to))
             else:
                 raise ValueError(
                     "brand_yml doesn't support converting `typography.base.size` "
@@ -1264,6 +1579,68 @@ A font family can be one of three different types of resources:
 """
 
 
+# The selectors styled by each typographic element in `BrandTypography.to_css()`
+typography_css_selectors = {
+    "base": "body",
+    "headings": "h1,h2,h3,h4,h5,h6",
+    "monospace": "code,kbd,pre,samp",
+    "monospace_inline": ":not(pre)>code,kbd",
+    "monospace_block": "pre",
+    "link": "a",
+}
+
+# CSS properties of the fields of typographic elements
+typography_css_properties = {
+    "family": "font-family",
+    "weight": "font-weight",
+    "style": "font-style",
+    "size": "font-size",
+    "line_height": "line-height",
+    "color": "color",
+    "background_color": "background-color",
+    "decoration": "text-decoration",
+}
+
+
+def minify_css(css: str) -> str:
+    """Remove comments and whitespace around punctuation from `css`, leaving
+    quoted strings as they are."""
+    css = re_sub(r"(?s)/\*.*?\*/", "", css)
+    return re_sub(
+        r"""('[^']*'|"[^"]*")|\s*;\s*(})\s*|\s*([{}:;,>])\s*""",
+        lambda m: m.group(1) or m.group(2) or m.group(3),
+        css,
+    ).strip()
+
+
+def typography_css_value(element: str, field: str, value: Any) -> str:
+    """
+    The CSS value of a field of a typographic element.
+
+    Every field maps to a CSS property that takes a single value, so a list
+    of values, e.g. `style: [normal, italic]`, is an error rather than being
+    silently reduced to its first item.
+    """
+    if isinstance(value, list):
+        if len(value) != 1:
+            name = f"typography.{element}.{field}".replace("_", "-")
+            prop = typography_css_properties[field]
+            raise ValueError(
+                f"`{name}` must be a single value to be used as `{prop}`, "
+                f"not {value!r}."
+            )
+        value = value[0]
+    if field == "family":
+        family = str(value).replace("\\", "\\\\").replace("'", "\\'")
+        return f"'{family}'"
+    if element == "base" and field == "size":
+        try:
+            return convert_css_length(value, "rem")
+        except ValueError:
+            return value
+    return str(value)
+
+
 @add_example_yaml(
     {
         "path": "brand-typography-minimal.yml",
@@ -1482,6 +1859,96 @@ class BrandTypography(BrandBase):
         use_fallback("monospace_block")
         return self
 
+    def to_css(self) -> str:
+        """
+        A complete, minified stylesheet for the brand's typography.
+
+        The stylesheet starts with the font includes from
+        [`.fonts_css_include()`](`brand_yml.BrandTypography.fonts_css_include`),
+        followed by a `:root` rule with a CSS custom property for each setting,
+        named `--brand-typography-{element}-{property}`, e.g.
+        `--brand-typography-headings-weight`. Rules for `body`, headings,
+        monospace text and links then use these properties. The base font size
+        is converted to `rem` units where possible, other sizes are relative to
+        the surrounding text and are used as is. Code, keyboard and sample
+        text in `pre` blocks inherit the block's font size, so that relative
+        monospace sizes aren't applied twice.
+
+        The stylesheet is cached on the typography instance and reused until
+        the typography or a model it contains is modified, or a local font file
+        changes. Colors are only
+        resolved when the typography is part of a [`Brand`](`brand_yml.Brand`).
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        color:
+          primary: "#447099"
+        typography:
+          base:
+            family: Open Sans
+            size: 18px
+          headings:
+            weight: 600
+            color: primary
+        \"\"\")
+
+        print(brand.typography.to_css())
+        ```
+
+        Returns
+        -------
+        :
+            A string with the CSS for the brand's typography.
+
+        Raises
+        ------
+        ValueError
+            Raises a `ValueError` if a typographic element has a list of
+            values, e.g. `style: [normal, italic]`, for a CSS property that
+            takes a single value.
+        """
+        fonts_css = self.fonts_css_include()
+        entry = self._cache.get("to_css")
+        if entry is not None and entry[0] is fonts_css:
+            return entry[1]
+
+        variables: list[str] = []
+        rules: list[str] = []
+        for element, selector in typography_css_selectors.items():
+            node = getattr(self, element)
+            if node is None:
+                continue
+
+            declarations = []
+            for field, prop in typography_css_properties.items():
+                value = getattr(node, field, None)
+                if value is None:
+                    continue
+                name = f"--brand-typography-{element}-{field}".replace("_", "-")
+                variables.append(
+                    f"{name}:{typography_css_value(element, field, value)}"
+                )
+                declarations.append(f"{prop}:var({name})")
+
+            if declarations:
+                rules.append(f"{selector}{{{';'.join(declarations)}}}")
+
+        if self.monospace is not None and self.monospace.size is not None:
+            # Relative sizes of `code` would otherwise compound in `pre`
+            rules.append("pre code,pre kbd,pre samp{font-size:inherit}")
+
+        css = minify_css(fonts_css)
+        if variables:
+            css += f":root{{{';'.join(variables)}}}" + "".join(rules)
+
+        self._cache["to_css"] = (fonts_css, css)
+        return css
+
     def fonts_css_include(self) -> str:
         """
         Generates CSS include statements for the defined fonts.
@@ -1489,26 +1956,141 @@ class BrandTypography(BrandBase):
         This method creates CSS `@import` or `@font-face` rules for all fonts
         defined in the typography configuration.
 
+        The CSS is cached on the typography instance and reused until the
+        typography or a model it contains is modified, e.g. by assigning to
+        `fonts`, or a local font file changes.
+
         Returns
         -------
         :
             A string containing CSS include statements for all defined fonts.
         """
+        entry = self._cache.get("fonts_css_include")
+        if entry is not None:
+            paths, stats, css = entry
+            if tuple(map(file_stat, paths)) == stats:
+                return css
+
+        # Local font files with `weight: auto` are read for their weight
+        paths = tuple({f.absolute() for f in local_files(self.fonts)})
+        stats = tuple(map(file_stat, paths))
+        css = self._fonts_css_include()
+        self._cache["fonts_css_include"] = (paths, stats, css)
+        return css
+
+    def fonts_preload_files(self) -> list[BrandTypographyFontFilesPath]:
+        """
+        The font files needed to render `base`, `headings` and `monospace` text.
+
+        For each of these elements whose family is defined by font files in
+        `fonts`, this method picks the file a browser would use for the
+        element's weight (`normal` if not set) and style. These files are
+        needed for the first paint of most pages and are worth preloading.
+        Fonts from Google Fonts, Bunny Fonts or the system aren't included.
+
+        Returns
+        -------
+        :
+            A list of unique font files, in the order of the elements that use
+            them.
+        """
+        fonts = {
+            font.family: font
+            for font in self.fonts
+            if isinstance(font, BrandTypographyFontFiles)
+        }
+
+        files: dict[int, BrandTypographyFontFilesPath] = {}
+        for field in (
+            "base",
+            "headings",
+            "monospace",
+            "monospace_inline",
+            "monospace_block",
+        ):
+            element = getattr(self, field)
+            if element is None or element.family not in fonts:
+                continue
+
+            weight = font_weight_number(element.weight) or 400
+            styles = getattr(element, "style", None) or "normal"
+            if isinstance(styles, str):
+                styles = [styles]
+
+            for style in styles:
+                file = match_font_file(
+                    fonts[element.family].files, weight, style
+                )
+                if file is not None:
+                    files.setdefault(id(file), file)
+
+        return list(files.values())
+
+    def _fonts_preload_links(
+        self,
+        copies: Mapping[str, list[FontFileCopy]],
+        href_dir: str,
+    ) -> TagList:
+        links = TagList()
+        for file in self.fonts_preload_files():
+            href = str(file.path.root)
+            fmt = file.format
+            if isinstance(file.path, FileLocationLocal):
+                # Subsets are listed in order, the first one is preloaded
+                file_copies = copies.get(href)
+                if not file_copies:
+                    continue
+                copy = file_copies[0]
+                if copy.woff2 is not None:
+                    href, fmt = copy.woff2, "woff2"
+                else:
+                    href = copy.path
+                href = posixpath.join(href_dir, quote(href))
+
+            links.append(
+                tags.link(
+                    rel="preload",
+                    href=href,
+                    as_="font",
+                    type=font_mime_types[fmt],
+                    crossorigin="",
+                )
+            )
+        return links
+
+    def _fonts_css_include(
+        self,
+        copies: Mapping[str, list[FontFileCopy]] | None = None,
+    ) -> str:
         # TODO: Download or move files into a project-relative location
 
         if len(self.fonts) == 0:
             return ""
 
-        fonts = sorted([*self.fonts], key=lambda x: x.source == "file")
-
-        includes = [font.to_css() for font in fonts]
+        # Font files come last, after any @import rules, with one @font-face
+        # rule per unique face across all font file sources
+        includes = [
+            font.to_css()
+            for font in self.fonts
+            if not isinstance(font, BrandTypographyFontFiles)
+        ]
+        faces = plan_font_faces(
+            face
+            for font in self.fonts
+            if isinstance(font, BrandTypographyFontFiles)
+            for face in font.font_faces(copies)
+        )
+        includes.extend(face.to_css() for face in faces)
 
-        return "\n".join([i for i in includes if i])
+        return "\n".join(dict.fromkeys(i for i in includes if i))
 
     def fonts_write_css(
         self,
         path_dir: str | Path,
         file_css: str = "fonts.css",
+        *,
+        subset: FontSubsetType | None = None,
+        woff2: bool = False,
     ) -> Path | None:
         """
         Writes `fonts.css` into a directory, with copies of local fonts.
@@ -1526,15 +2108,55 @@ class BrandTypography(BrandBase):
             The name of the CSS file with the font `@import` and `@font-face`
             rules should be written.
 
+        subset
+            Split local fonts into one file per unicode range, so that browsers
+            only download the characters used on a page. Either a list of
+            subset names, e.g. `["latin", "latin-ext"]` (see
+            `brand_yml.typography.FONT_SUBSET_RANGES`), or a dictionary mapping
+            subset names to CSS `unicode-range` values, e.g. `{"basic":
+            "U+0020-007E"}`. Each `@font-face` rule includes the matching
+            `unicode-range`. Requires the `fonttools` package, e.g. via `pip
+            install brand_yml[fonts]`.
+
+        woff2
+            Write a WOFF2 version of each local font that isn't already WOFF2,
+            listed first in the `src` of its `@font-face` rule, and log the
+            bytes saved. WOFF2 files are cached on disk by the hash of their
+            source, in the directory set by the `BRAND_YML_CACHE_DIR`
+            environment variable (`0` turns the cache off) or in
+            `~/.cache/brand_yml`. Requires the `fonttools` and `brotli`
+            packages, e.g. via `pip install brand_yml[fonts]`.
+
         Returns
         -------
         :
             Returns the path to the directory where the files were written, i.e.
             `path_dir`.
         """
+        written = self._fonts_write_css(
+            path_dir, file_css, subset=subset, woff2=woff2
+        )
+        return written[0] if written is not None else None
+
+    @instrumented("BrandTypography.fonts_write_css")
+    def _fonts_write_css(
+        self,
+        path_dir: str | Path,
+        file_css: str,
+        *,
+        subset: FontSubsetType | None = None,
+        woff2: bool = False,
+    ) -> tuple[Path, dict[str, list[FontFileCopy]]] | None:
         if len(self.fonts) == 0:
             return
 
+        ranges = resolve_font_subsets(subset) if subset else None
+        if ranges:
+            # Fail early if fontTools isn't installed
+            font_tools()
+        if woff2:
+            require_woff2()
+
         path_dir = Path(path_dir).expanduser().resolve()
 
         if not path_dir.is_dir():
@@ -1542,25 +2164,39 @@ class BrandTypography(BrandBase):
 
         path_dir.mkdir(parents=True, exist_ok=True)
 
-        font_css = path_dir / file_css
-        font_css.write_text(self.fonts_css_include())
-
         # Copy local files from typography.fonts into the output directory
+        copies: dict[str, list[FontFileCopy]] = {}
         for font in self.fonts:
             if isinstance(font, BrandTypographyFontFiles):
                 for file in font.files:
                     if isinstance(file.path, FileLocationLocal):
-                        dest_path = path_dir / file.path.relative()
-                        dest_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copyfile(file.path.absolute(), dest_path)
+                        key = str(file.path.root)
+                        if key not in copies:
+                            copies[key] = write_font_copies(
+                                file.path.absolute(),
+                                file.path.relative(),
+                                path_dir,
+                                ranges=ranges,
+                                woff2=woff2,
+                            )
+
+        if woff2:
+            log_woff2_savings(copies)
 
-        return path_dir
+        font_css = path_dir / file_css
+        font_css.write_text(self._fonts_css_include(copies))
+
+        return path_dir, copies
 
     def fonts_html_dependency(
         self,
         path_dir: str | Path,
         name: str = "brand-fonts",
         version: str = "0.0.1",
+        *,
+        subset: FontSubsetType | None = None,
+        woff2: bool = False,
+        preload: bool = True,
     ) -> HTMLDependency | None:
         """
         Generate an HTMLDependency for the font CSS and font files.
@@ -1581,6 +2217,19 @@ class BrandTypography(BrandBase):
             The name of the dependency. Defaults to "brand-fonts".
         version
             The version of the dependency. Defaults to "0.0.1".
+        subset
+            Split local fonts into one file per unicode range, see
+            [`.fonts_write_css()`](`brand_yml.BrandTypography.fonts_write_css`).
+        woff2
+            Write WOFF2 versions of local fonts, see
+            [`.fonts_write_css()`](`brand_yml.BrandTypography.fonts_write_css`).
+        preload
+            Whether to include `<link rel="preload">` tags in the dependency for
+            the font files used by `base`, `headings` and `monospace` text (see
+            [`.fonts_preload_files()`](`brand_yml.BrandTypography.fonts_preload_files`)),
+            so that browsers start downloading them before the CSS is parsed.
+            Local font files are linked relative to the default `lib/`
+            location of HTML dependencies.
 
         Returns
         -------
@@ -1590,14 +2239,24 @@ class BrandTypography(BrandBase):
             CSS is needed.
 
         """
-        subdir = self.fonts_write_css(path_dir, "fonts.css")
-        if subdir is None:
+        written = self._fonts_write_css(
+            path_dir, "fonts.css", subset=subset, woff2=woff2
+        )
+        if written is None:
             return
 
-        return HTMLDependency(
+        subdir, copies = written
+        dep = HTMLDependency(
             name=name,
             version=version,
             source={"subdir": str(subdir)},
             stylesheet={"href": "fonts.css"},
             all_files=True,
         )
+        if preload:
+            links = self._fonts_preload_links(
+                copies, dep.source_path_map()["href"]
+            )
+            if links:
+                dep.head = links
+        return dep
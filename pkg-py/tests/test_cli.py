@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from brand_yml import Brand
+from brand_yml._cli import expand_brand_files, main, output_names
+from brand_yml.file import FileLocationLocal
+from brand_yml.logo import BrandLogoResource, BrandLogoResourceLightDark
+from utils import path_examples
+
+
+@pytest.fixture
+def brands(tmp_path: Path) -> Path:
+    for name in ("acme", "globex"):
+        (tmp_path / name).mkdir()
+        shutil.copyfile(
+            path_examples("brand-color-palette-posit.yml"),
+            tmp_path / name / "_brand.yml",
+        )
+    (tmp_path / "broken").mkdir()
+    (tmp_path / "broken" / "_brand.yml").write_text("color:\n  primary: 5\n")
+    return tmp_path
+
+
+def test_expand_brand_files(brands: Path):
+    files, unmatched = expand_brand_files(
+        [
+            str(brands),
+            str(brands / "acme" / "_brand.yml"),
+            str(brands / "*" / "_brand.yaml"),
+        ]
+    )
+    assert [f.parent.name for f in files] == ["acme", "broken", "globex"]
+    assert unmatched == [str(brands / "*" / "_brand.yaml")]
+
+
+def test_output_names(brands: Path):
+    files = [brands / "acme" / "_brand.yml", brands / "globex" / "_brand.yml"]
+    assert output_names(files) == {
+        files[0]: Path("acme/_brand"),
+        files[1]: Path("globex/_brand"),
+    }
+    assert output_names(files[:1]) == {files[0]: Path("_brand")}
+
+
+def test_cli_validate(brands: Path, capsys: pytest.CaptureFixture[str]):
+    assert main(["validate", str(brands / "acme"), str(brands / "globex")]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert out == [
+        f"{brands / 'acme' / '_brand.yml'}: ok",
+        f"{brands / 'globex' / '_brand.yml'}: ok",
+    ]
+
+    assert main(["validate", "--jobs", "2", str(brands)]) == 1
+    captured = capsys.readouterr()
+    assert "broken" in captured.err
+    assert "broken" not in captured.out
+
+
+def test_cli_validate_json_schema(
+    brands: Path, capsys: pytest.CaptureFixture[str]
+):
+    pytest.importorskip("jsonschema")
+
+    assert (
+        main(["validate", "--json", "--schema", "--timing", str(brands)]) == 1
+    )
+    out = json.loads(capsys.readouterr().out)
+
+    assert out["command"] == "validate"
+    assert out["ok"] is False
+    assert [r["ok"] for r in out["results"]] == [True, False, True]
+    assert out["results"][1]["errors"] == [
+        {"path": "color.primary", "message": "5 is not of type 'string'"}
+    ]
+
+    phases = out["timing"]["phases"]
+    assert phases["cli.validate"]["count"] == 3
+    assert phases["schema.compile"]["count"] == 1
+    assert phases["schema.validate"]["count"] == 3
+    assert "Brand.model_validate" in phases
+
+
+def test_cli_dump(capsys: pytest.CaptureFixture[str]):
+    path = path_examples("brand-color-palette-posit.yml")
+
+    assert main(["dump", "--format", "json", str(path)]) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert data["color"]["palette"]["blue"] == "#447099"
+
+    assert main(["dump", str(path)]) == 0
+    assert capsys.readouterr().out.startswith("color:\n")
+
+
+def test_cli_css(brands: Path, capsys: pytest.CaptureFixture[str]):
+    path = path_examples("brand-typography-simple.yml")
+    assert main(["css", str(path)]) == 0
+    css = capsys.readouterr().out
+    assert css.startswith(":root{--brand-typography-base-family:'Open Sans';")
+
+    out_dir = brands / "dist"
+    acme, globex = brands / "acme", brands / "globex"
+    assert (
+        main(["css", "--json", "-o", str(out_dir), str(acme), str(globex)]) == 0
+    )
+    out = json.loads(capsys.readouterr().out)
+    assert [r["files"] for r in out["results"]] == [
+        ["acme/_brand.css"],
+        ["globex/_brand.css"],
+    ]
+    assert (out_dir / "acme" / "_brand.css").exists()
+
+
+def test_cli_fonts_and_bundle(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+):
+    path = path_examples("brand-typography-fonts.yml")
+
+    assert main(["fonts", str(path)]) == 0
+    assert "@font-face" in capsys.readouterr().out
+
+    assert main(["fonts", "-o", str(tmp_path / "fonts"), str(path)]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "fonts.css",
+        "fonts/open-sans/OpenSans-Variable-Italic.ttf",
+        "fonts/open-sans/OpenSans-Variable.ttf",
+    ]
+
+    logo = path_examples("brand-logo-full.yml")
+    out_dir = tmp_path / "bundle"
+    assert main(["bundle", "-o", str(out_dir), str(path), str(logo)]) == 0
+    files = capsys.readouterr().out.splitlines()
+    assert "brand-typography-fonts/_brand.yml" in files
+    assert "brand-typography-fonts/fonts.css" in files
+    assert "brand-logo-full/_brand.yml" in files
+    assert any(f.startswith("brand-logo-full/logos/pandas-") for f in files)
+
+
+@pytest.fixture
+def brand_local_files(tmp_path: Path) -> Path:
+    src = tmp_path / "src"
+    (src / "img").mkdir(parents=True)
+    (src / "fonts").mkdir()
+    shutil.copyfile(
+        path_examples("logos", "pandas", "pandas.svg"), src / "img" / "logo.svg"
+    )
+    shutil.copyfile(
+        path_examples("logos", "pandas", "pandas_white.svg"),
+        src / "img" / "logo-white.svg",
+    )
+    shutil.copyfile(
+        path_examples("fonts", "open-sans", "OpenSans-Variable.ttf"),
+        src / "fonts" / "OpenSans-Variable.ttf",
+    )
+    (src / "_brand.yml").write_text(
+        """
+logo:
+  images:
+    mark: img/logo.svg
+  small: mark
+  medium:
+    light: img/logo.svg
+    dark: img/logo-white.svg
+typography:
+  fonts:
+    - family: Open Sans
+      source: file
+      files:
+        - path: fonts/OpenSans-Variable.ttf
+  base: Open Sans
+"""
+    )
+    return src / "_brand.yml"
+
+
+def test_cli_bundle_can_be_loaded(
+    brand_local_files: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+):
+    out_dir = tmp_path / "bundle"
+    assert main(["bundle", "-o", str(out_dir), str(brand_local_files)]) == 0
+    files = capsys.readouterr().out.splitlines()
+    assert "fonts/OpenSans-Variable.ttf" in files
+
+    brand = Brand.from_yaml(out_dir / "_brand.yml")
+    source = Brand.from_yaml(brand_local_files).use_logo("mark")
+    assert isinstance(source, BrandLogoResource)
+
+    medium = brand.use_logo("medium")
+    assert isinstance(medium, BrandLogoResourceLightDark)
+    for logo in (brand.use_logo("mark"), medium.light, medium.dark):
+        assert isinstance(logo, BrandLogoResource)
+        assert isinstance(logo.path, FileLocationLocal)
+        assert logo.path.relative().parent == Path("logos")
+        assert logo.path.absolute().parent == out_dir / "logos"
+        assert logo.path.absolute().exists()
+
+    mark = brand.use_logo("mark")
+    assert isinstance(mark, BrandLogoResource)
+    assert isinstance(mark.path, FileLocationLocal)
+    assert mark.path.relative().name == source.asset_name()
+
+    assert brand.typography is not None
+    assert "OpenSans-Variable.ttf" in brand.typography.fonts_css_include()
+    assert not (out_dir / "img").exists()
+
+
+def test_cli_bundle_failure_writes_nothing(
+    brand_local_files: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+):
+    (brand_local_files.parent / "fonts" / "OpenSans-Variable.ttf").unlink()
+
+    out_dir = tmp_path / "bundle"
+    assert main(["bundle", "-o", str(out_dir), str(brand_local_files)]) == 1
+    assert "OpenSans-Variable.ttf" in capsys.readouterr().err
+    assert not out_dir.exists()
+    assert list(tmp_path.iterdir()) == [brand_local_files.parent]
+
+
+def test_cli_bundle_requires_output_dir(capsys: pytest.CaptureFixture[str]):
+    with pytest.raises(SystemExit) as exc:
+        main(["bundle", str(path_examples("brand-posit.yml"))])
+    assert exc.value.code == 2
+    assert "--output-dir" in capsys.readouterr().err
+
+
+def test_cli_unmatched_pattern(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+):
+    assert main(["validate", str(tmp_path / "*.yml")]) == 1
+    assert "No brand files found" in capsys.readouterr().err
@@ -2,6 +2,11 @@ from __future__ import annotations
 
 import pytest
 from brand_yml import Brand, BrandColor
+from brand_yml.color import (
+    BrandColorArray,
+    BrandColorContrastMatrix,
+    BrandColorMatch,
+)
 from syrupy.extensions.json import JSONSnapshotExtension
 from utils import path_examples, pydantic_data_from_json
 
@@ -156,3 +161,274 @@ def test_brand_color_palette_names_valid_sass_vars():
     )
     assert isinstance(brand.color, BrandColor)
     assert brand.color.palette == {"my_pink": "#f0f"}
+
+
+def test_brand_color_to_array():
+    brand = Brand.from_yaml_str(
+        """
+        color:
+          palette:
+            blue: "#447099"
+            orange: rgb(238, 99, 49)
+          foreground: black
+          background: "#fff"
+          primary: blue
+        """
+    )
+    assert isinstance(brand.color, BrandColor)
+
+    colors = brand.color.to_array()
+    assert isinstance(colors, BrandColorArray)
+    assert list(colors) == [
+        "blue",
+        "orange",
+        "foreground",
+        "background",
+        "primary",
+    ]
+    assert colors.to_hex() == {
+        "blue": "#447099",
+        "orange": "#ee6331",
+        "foreground": "#000000",
+        "background": "#ffffff",
+        "primary": "#447099",
+    }
+
+    # Parsed once and cached until brand.color is modified
+    assert brand.color.to_array() is colors
+    assert brand.color.to_array("theme") is not colors
+    assert list(brand.color.to_array("palette")) == ["blue", "orange"]
+    brand.color.primary = "orange"
+    assert brand.color.to_array() is not colors
+    assert brand.color.to_array()["primary"] == colors["orange"]
+
+    contrast = colors.contrast("background")
+    assert contrast["foreground"] == pytest.approx(21)
+    assert contrast["background"] == pytest.approx(1)
+    assert contrast["blue"] == pytest.approx(5.22, abs=0.01)
+    assert colors.contrast("white") == contrast
+
+    assert colors.luminance()["background"] == pytest.approx(1)
+    assert colors.mix("background", 1).to_hex()["blue"] == "#ffffff"
+    assert colors.tint(0.5).to_hex()["foreground"] == "#808080"
+    assert colors.shade(1).to_hex()["orange"] == "#000000"
+    assert colors.to_oklab()["background"] == pytest.approx((1, 0, 0), abs=1e-4)
+    assert colors.to_hsl()["foreground"] == (0, 0, 0)
+
+
+def test_brand_color_array_ramp():
+    colors = BrandColorArray({"primary": "#447099", "black": "#000"})
+
+    ramp = colors.ramp()
+    assert len(ramp["primary"]) == 9
+    assert ramp["primary"][4] == "#447099"
+    assert ramp["black"] == [
+        "#cccccc",
+        "#999999",
+        "#666666",
+        "#333333",
+        "#000000",
+        "#000000",
+        "#000000",
+        "#000000",
+        "#000000",
+    ]
+    assert colors.ramp(1) == {"primary": ["#447099"], "black": ["#000000"]}
+
+    with pytest.raises(ValueError):
+        colors.ramp(0)
+
+
+def test_brand_color_to_array_invalid_color():
+    brand = Brand.from_yaml_str(
+        """
+        color:
+          primary: var(--my-primary)
+        """
+    )
+    assert isinstance(brand.color, BrandColor)
+
+    with pytest.raises(ValueError, match="var"):
+        brand.color.to_array()
+
+
+def test_brand_color_contrast_matrix():
+    brand = Brand.from_yaml_str(
+        """
+        color:
+          palette:
+            blue: "#447099"
+            yellow: "#FDD835"
+          foreground: "#000000"
+          background: "#FFFFFF"
+          primary: blue
+        """
+    )
+    assert isinstance(brand.color, BrandColor)
+
+    contrast = brand.color.contrast_matrix()
+    assert isinstance(contrast, BrandColorContrastMatrix)
+    assert contrast.rows == ("blue", "yellow")
+    assert contrast.cols == ("foreground", "background", "primary")
+    assert len(contrast.values) == 2
+    assert all(len(row) == 3 for row in contrast.values)
+
+    assert contrast["blue", "background"] == pytest.approx(5.22, abs=0.01)
+    assert contrast["blue", "primary"] == pytest.approx(1)
+    assert contrast.to_dict()["yellow"]["foreground"] == pytest.approx(
+        contrast["yellow", "foreground"]
+    )
+
+    # `primary` is another name for `blue`, so that pair isn't a failure
+    below_aa = contrast.below("AA")
+    assert [(r, c) for r, c, _ in below_aa] == [
+        ("blue", "foreground"),
+        ("yellow", "background"),
+        ("yellow", "primary"),
+    ]
+    assert len(contrast.below("AAA")) > len(below_aa)
+    assert contrast.below(1) == []
+
+    with pytest.raises(ValueError):
+        contrast.below("A")  # type: ignore
+
+    # cached until brand.color changes
+    assert brand.color.contrast_matrix() is contrast
+    all_pairs = brand.color.contrast_matrix("all", "all")
+    assert all_pairs.rows == all_pairs.cols
+    assert len(all_pairs.rows) == 5
+
+
+def test_brand_typography_contrast():
+    brand = Brand.from_yaml_str(
+        """
+        color:
+          palette:
+            purple: "#7d12ba"
+            yellow: "#FDD835"
+          foreground: "#151515"
+          background: "#FFFFFF"
+        typography:
+          headings:
+            color: purple
+          monospace-inline:
+            color: yellow
+            background-color: "#f8f9fa"
+          monospace-block:
+            background-color: "#000000"
+        """
+    )
+
+    pairs = {pair.name: pair for pair in brand.typography_contrast()}
+    assert list(pairs) == [
+        "base",
+        "headings",
+        "monospace-inline",
+        "monospace-block",
+    ]
+    assert pairs["base"].color == "#151515"
+    assert pairs["headings"].background_color == "#FFFFFF"
+    assert pairs["monospace-block"].color == "#151515"
+    assert pairs["monospace-block"].background_color == "#000000"
+
+    failing = [pair.name for pair in brand.typography_contrast("AA")]
+    assert failing == ["monospace-inline", "monospace-block"]
+
+    assert (
+        Brand.from_yaml_str("meta:\n  name: Test").typography_contrast() == []
+    )
+
+
+def test_brand_color_nearest():
+    brand = Brand.from_yaml_str(
+        """
+        color:
+          palette:
+            blue: "#447099"
+            orange: "#EE6331"
+            green: "#72994E"
+          primary: blue
+          danger: "#FF0000"
+        """
+    )
+    assert isinstance(brand.color, BrandColor)
+
+    match = brand.color.nearest("#447099")
+    assert isinstance(match, BrandColorMatch)
+    # palette names win over identical theme colors
+    assert match.name == "blue"
+    assert match.distance == pytest.approx(0)
+
+    matches = brand.color.nearest(["#4682b4", "tomato", "rgb(100, 160, 80)"])
+    assert [m.name for m in matches] == ["blue", "orange", "green"]
+    assert all(m.distance > 0 for m in matches)
+
+    assert brand.color.nearest("#ee0000").name == "danger"
+
+    # A tuple of numbers is a single parsed color
+    match = brand.color.nearest((0.9, 0.4, 0.2, 1.0))
+    assert isinstance(match, BrandColorMatch)
+    assert match.name == "orange"
+    assert brand.color.nearest((0.9, 0.4, 0.2)) == match
+    matches = brand.color.nearest([(0.9, 0.4, 0.2), "#447099"])
+    assert [m.name for m in matches] == ["orange", "blue"]
+    assert brand.color.nearest("#ee0000", include="palette").name == "orange"
+    assert (
+        brand.color.nearest(["#447099"], include="theme")[0].name == "primary"
+    )
+
+    # The index is rebuilt when colors change
+    brand.color.palette = {"blue": "#0000FF"}
+    assert brand.color.nearest("#447099", include="palette").name == "blue"
+    assert brand.color.nearest("#447099", include="palette").distance > 0
+
+    with pytest.raises(ValueError):
+        BrandColorArray({}).nearest("red")
+
+
+def test_brand_color_scales():
+    brand = Brand.from_yaml_str(
+        """
+        color:
+          palette:
+            blue: "#447099"
+          primary: blue
+          secondary: "#000000"
+        """
+    )
+    assert isinstance(brand.color, BrandColor)
+
+    primary = brand.color.scale("primary")
+    assert list(primary) == [str(i) for i in range(100, 1000, 100)]
+    assert primary["500"] == "#447099"
+    assert primary["100"] == "#dae2eb"
+    assert primary["900"] == "#0e161f"
+    assert brand.color.scale("blue") == primary
+    assert brand.color.scale("secondary", steps=3) == {
+        "100": "#808080",
+        "200": "#000000",
+        "300": "#000000",
+    }
+
+    scales = brand.color.scales(include="theme")
+    assert list(scales) == ["primary", "secondary"]
+    assert scales["primary"] == primary
+
+    # Cached on the instance...
+    assert brand.color.scales(include="theme") is scales
+    # ...and read-only, so callers can't change the cached scales
+    with pytest.raises(TypeError, match="immutable"):
+        scales["primary"] = {}
+    with pytest.raises(TypeError, match="immutable"):
+        brand.color.scale("primary")["500"] = "#000000"
+    assert brand.color.scale("primary") == primary
+    copy = dict(brand.color.scale("primary"))
+    copy["500"] = "#000000"
+    assert brand.color.scale("primary")["500"] == "#447099"
+    # ...until the palette or a theme color is replaced
+    brand.color.palette = {"blue": "#0000FF"}
+    assert brand.color.scales(include="theme") is not scales
+    assert brand.color.scale("blue")["500"] == "#0000ff"
+
+    with pytest.raises(ValueError, match="not a theme color"):
+        brand.color.scale("tertiary")
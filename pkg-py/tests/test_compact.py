@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from brand_yml import Brand
+from brand_yml._utils_memory import deep_sizeof
+from brand_yml.compact import (
+    BrandCompactLogo,
+    BrandCompactLogoLightDark,
+    BrandCompactLogoResource,
+)
+from utils import path_examples
+
+
+def test_brand_compact():
+    brand = Brand.from_yaml(path_examples("brand-posit.yml"))
+    compact = brand.compact()
+
+    assert compact.name == "Posit Software, PBC"
+    assert compact.path == str(brand.path)
+
+    assert compact.color is not None
+    assert brand.color is not None
+    assert compact.color.get("primary") == brand.color.primary
+    assert compact.color.to_dict() == brand.color.to_dict()
+
+    assert compact.typography is not None
+    assert ("Open Sans", "google") in compact.typography.fonts
+    assert compact.typography.get("headings") == {
+        "family": "Roboto Slab",
+        "weight": 600,
+        "color": "#447099",
+    }
+    assert compact.typography.get("link") is None
+
+    assert isinstance(compact.logo, BrandCompactLogo)
+    small = compact.logo.get("small")
+    assert isinstance(small, BrandCompactLogoResource)
+    assert small.path == "posit-icon.png"
+    assert small.absolute_path == str(path_examples("posit-icon.png"))
+
+    # Compact views are immutable, hashable and equal when built from equal brands
+    assert hash(compact) == hash(Brand.from_yaml(brand.path).compact())
+    assert compact == Brand.from_yaml(brand.path).compact()
+
+
+def test_brand_compact_logo_light_dark():
+    brand = Brand.from_yaml(path_examples("brand-logo-light-dark.yml"))
+    compact = brand.compact()
+
+    assert isinstance(compact.logo, BrandCompactLogo)
+    assert isinstance(compact.logo.small, BrandCompactLogoResource)
+    medium = compact.logo.get("medium")
+    assert isinstance(medium, BrandCompactLogoLightDark)
+    assert medium.light is not None and medium.dark is not None
+    assert medium.dark.path == "logos/pandas/pandas_secondary_white.svg"
+
+
+def test_brand_compact_nested_values_are_hashable():
+    brand = Brand.from_yaml_str("""
+    logo:
+      images:
+        mark:
+          path: mark.png
+          attrs:
+            class: [logo, mark]
+            data: {size: [1, 2]}
+    typography:
+      headings:
+        style: [normal, italic]
+    """)
+    compact = brand.compact()
+
+    assert compact.typography is not None
+    headings = compact.typography.get("headings")
+    assert headings is not None
+    assert headings["style"] == ("normal", "italic")
+
+    assert isinstance(compact.logo, BrandCompactLogo)
+    mark = compact.logo.get("mark")
+    assert isinstance(mark, BrandCompactLogoResource)
+    assert dict(mark.attrs) == {
+        "class": ("logo", "mark"),
+        "data": (("size", (1, 2)),),
+    }
+
+    assert hash(compact) == hash(brand.model_copy(deep=True).compact())
+
+
+def test_brand_memory_report():
+    brand = Brand.from_yaml(path_examples("brand-posit.yml"))
+    report = brand.memory_report()
+
+    assert set(report) == {
+        "meta",
+        "logo",
+        "color",
+        "typography",
+        "defaults",
+        "cache",
+        "total",
+    }
+    assert all(size >= 0 for size in report.values())
+    assert report["color"] > 0 and report["typography"] > 0
+    assert report["total"] >= report["color"] + report["typography"]
+
+    # The compact view is much smaller than the full brand
+    compact = brand.compact()
+    assert deep_sizeof(compact) < report["total"]
+    assert deep_sizeof(compact.color) < report["color"]
+    assert deep_sizeof(compact.typography) < report["typography"]
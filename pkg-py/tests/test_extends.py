@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from brand_yml import Brand
+from brand_yml._extends import base_brand_cache, deep_merge
+from brand_yml.logo import BrandLogo, BrandLogoResource
+from brand_yml.typography import BrandTypographyFontFiles
+
+path_fixtures = Path(__file__).parent / "fixtures" / "extends"
+
+
+@pytest.fixture(autouse=True)
+def clear_base_brand_cache():
+    base_brand_cache.clear()
+    yield
+    base_brand_cache.clear()
+
+
+def test_deep_merge_precedence():
+    base = {"a": {"b": 1, "c": [1, 2]}, "d": "base"}
+    override = {"a": {"c": [3], "e": None}, "f": "new"}
+
+    merged = deep_merge(base, override)
+
+    assert merged == {
+        "a": {"b": 1, "c": [3], "e": None},
+        "d": "base",
+        "f": "new",
+    }
+    # inputs are untouched
+    assert base == {"a": {"b": 1, "c": [1, 2]}, "d": "base"}
+    merged["a"]["c"].append(4)
+    assert override["a"]["c"] == [3]
+
+
+def test_brand_extends_merges_sections():
+    brand = Brand.from_yaml(path_fixtures / "client" / "_brand.yml")
+
+    assert brand.meta is not None and brand.meta.name is not None
+    assert brand.meta.name.full == "Very Big Corporation of America"
+    assert brand.meta.name.short == "Client"
+
+    assert brand.color is not None
+    assert brand.color.primary == "#EE6331"
+    assert brand.color.foreground == "#151515"
+    assert brand.color.palette == {
+        "blue": "#447099",
+        "orange": "#EE6331",
+        "black": "#151515",
+    }
+
+    # typography colors are resolved against the merged colors
+    assert brand.typography is not None
+    assert brand.typography.headings is not None
+    assert brand.typography.headings.color == "#EE6331"
+
+
+def test_brand_extends_local_paths_point_to_base_files():
+    path_base = path_fixtures / "corporate"
+    brand = Brand.from_yaml(path_fixtures / "client")
+
+    assert isinstance(brand.logo, BrandLogo)
+    assert isinstance(brand.logo.small, BrandLogoResource)
+    assert brand.logo.small.path.root == Path("../corporate/logos/mark.svg")
+    assert brand.logo.small.path.absolute().resolve() == (
+        path_base / "logos" / "mark.svg"
+    )
+    assert isinstance(brand.logo.medium, BrandLogoResource)
+    assert brand.logo.medium.path.absolute().resolve() == (
+        path_base / "logos" / "wordmark.svg"
+    )
+
+    assert brand.typography is not None
+    font = brand.typography.fonts[0]
+    assert isinstance(font, BrandTypographyFontFiles)
+    assert font.files[0].path.absolute().resolve() == (
+        path_base / "fonts" / "CorporateSans.ttf"
+    )
+
+
+def test_brand_extends_chain_and_palette_override():
+    brand = Brand.from_yaml(path_fixtures / "client" / "same-dir.yml")
+
+    assert brand.color is not None
+    assert brand.color.palette is not None
+    assert brand.color.palette["orange"] == "#FF9A02"
+    # `primary: orange` from the middle of the chain resolves the new value
+    assert brand.color.primary == "#FF9A02"
+    assert brand.meta is not None and brand.meta.name is not None
+    assert brand.meta.name.short == "Client"
+
+
+def test_brand_extends_base_is_cached(tmp_path: Path):
+    shutil.copytree(path_fixtures, tmp_path / "extends")
+    path_client = tmp_path / "extends" / "client" / "_brand.yml"
+    path_base = tmp_path / "extends" / "corporate" / "_brand.yml"
+
+    one = Brand.from_yaml(path_client)
+    base = base_brand_cache.get(Brand, path_base)
+    two = Brand.from_yaml(path_client)
+
+    assert one == two
+    assert base_brand_cache.get(Brand, path_base) is base
+
+    # Sections not touched by the override are copies, not shared objects
+    same_dir = Brand.from_yaml(path_client.parent / "same-dir.yml")
+    assert same_dir.logo == one.logo
+    assert same_dir.logo is not base_brand_cache.get(Brand, path_client).logo
+
+    # Changing the base file invalidates the cache
+    path_base.write_text(
+        path_base.read_text().replace("#447099", "#000099"), "utf-8"
+    )
+    stat = path_base.stat()
+    os.utime(path_base, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    three = Brand.from_yaml(path_client)
+    assert base_brand_cache.get(Brand, path_base) is not base
+    assert three.color is not None and three.color.palette is not None
+    assert three.color.palette["blue"] == "#000099"
+
+
+def test_brand_extends_loads_from_threads(tmp_path: Path):
+    shutil.copytree(path_fixtures, tmp_path / "extends")
+    paths = [
+        tmp_path / "extends" / "client" / "_brand.yml",
+        tmp_path / "extends" / "client" / "same-dir.yml",
+    ] * 4
+
+    with ThreadPoolExecutor(4) as pool:
+        brands = list(pool.map(Brand.from_yaml, paths))
+
+    assert all(b == brands[0] for b in brands[::2])
+    assert all(b == brands[1] for b in brands[1::2])
+
+    with pytest.raises(ValueError, match="Circular `extends`"):
+        with ThreadPoolExecutor(2) as pool:
+            list(
+                pool.map(
+                    Brand.from_yaml,
+                    [path_fixtures / "circular-a.yml"] * 2,
+                )
+            )
+
+
+def test_brand_extends_circular_error():
+    with pytest.raises(ValueError, match="Circular `extends`"):
+        Brand.from_yaml(path_fixtures / "circular-a.yml")
+
+
+def test_brand_merge_does_not_modify_inputs():
+    base = Brand.from_yaml_str("""
+    meta:
+      name: Base
+    color:
+      palette:
+        blue: "#447099"
+        red: "#FF0000"
+      primary: blue
+    typography:
+      headings:
+        color: primary
+    """)
+    base_copy = base.model_copy(deep=True)
+
+    brand = Brand.merge(base, {"color": {"primary": "red"}})
+
+    assert brand.color is not None
+    assert brand.color.primary == "#FF0000"
+    assert brand.typography is not None and brand.typography.headings
+    assert brand.typography.headings.color == "#FF0000"
+    assert brand.meta == base.meta
+    assert base == base_copy
+
+    # Brands can also be merged
+    brand_meta = Brand.merge(brand, Brand(meta={"name": "Override"}))
+    assert brand_meta.meta is not None and brand_meta.meta.name is not None
+    assert brand_meta.meta.name.full == "Override"
+    assert brand_meta.color == brand.color
+
+
+def test_brand_merge_keeps_only_color_references():
+    base = Brand.from_yaml_str("""
+    meta:
+      name: Base
+    color:
+      palette:
+        blue: "#447099"
+      primary: blue
+    typography:
+      base: Open Sans
+      monospace_inline:
+        background_color: primary
+    """)
+    assert "data" not in base._cache
+    assert base._cache["color_references"] == {
+        "color": {"palette": {"blue": "#447099"}, "primary": "blue"},
+        "typography": {"monospace-inline": {"background-color": "primary"}},
+    }
+
+    brand = Brand.merge(base, {"color": {"palette": {"blue": "#000099"}}})
+    assert brand.color is not None and brand.color.primary == "#000099"
+    assert brand.typography is not None
+    assert brand.typography.monospace_inline is not None
+    assert brand.typography.monospace_inline.background_color == "#000099"
+
+
+def test_brand_merge_uses_nested_changes_to_base():
+    base = Brand.from_yaml_str("""
+    color:
+      primary: blue
+    typography:
+      base:
+        size: 16px
+    """)
+    assert base.color is not None and base.typography is not None
+    base.color.secondary = "#123456"
+    assert base.typography.base is not None
+    base.typography.base.size = "18px"
+
+    brand = Brand.merge(base, {"color": {"primary": "red"}})
+
+    assert brand.color is not None
+    assert brand.color.primary == "red"
+    assert brand.color.secondary == "#123456"
+    assert brand.typography is not None and brand.typography.base is not None
+    assert brand.typography.base.size == "18px"
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from brand_yml import Brand, _fingerprint
+from utils import path_examples
+
+
+def test_fingerprint_ignores_key_order():
+    one = Brand.from_yaml_str("""
+    meta:
+      name: Test
+    color:
+      palette:
+        blue: "#447099"
+        red: "#FF0000"
+      primary: blue
+    """)
+    two = Brand.from_yaml_str("""
+    color:
+      primary: blue
+      palette:
+        red: "#FF0000"
+        blue: "#447099"
+    meta:
+      name: Test
+    """)
+
+    assert one.fingerprint() == two.fingerprint()
+    assert one.fingerprint("color") == two.fingerprint("color")
+    assert len(one.fingerprint()) == 64
+    assert one.fingerprint("color") != one.fingerprint("meta")
+    assert one.freeze().fingerprint() == one.fingerprint()
+
+
+def test_fingerprint_sections_change_independently():
+    brand = Brand.from_yaml(path_examples("brand-posit.yml"))
+    before = {s: brand.fingerprint(s) for s in ("meta", "logo", "color")}
+    before_brand = brand.fingerprint()
+
+    assert brand.color is not None
+    brand.color.primary = "#EE6331"
+
+    assert brand.fingerprint("color") != before["color"]
+    assert brand.fingerprint("logo") == before["logo"]
+    assert brand.fingerprint("meta") == before["meta"]
+    assert brand.fingerprint() != before_brand
+
+    brand.color = None
+    assert brand.fingerprint("color") != before["color"]
+
+
+def test_fingerprint_is_cached(monkeypatch: pytest.MonkeyPatch):
+    brand = Brand.from_yaml(path_examples("brand-posit.yml"))
+    calls: list[str] = []
+    compute = _fingerprint.compute_fingerprint
+
+    def counted(section, files):
+        calls.append(type(section).__name__)
+        return compute(section, files)
+
+    monkeypatch.setattr(_fingerprint, "compute_fingerprint", counted)
+
+    first = brand.fingerprint()
+    assert len(calls) == 4
+    assert brand.fingerprint() == first
+    assert len(calls) == 4
+
+    assert brand.typography is not None and brand.typography.base is not None
+    brand.typography.base.size = "20px"
+    assert brand.fingerprint() != first
+    assert len(calls) == 8
+
+
+def test_fingerprint_tracks_local_files(tmp_path: Path):
+    shutil.copy(path_examples("brand-logo-simple.yml"), tmp_path / "_brand.yml")
+    shutil.copytree(path_examples("logos"), tmp_path / "logos")
+    brand = Brand.from_yaml(tmp_path)
+
+    before_logo = brand.fingerprint("logo")
+    before_color = brand.fingerprint("color")
+
+    logo_file = tmp_path / "logos" / "pandas" / "pandas_mark.svg"
+    logo_file.write_text(logo_file.read_text() + "<!-- changed -->")
+    stat = logo_file.stat()
+    os.utime(logo_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert brand.fingerprint("logo") != before_logo
+    assert brand.fingerprint("color") == before_color
+
+    # A brand with the same files in another directory has the same fingerprint
+    shutil.copytree(tmp_path, tmp_path.parent / (tmp_path.name + "-copy"))
+    copy = Brand.from_yaml(tmp_path.parent / (tmp_path.name + "-copy"))
+    assert copy.fingerprint() == brand.fingerprint()
+
+
+def test_fingerprint_unknown_section():
+    with pytest.raises(ValueError, match="Unknown brand section"):
+        Brand().fingerprint("defaults")  # type: ignore[arg-type]
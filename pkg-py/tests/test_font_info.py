@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import os
+import struct
+from pathlib import Path
+
+import pytest
+from brand_yml import Brand
+from brand_yml._font_info import (
+    FontInfo,
+    font_info,
+    font_info_cache,
+    read_font_info,
+)
+from brand_yml.typography import BrandTypography, BrandTypographyFontFiles
+from utils import path_examples
+
+
+def os2(weight: int, fs_selection: int = 0) -> bytes:
+    table = bytearray(96)
+    struct.pack_into(">H", table, 4, weight)
+    struct.pack_into(">H", table, 62, fs_selection)
+    return bytes(table)
+
+
+def fvar(low: float, high: float, tag: bytes = b"wght") -> bytes:
+    axis = struct.pack(
+        ">4siiiHH",
+        tag,
+        int(low * 65536),
+        int(low * 65536),
+        int(high * 65536),
+        0,
+        256,
+    )
+    return struct.pack(">HHHHHHHH", 1, 0, 16, 2, 1, len(axis), 0, 0) + axis
+
+
+def sfnt(tables: dict[bytes, bytes]) -> bytes:
+    offset = 12 + 16 * len(tables)
+    header = struct.pack(">4sHHHH", b"\x00\x01\x00\x00", len(tables), 0, 0, 0)
+    records = b""
+    data = b""
+    for tag, table in tables.items():
+        records += struct.pack(">4sIII", tag, 0, offset + len(data), len(table))
+        data += table
+    return header + records + data
+
+
+def test_read_font_info_static(tmp_path: Path):
+    path = tmp_path / "font.ttf"
+
+    path.write_bytes(sfnt({b"OS/2": os2(700)}))
+    assert read_font_info(path) == FontInfo((700, 700), "normal")
+
+    path.write_bytes(sfnt({b"OS/2": os2(300, fs_selection=1)}))
+    assert read_font_info(path) == FontInfo((300, 300), "italic")
+
+    path.write_bytes(sfnt({b"OS/2": os2(400, fs_selection=1 << 9)}))
+    assert read_font_info(path) == FontInfo((400, 400), "oblique")
+
+
+def test_read_font_info_variable(tmp_path: Path):
+    path = tmp_path / "font.ttf"
+
+    path.write_bytes(sfnt({b"fvar": fvar(100, 900), b"OS/2": os2(400)}))
+    info = read_font_info(path)
+    assert info == FontInfo((100, 900), "normal")
+    assert info is not None and info.variable
+    assert info.css_weight() == "100 900"
+
+    # Only the weight axis counts
+    path.write_bytes(sfnt({b"fvar": fvar(75, 100, b"wdth"), b"OS/2": os2(500)}))
+    info = read_font_info(path)
+    assert info == FontInfo((500, 500), "normal")
+    assert info is not None and info.css_weight() == "500"
+
+
+def test_read_font_info_example_fonts():
+    fonts = path_examples("fonts", "open-sans")
+    assert read_font_info(fonts / "OpenSans-Variable.ttf") == FontInfo(
+        (300, 800), "normal"
+    )
+    assert read_font_info(fonts / "OpenSans-Variable-Italic.ttf") == FontInfo(
+        (300, 800), "italic"
+    )
+
+
+def test_read_font_info_woff(tmp_path: Path):
+    ttLib = pytest.importorskip("fontTools.ttLib")
+    font = ttLib.TTFont(
+        path_examples("fonts", "open-sans", "OpenSans-Variable-Italic.ttf")
+    )
+    font.flavor = "woff"
+    font.save(tmp_path / "font.woff")
+
+    assert read_font_info(tmp_path / "font.woff") == FontInfo(
+        (300, 800), "italic"
+    )
+
+
+def test_read_font_info_unsupported(tmp_path: Path):
+    path = tmp_path / "font.woff2"
+    path.write_bytes(b"wOF2" + b"\x00" * 64)
+    assert read_font_info(path) is None
+
+    path = tmp_path / "font.ttf"
+    path.write_bytes(sfnt({b"head": b"\x00" * 54}))
+    assert read_font_info(path) is None
+
+    assert font_info(tmp_path / "missing.ttf") is None
+
+
+def test_font_info_cached_until_file_changes(tmp_path: Path):
+    path = tmp_path / "font.ttf"
+    path.write_bytes(sfnt({b"OS/2": os2(400)}))
+    font_info_cache.clear()
+
+    info = font_info(path)
+    assert font_info(path) is info
+
+    path.write_bytes(sfnt({b"OS/2": os2(700, fs_selection=1)}))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert font_info(path) == FontInfo((700, 700), "italic")
+
+
+def test_font_face_uses_font_info_for_auto_weight(tmp_path: Path):
+    (tmp_path / "Bold.ttf").write_bytes(sfnt({b"OS/2": os2(700)}))
+    (tmp_path / "Italic.ttf").write_bytes(
+        sfnt({b"OS/2": os2(400, fs_selection=1)})
+    )
+    (tmp_path / "_brand.yml").write_text(
+        """
+        typography:
+          fonts:
+            - family: Static Sans
+              source: file
+              files:
+                - path: Bold.ttf
+                - path: Italic.ttf
+                - path: Italic.ttf
+                  weight: 400
+                  style: normal
+          headings:
+            family: Static Sans
+            weight: bold
+        """
+    )
+    brand = Brand.from_yaml(tmp_path / "_brand.yml")
+    assert isinstance(brand.typography, BrandTypography)
+    font = brand.typography.fonts[0]
+    assert isinstance(font, BrandTypographyFontFiles)
+
+    faces = font.font_faces()
+    assert [(face.weight, face.style) for face in faces] == [
+        ("700", "normal"),
+        ("400", "italic"),
+        ("400", "normal"),
+    ]
+
+    files = brand.typography.fonts_preload_files()
+    assert [str(f.path.root) for f in files] == ["Bold.ttf"]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import copy
+import pickle
+from functools import lru_cache
+
+import pytest
+from brand_yml import Brand
+from brand_yml.base import FrozenDict, FrozenList
+from pydantic import ValidationError
+from utils import path_examples
+
+
+def test_brand_freeze_is_immutable():
+    brand = Brand.from_yaml(path_examples("brand-posit.yml"))
+    frozen = brand.freeze()
+
+    assert frozen == brand
+    assert frozen is not brand
+    assert frozen.is_frozen and not brand.is_frozen
+    assert frozen.freeze() is frozen
+
+    with pytest.raises(ValidationError, match="frozen"):
+        frozen.color = None
+    assert frozen.color is not None
+    with pytest.raises(ValidationError, match="frozen"):
+        frozen.color.primary = "#EE6331"
+    assert frozen.typography is not None
+    with pytest.raises(ValidationError, match="frozen"):
+        frozen.typography.fonts[0].family = "Comic Sans"
+
+    assert isinstance(frozen.color.palette, FrozenDict)
+    with pytest.raises(TypeError, match="immutable"):
+        frozen.color.palette["blue"] = "#000000"
+    assert isinstance(frozen.typography.fonts, FrozenList)
+    with pytest.raises(TypeError, match="immutable"):
+        frozen.typography.fonts.clear()
+
+    # The snapshot doesn't follow changes to the original brand
+    assert brand.color is not None
+    brand.color.primary = "#000000"
+    assert frozen.color.primary == "#447099"
+
+
+def test_brand_freeze_still_works_as_brand():
+    frozen = Brand.from_yaml(path_examples("brand-posit.yml")).freeze()
+
+    assert frozen.color is not None
+    assert frozen.color.to_dict()["primary"] == "#447099"
+    assert frozen.typography is not None
+    assert "family=Open+Sans" in frozen.typography.fonts_css_include()
+    assert frozen.use_logo("small", alt="Posit") is not None
+
+    merged = Brand.merge(frozen, {"color": {"primary": "#EE6331"}})
+    assert merged.color is not None and merged.color.primary == "#EE6331"
+    assert not merged.is_frozen
+
+
+def test_brand_freeze_copies_are_mutable():
+    frozen = Brand.from_yaml(path_examples("brand-posit.yml")).freeze()
+
+    for other in (
+        frozen.model_copy(deep=True),
+        copy.deepcopy(frozen),
+        pickle.loads(pickle.dumps(frozen)),
+    ):
+        assert other == frozen
+        assert not other.is_frozen
+        assert other.color is not None and other.color.palette is not None
+        other.color.palette["new"] = "#000000"
+        other.color.primary = "#000000"
+
+
+def test_brand_freeze_hash():
+    brand = Brand.from_yaml(path_examples("brand-posit.yml"))
+    frozen = brand.freeze()
+
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(brand)
+
+    assert hash(frozen) == hash(brand.freeze())
+    assert frozen.content_hash() == brand.content_hash()
+    assert len(frozen.content_hash()) == 64
+    assert hash(frozen.color) == hash(brand.freeze().color)
+
+    other = Brand.from_yaml_str("color:\n  primary: red").freeze()
+    assert hash(other) != hash(frozen)
+
+    calls = []
+
+    @lru_cache
+    def theme(brand: Brand) -> str:
+        calls.append(brand)
+        assert brand.color is not None and brand.color.primary is not None
+        return brand.color.primary
+
+    assert theme(frozen) == theme(brand.freeze()) == "#447099"
+    assert len(calls) == 1
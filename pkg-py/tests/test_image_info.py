@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import os
+import struct
+from pathlib import Path
+
+import pytest
+from brand_yml import Brand
+from brand_yml._image_info import (
+    ImageInfo,
+    image_info,
+    image_info_cache,
+    read_image_info,
+)
+from brand_yml.logo import BrandLogoResource
+from utils import path_examples
+
+
+def png(width: int, height: int) -> bytes:
+    ihdr = struct.pack(">II", width, height) + b"\x08\x06\x00\x00\x00"
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + struct.pack(">I", len(ihdr))
+        + b"IHDR"
+        + ihdr
+        + b"\x00" * 4
+    )
+
+
+def jpeg(width: int, height: int) -> bytes:
+    app0 = b"JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"
+    sof0 = b"\x08" + struct.pack(">HH", height, width) + b"\x03"
+    return (
+        b"\xff\xd8"
+        + b"\xff\xe0"
+        + struct.pack(">H", len(app0) + 2)
+        + app0
+        + b"\xff\xc0"
+        + struct.pack(">H", len(sof0) + 2)
+        + sof0
+        + b"\x00" * 9
+    )
+
+
+def write(path: Path, data: bytes | str) -> Path:
+    if isinstance(data, str):
+        path.write_text(data)
+    else:
+        path.write_bytes(data)
+    return path
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (png(120, 40), ImageInfo("image/png", 120, 40)),
+        (jpeg(640, 480), ImageInfo("image/jpeg", 640, 480)),
+        (
+            b"GIF89a" + struct.pack("<HH", 16, 8) + b"\x00" * 8,
+            ImageInfo("image/gif", 16, 8),
+        ),
+        (
+            b"RIFF\x00\x00\x00\x00WEBPVP8X"
+            + b"\x00" * 8
+            + (99).to_bytes(3, "little")
+            + (49).to_bytes(3, "little"),
+            ImageInfo("image/webp", 100, 50),
+        ),
+        (
+            b"RIFF\x00\x00\x00\x00WEBPVP8L\x00\x00\x00\x00\x2f"
+            + ((200 - 1) | ((100 - 1) << 14)).to_bytes(4, "little"),
+            ImageInfo("image/webp", 200, 100),
+        ),
+        (
+            '<?xml version="1.0"?>\n<!-- logo -->\n'
+            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 300 100">'
+            "</svg>",
+            ImageInfo("image/svg+xml", 300, 100),
+        ),
+        (
+            '<svg width="150px" viewBox="0,0,300,100"></svg>',
+            ImageInfo("image/svg+xml", 150, 50),
+        ),
+        (
+            '<svg width="100%" height="100%"></svg>',
+            ImageInfo("image/svg+xml", None, None),
+        ),
+        (b"not an image", None),
+    ],
+)
+def test_read_image_info(tmp_path: Path, data: bytes | str, expected):
+    path = write(tmp_path / "image", data)
+    assert read_image_info(path) == expected
+
+
+def test_image_info_example_svg():
+    info = image_info(path_examples("logos", "pandas", "pandas.svg"))
+    assert info == ImageInfo("image/svg+xml", 818.63, 331.21)
+    assert info.html_size() == {"width": "819", "height": "331"}
+
+
+def test_image_info_cached_until_file_changes(tmp_path: Path):
+    path = write(tmp_path / "logo.png", png(10, 10))
+    image_info_cache.clear()
+
+    info = image_info(path)
+    assert info == ImageInfo("image/png", 10, 10)
+    assert image_info(path) is info
+
+    write(path, png(20, 10))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert image_info(path) == ImageInfo("image/png", 20, 10)
+
+    path.unlink()
+    assert image_info(path) is None
+
+
+def test_logo_to_html_includes_size(tmp_path: Path):
+    write(tmp_path / "logo.png", png(120, 40))
+    write(tmp_path / "_brand.yml", "logo: logo.png")
+    brand = Brand.from_yaml(tmp_path / "_brand.yml")
+    assert isinstance(brand.logo, BrandLogoResource)
+
+    html = str(brand.logo.to_html())
+    assert 'width="120"' in html
+    assert 'height="40"' in html
+    assert "data:image/png;base64," in html
+
+    # A size set by the user is kept as-is
+    html = str(brand.logo.to_html(width="60"))
+    assert 'width="60"' in html
+    assert "height=" not in html
+
+    # Markdown output is unchanged
+    assert "width" not in brand.logo.to_markdown()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from brand_yml import Brand, BrandSpan, instrument
+from brand_yml._instrument import span
+from brand_yml.logo import BrandLogoResource
+from utils import path_examples
+
+
+def test_instrument_reports_spans_to_callback():
+    spans: list[BrandSpan] = []
+
+    with instrument(spans.append):
+        brand = Brand.from_yaml(path_examples("brand-logo-single.yml"))
+        assert isinstance(brand.logo, BrandLogoResource)
+        brand.logo.to_html()
+
+    names = [s.name for s in spans]
+    assert names[:3] == [
+        "yaml.load",
+        "Brand._set_root_path",
+        "Brand.model_validate",
+    ]
+    assert "BrandLogoResource._maybe_base64_encode_image" in names
+    assert all(s.duration >= 0 for s in spans)
+    assert spans[0].attributes["path"].endswith("brand-logo-single.yml")
+
+    # Stopped at the end of the `with` block
+    n_spans = len(spans)
+    Brand.from_yaml(path_examples("brand-logo-single.yml"))
+    assert len(spans) == n_spans
+
+
+def test_instrument_find_project_brand_yml(tmp_path: Path):
+    (tmp_path / "_brand.yml").write_text("meta:\n  name: Test")
+    spans: list[BrandSpan] = []
+
+    with instrument(spans.append):
+        Brand.from_yaml(tmp_path)
+
+    assert [s.name for s in spans][:2] == [
+        "find_project_brand_yml",
+        "yaml.load",
+    ]
+
+
+def test_instrument_start_stop():
+    spans: list[BrandSpan] = []
+
+    handle = instrument(spans.append)
+    Brand.from_yaml_str("color:\n  primary: red")
+    handle.stop()
+    Brand.from_yaml_str("color:\n  primary: red")
+
+    assert [s.name for s in spans] == [
+        "yaml.load",
+        "defs_replace_recursively",
+        "Brand.model_validate",
+    ]
+
+
+def test_instrument_disabled_is_noop():
+    assert span("a") is span("b")
+
+
+def test_instrument_records_errors():
+    spans: list[BrandSpan] = []
+
+    with instrument(spans.append):
+        with pytest.raises(ValueError):
+            with span("failing", x=1):
+                raise ValueError("boom")
+
+    assert len(spans) == 1
+    assert spans[0].attributes == {"x": 1}
+    assert isinstance(spans[0].error, ValueError)
+
+
+def test_instrument_logs(caplog: pytest.LogCaptureFixture):
+    with caplog.at_level(logging.INFO, logger="brand_yml"):
+        with instrument(log=logging.INFO):
+            Brand.from_yaml_str("meta:\n  name: Test")
+
+    assert "yaml.load took" in caplog.text
+    assert "Brand.model_validate took" in caplog.text
+
+
+def test_instrument_tracer():
+    started: list[tuple[str, dict]] = []
+    ended: list[str] = []
+
+    class Tracer:
+        @contextmanager
+        def start_as_current_span(self, name, attributes=None):
+            started.append((name, attributes))
+            yield
+            ended.append(name)
+
+    with instrument(tracer=Tracer()):
+        with span("outer", path="x"):
+            with span("inner"):
+                pass
+
+    assert started == [("outer", {"path": "x"}), ("inner", {})]
+    assert ended == ["inner", "outer"]
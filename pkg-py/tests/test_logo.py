@@ -5,7 +5,13 @@ from pathlib import Path
 import pytest
 from brand_yml import Brand
 from brand_yml._defs import BrandLightDark
-from brand_yml._use_logo import BrandLogoMissingError
+from brand_yml._use_logo import (
+    USE_LOGO_VARIANTS,
+    BrandLogoMissingError,
+    LogoMissing,
+    logo_resolution_table,
+    resolve_logo_entry,
+)
 from brand_yml.file import FileLocation, FileLocationLocal
 from brand_yml.logo import (
     BrandLogo,
@@ -725,6 +731,187 @@ class TestUseLogoAttrsAndFormatting:
         assert hasattr(logo_ld, "tagify")
 
 
+class TestUseLogoMemoized:
+    """Test that use_logo() results are memoized and shared"""
+
+    @pytest.fixture
+    def brand(self):
+        return Brand.from_yaml_str("""
+        logo:
+          small: small.png
+          medium:
+            light: medium-light.png
+            dark: medium-dark.png
+        """)
+
+    def test_use_logo_returns_shared_results(self, brand):
+        one = brand.use_logo("small", variant="light-dark", width="100")
+        two = brand.use_logo("small", variant="light-dark", width="100")
+        assert isinstance(one, BrandLogoResourceLightDark)
+        assert one is two
+
+        # Different arguments, different results
+        assert brand.use_logo("small", variant="light-dark") is not one
+        assert brand.use_logo("small", width="200") is not one
+
+        # Promoted light/dark wrapper is reused too
+        promoted = brand.use_logo("small", variant="light-dark")
+        assert brand.use_logo("small", variant="light-dark") is promoted
+        assert promoted.light is brand.logo.small
+
+    def test_use_logo_shared_results_are_immutable(self, brand):
+        logo = brand.use_logo("medium", class_="navbar-logo")
+        assert isinstance(logo, BrandLogoResourceLightDark)
+        assert logo.light is not None and logo.light.attrs is not None
+
+        with pytest.raises(ValueError, match="frozen"):
+            logo.light = None
+        with pytest.raises(TypeError, match="immutable"):
+            logo.light.attrs["class"] = "other"
+
+        # Resources from the brand are returned as-is and stay mutable
+        medium = brand.use_logo("medium")
+        assert medium is brand.logo.medium
+        medium.light = None
+        assert brand.logo.medium.light is None
+
+        # ... and changing them drops the memoized results
+        dark = brand.use_logo("medium", class_="navbar-logo")
+        assert isinstance(dark, BrandLogoResource)
+        assert str(dark.path) == "medium-dark.png"
+        assert dark.attrs == {"class": "navbar-logo"}
+        assert brand.use_logo("medium", "light", allow_fallback=False) is None
+
+    def test_use_logo_cache_invalidated(self, brand):
+        small = brand.use_logo("small", width="100")
+        assert isinstance(small, BrandLogoResource)
+
+        brand.logo = {"small": "other.png"}
+        other = brand.use_logo("small", width="100")
+        assert isinstance(other, BrandLogoResource)
+        assert str(other.path) == "other.png"
+
+        brand.logo.small = BrandLogoResource(path="third.png")
+        third = brand.use_logo("small", width="100")
+        assert isinstance(third, BrandLogoResource)
+        assert str(third.path) == "third.png"
+
+    def test_use_logo_memo_skips_names_added_in_place(self, brand):
+        brand.logo.images = {}
+        assert brand.use_logo("mark", required=False) is None
+
+        mark = BrandLogoResource(path="mark.png")
+        brand.logo.images["mark"] = mark
+        assert brand.use_logo("mark", required=False) is mark
+
+        # Not memoized, so later in-place changes show up too
+        other = BrandLogoResource(path="other-mark.png")
+        brand.logo.images["mark"] = other
+        assert brand.use_logo("mark", required=False) is other
+
+
+class TestUseLogoResolutionTable:
+    """Test the precomputed use_logo() resolution table"""
+
+    @pytest.mark.parametrize(
+        "logo_yaml",
+        [
+            "logo: single.png",
+            "logo:\n  small: small.png\n  large: large.png",
+            """
+logo:
+  images:
+    mark: mark.png
+    mark-white: mark-white.png
+    smallest: tiny.png
+  small: mark
+  medium:
+    light: mark
+  large:
+    light: large.png
+    dark: large-white.png
+""",
+        ],
+    )
+    def test_resolution_table_matches_decision_table(self, logo_yaml):
+        brand = Brand.from_yaml_str(logo_yaml)
+        assert brand.logo is not None
+        table = logo_resolution_table(brand.logo)
+        assert logo_resolution_table(brand.logo) is table
+
+        names = {"small", "medium", "large", "smallest", "largest", "other"}
+        if isinstance(brand.logo, BrandLogo) and brand.logo.images:
+            names.update(brand.logo.images)
+
+        for name in names:
+            for variant in USE_LOGO_VARIANTS:
+                for allow_fallback in (True, False):
+                    expected = resolve_logo_entry(
+                        brand.logo, name, variant, allow_fallback
+                    )
+                    key = (name, variant, allow_fallback)
+                    if name == "other":
+                        assert key not in table
+                        assert isinstance(expected, LogoMissing)
+                    else:
+                        assert table[key] == expected
+
+    def test_resolution_table_invalidated(self):
+        brand = Brand.from_yaml_str("logo:\n  small: small.png")
+        assert isinstance(brand.logo, BrandLogo)
+        table = logo_resolution_table(brand.logo)
+
+        brand.logo.medium = BrandLogoResource(path="medium.png")
+        assert logo_resolution_table(brand.logo) is not table
+        medium = brand.use_logo("medium")
+        assert isinstance(medium, BrandLogoResource)
+        assert str(medium.path) == "medium.png"
+
+    @pytest.fixture
+    def brand(self):
+        return Brand.from_yaml_str("""
+        logo:
+          medium:
+            light: medium-light.png
+            dark: medium-dark.png
+        """)
+
+    def test_resolution_table_invalidated_by_nested_assignment(self, brand):
+        assert isinstance(brand.logo, BrandLogo)
+        assert isinstance(brand.logo.medium, BrandLogoResourceLightDark)
+        light = brand.use_logo("medium", "light")
+        assert isinstance(light, BrandLogoResource)
+        assert str(light.path) == "medium-light.png"
+
+        brand.logo.medium.light = BrandLogoResource(path="new-light.png")
+        light = brand.use_logo("medium", "light")
+        assert isinstance(light, BrandLogoResource)
+        assert str(light.path) == "new-light.png"
+
+    def test_resolution_table_invalidated_by_nested_removal(self, brand):
+        assert isinstance(brand.logo, BrandLogo)
+        assert isinstance(brand.logo.medium, BrandLogoResourceLightDark)
+        assert brand.use_logo("medium", "light") is not None
+        assert isinstance(brand.use_logo("medium"), BrandLogoResourceLightDark)
+
+        brand.logo.medium.light = None
+        assert brand.use_logo("medium", "light") is None
+        dark = brand.use_logo("medium")
+        assert isinstance(dark, BrandLogoResource)
+        assert str(dark.path) == "medium-dark.png"
+
+    def test_resolution_table_miss_resolves_image(self, brand):
+        assert isinstance(brand.logo, BrandLogo)
+        with pytest.raises(BrandLogoMissingError):
+            brand.use_logo("x")
+
+        brand.logo.images = {}
+        assert brand.logo.images is not None
+        brand.logo.images["x"] = BrandLogoResource(path="x.png")
+        x = brand.use_logo("x")
+        assert x is brand.logo.images["x"]
+
+
 class TestUseLogoPathResolution:
     """Test path resolution"""
 
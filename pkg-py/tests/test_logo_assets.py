@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+from brand_yml import Brand
+from brand_yml.logo import BrandLogoResource, BrandLogoResourceLightDark
+from htmltools import HTMLDependency
+from utils import path_examples
+
+
+def test_logos_write_assets(tmp_path: Path):
+    brand = Brand.from_yaml(path_examples("brand-logo-light-dark.yml"))
+
+    out = brand.logos_write_assets(tmp_path / "logos")
+    assert out == tmp_path / "logos"
+
+    files = sorted(p.name for p in out.iterdir())
+    assert [name.rsplit("-", 1)[0] for name in files] == [
+        "pandas",
+        "pandas_mark",
+        "pandas_secondary",
+        "pandas_secondary_white",
+    ]
+    assert all(
+        len(name.rsplit("-", 1)[1]) == len("0123456789ab.svg") for name in files
+    )
+
+    # Writing again doesn't change anything
+    mtimes = {p: p.stat().st_mtime_ns for p in out.iterdir()}
+    brand.logos_write_assets(out)
+    assert {p: p.stat().st_mtime_ns for p in out.iterdir()} == mtimes
+
+
+def test_logos_write_assets_no_local_logos(tmp_path: Path):
+    brand = Brand.from_yaml_str("logo: https://example.com/logo.png")
+    assert brand.logos_write_assets(tmp_path / "logos") is None
+    assert brand.logos_html_dependency(tmp_path / "logos") is None
+    assert not (tmp_path / "logos").exists()
+
+
+def test_logo_to_html_with_assets_url(tmp_path: Path):
+    brand = Brand.from_yaml(path_examples("brand-logo-light-dark.yml"))
+    brand.logos_write_assets(tmp_path)
+
+    logo = brand.use_logo("medium")
+    assert isinstance(logo, BrandLogoResourceLightDark)
+    assert isinstance(logo.light, BrandLogoResource)
+    assert isinstance(logo.dark, BrandLogoResource)
+
+    light_name = logo.light.asset_name()
+    dark_name = logo.dark.asset_name()
+    assert (tmp_path / light_name).exists()
+    assert (tmp_path / dark_name).exists()
+
+    html = logo.to_str("html", assets_url="static/logos/")
+    assert f'src="static/logos/{light_name}"' in html
+    assert f'src="static/logos/{dark_name}"' in html
+    assert "data:" not in html
+
+    md = logo.to_markdown(assets_url="static/logos")
+    assert f"![](static/logos/{light_name})" in md
+
+    # Data URIs are still used by default
+    assert "data:image/svg+xml" in logo.to_str("html")
+
+
+def test_logo_asset_name_follows_content(tmp_path: Path):
+    src = path_examples("logos", "pandas", "pandas_mark.svg")
+    shutil.copyfile(src, tmp_path / "logo.svg")
+    logo = BrandLogoResource.model_validate({"path": "logo.svg"})
+    logo.path.set_root_dir(tmp_path)
+
+    name = logo.asset_name()
+    assert name is not None and name.startswith("logo-")
+
+    (tmp_path / "logo.svg").write_text("<svg></svg>")
+    assert logo.asset_name() != name
+
+    url = BrandLogoResource.model_validate(
+        {"path": "https://example.com/a.png"}
+    )
+    assert url.asset_name() is None
+
+
+def test_logos_html_dependency(tmp_path: Path):
+    brand = Brand.from_yaml(path_examples("brand-logo-light-dark.yml"))
+    dep = brand.logos_html_dependency(tmp_path)
+
+    assert isinstance(dep, HTMLDependency)
+    assert dep.name == "brand-logos"
+    assert dep.source == {"subdir": str(tmp_path.resolve())}
+    assert any(tmp_path.iterdir())
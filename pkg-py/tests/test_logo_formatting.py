@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+from pathlib import Path
+
 import htmltools
 import pytest
 from brand_yml import Brand
@@ -278,3 +281,68 @@ class TestFormattingIntegration:
 
         assert isinstance(html, htmltools.Tag)
         assert html.get_dependencies() == [html_dep_brand_light_dark()]
+
+
+class TestLogoRenderCache:
+    """Test that rendered HTML and markdown strings are cached"""
+
+    @pytest.fixture
+    def local_brand(self, tmp_path: Path):
+        (tmp_path / "light.svg").write_text("<svg>light</svg>")
+        (tmp_path / "dark.svg").write_text("<svg>dark</svg>")
+        (tmp_path / "_brand.yml").write_text(
+            "logo:\n"
+            "  small: light.svg\n"
+            "  medium:\n"
+            "    light: light.svg\n"
+            "    dark: dark.svg\n"
+        )
+        return Brand.from_yaml(tmp_path / "_brand.yml")
+
+    def test_html_dependency_is_shared(self):
+        assert html_dep_brand_light_dark() is html_dep_brand_light_dark()
+
+    def test_repeated_renders_are_reused(self, local_brand):
+        logo = local_brand.logo.small
+        assert isinstance(logo, BrandLogoResource)
+
+        html = logo.to_str("html", width="100")
+        assert logo.to_str("html", width="100") is html
+        assert html == str(logo.to_html(width="100"))
+        assert logo._repr_html_() is logo.to_str("html")
+
+        md = logo.to_markdown(width="100")
+        assert logo.to_markdown(width="100") is md
+        assert logo.to_str("markdown", width="100") is md
+        assert logo.to_markdown(width="200") != md
+
+    def test_light_dark_renders_are_reused(self, local_brand):
+        logo = local_brand.logo.medium
+        assert isinstance(logo, BrandLogoResourceLightDark)
+
+        html = logo.to_str("html")
+        assert logo.to_str("html") is html
+        assert html == str(logo.to_html())
+
+        md = logo.to_markdown()
+        assert logo.to_markdown() is md
+
+        # Light/dark renders don't collide with the light image's own renders
+        assert local_brand.logo.small.to_markdown() != md
+
+        logo.dark = None
+        assert logo.to_markdown() != md
+        assert ".dark-content" not in logo.to_markdown()
+
+    def test_changed_file_is_rendered_again(self, local_brand, tmp_path):
+        logo = local_brand.logo.small
+        assert isinstance(logo, BrandLogoResource)
+        md = logo.to_markdown()
+
+        path = tmp_path / "light.svg"
+        path.write_text("<svg>light, but changed</svg>")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert logo.to_markdown() != md
+        assert logo.to_markdown() == logo.to_markdown()
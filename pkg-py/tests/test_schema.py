@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from brand_yml import Brand, BrandSchemaError
+from brand_yml._schema import (
+    BrandSchemaIssue,
+    brand_schema_errors,
+    brand_schema_validator,
+    normalize_schema,
+)
+from brand_yml._utils_yaml import yaml_brand as yaml
+from utils import path_examples
+
+pytest.importorskip("jsonschema")
+
+
+def test_normalize_schema_quarto_object():
+    schema = {
+        "anyOf": [
+            {"type": "string"},
+            {"object": {"properties": {"a": {"object": {"properties": {}}}}}},
+        ]
+    }
+    assert normalize_schema(schema) == {
+        "anyOf": [
+            {"type": "string"},
+            {
+                "type": "object",
+                "properties": {"a": {"type": "object", "properties": {}}},
+            },
+        ]
+    }
+
+
+def test_brand_schema_validator_is_compiled_once():
+    assert brand_schema_validator() is brand_schema_validator()
+
+
+@pytest.mark.parametrize(
+    "path",
+    sorted(path_examples().glob("*.yml")),
+    ids=lambda path: path.name,
+)
+def test_brand_schema_accepts_examples(path: Path):
+    assert brand_schema_errors(yaml.load(path.read_text())) == []
+
+
+def test_brand_schema_reports_all_errors():
+    data = {
+        "meta": 4,
+        "logo": {"images": {"mark": {"alt": "no path"}}},
+        "color": {"palette": {"red": ["#f00"]}, "primary": 5},
+        "typography": {
+            "fonts": [{"family": "Open Sans", "source": "nope"}],
+            "headings": {"weight": {"bold": True}},
+        },
+    }
+
+    errors = brand_schema_errors(data)
+    assert [error.path for error in errors] == [
+        "color.palette.red",
+        "color.primary",
+        "logo.images.mark",
+        "meta",
+        "typography.fonts[0]",
+        "typography.headings.weight",
+    ]
+    assert errors[1] == BrandSchemaIssue(
+        "color.primary", "5 is not of type 'string'"
+    )
+
+
+def test_brand_from_yaml_validate_schema(tmp_path: Path):
+    path = tmp_path / "_brand.yml"
+    path.write_text(
+        """
+        meta:
+          name: [Not, a, name]
+        color:
+          primary: 5
+        """
+    )
+
+    with pytest.raises(BrandSchemaError) as exc:
+        Brand.from_yaml(path, validate_schema=True)
+
+    assert isinstance(exc.value, ValueError)
+    assert exc.value.path == path
+    assert [error.path for error in exc.value.errors] == [
+        "color.primary",
+        "meta.name",
+    ]
+    assert str(exc.value).startswith(f"2 schema errors in {str(path)!r}:")
+
+
+def test_brand_from_yaml_str_validate_schema():
+    brand = Brand.from_yaml_str(
+        """
+        logo: posit.png
+        color:
+          primary: blue
+        """,
+        validate_schema=True,
+    )
+    assert brand.color is not None
+    assert brand.color.primary == "blue"
+
+    with pytest.raises(BrandSchemaError):
+        Brand.from_yaml_str("color: red", validate_schema=True)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import base64
+import os
+from pathlib import Path
+from urllib.parse import unquote
+
+import pytest
+from brand_yml import Brand
+from brand_yml._svg import minify_svg, svg_data_uri, svg_data_uri_cache
+from brand_yml.logo import BrandLogoResource
+from utils import path_examples
+
+
+def test_minify_svg_removes_editor_data():
+    svg = """<?xml version="1.0" encoding="UTF-8"?>
+<!-- Created with an editor -->
+<svg
+   xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd"
+   xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"
+   xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+   xmlns:xlink="http://www.w3.org/1999/xlink"
+   xmlns="http://www.w3.org/2000/svg"
+   viewBox="0.00 0 100.50 50"
+   inkscape:version="1.0">
+  <metadata><rdf:RDF><rdf:Description /></rdf:RDF></metadata>
+  <sodipodi:namedview id="base" pagecolor="#ffffff" />
+  <path   d="M 0.500,10.0 L -0.25 1.0e3 Z"   fill="#130754" />
+  <use xlink:href="#a" x="010.10" />
+</svg>
+"""
+    assert minify_svg(svg) == (
+        '<svg xmlns:xlink="http://www.w3.org/1999/xlink"'
+        ' xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100.5 50">'
+        '<path d="M .5,10 L -.25 1.0e3 Z" fill="#130754"/>'
+        '<use xlink:href="#a" x="10.1"/>'
+        "</svg>"
+    )
+
+
+def test_minify_svg_keeps_text_whitespace():
+    svg = '<svg>\n  <text x="1.50"><tspan>a</tspan> <tspan>b</tspan></text>\n</svg>'
+    assert minify_svg(svg) == (
+        '<svg>\n  <text x="1.5"><tspan>a</tspan> <tspan>b</tspan></text>\n</svg>'
+    )
+
+
+def test_minify_svg_only_shortens_numeric_attributes():
+    svg = '<svg><a href="https://example.com/v1.10/logo"><rect width="1.0"/></a></svg>'
+    assert minify_svg(svg) == (
+        '<svg><a href="https://example.com/v1.10/logo"><rect width="1"/></a></svg>'
+    )
+
+
+def test_minify_svg_keeps_quoted_values():
+    svg = """<svg>
+  <rect title="a  =  b" class=" x  y " width=" 1.50  2 " />
+</svg>"""
+    assert minify_svg(svg) == (
+        '<svg><rect title="a  =  b" class=" x  y " width="1.5 2"/></svg>'
+    )
+
+
+def test_minify_svg_keeps_script_style_and_cdata():
+    script = (
+        "<script>if (a < b && c > d) { x = '<g  a = 1><!-- k -->' }</script>"
+    )
+    style = "<style>\n  rect  >  g { fill : red }\n</style>"
+    cdata = "<![CDATA[ <rect  x = 1 > ]]>"
+    svg = f'<svg>\n  {script}\n  {style}\n  <g>{cdata}</g>\n  <rect  x="1.0" />\n</svg>'
+    assert minify_svg(svg) == (
+        f'<svg>{script}{style}<g>{cdata}</g><rect x="1"/></svg>'
+    )
+
+
+def test_svg_data_uri_round_trip():
+    svg = '<svg xmlns="http://www.w3.org/2000/svg"><path d="M0 0h1" fill="#fff"/></svg>'
+
+    html = svg_data_uri(svg)
+    assert html.startswith("data:image/svg+xml,%3Csvg ")
+    assert '"' not in html and "'" not in html and "#" not in html
+    assert unquote(html.split(",", 1)[1]) == svg
+
+    md = svg_data_uri(svg, markdown=True)
+    assert " " not in md
+    assert unquote(md.split(",", 1)[1]) == svg.replace('"', "'")
+
+
+@pytest.mark.parametrize("name", ["pandas.svg", "pandas_mark.svg"])
+def test_svg_logo_is_smaller_than_base64(
+    name: str, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("BRAND_YML_SVG_MINIFY", "true")
+    path = path_examples("logos", "pandas", name)
+    b64 = base64.b64encode(path.read_bytes()).decode("ascii")
+
+    logo = BrandLogoResource.model_validate({"path": f"logos/pandas/{name}"})
+    logo.path.set_root_dir(path_examples())
+
+    html = logo.to_str("html")
+    assert "data:image/svg+xml," in html
+    assert unquote(html).count("<svg") == 1
+    assert len(html) < len(b64)
+    assert len(logo.to_markdown()) < len(b64)
+
+
+def test_svg_minify_is_opt_in(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    svg = '<svg xmlns="http://www.w3.org/2000/svg">\n  <!-- note -->\n</svg>'
+    (tmp_path / "logo.svg").write_text(svg)
+    (tmp_path / "_brand.yml").write_text("logo: logo.svg")
+    brand = Brand.from_yaml(tmp_path / "_brand.yml")
+    assert isinstance(brand.logo, BrandLogoResource)
+
+    assert "note" in brand.logo.to_str("html")
+
+    monkeypatch.setenv("BRAND_YML_SVG_MINIFY", "true")
+    assert "note" not in brand.logo.to_str("html")
+
+
+def test_svg_data_uri_cached_until_file_changes(tmp_path: Path):
+    path = tmp_path / "logo.svg"
+    path.write_text("<svg><!-- one --></svg>")
+    svg_data_uri_cache.clear()
+
+    uri = svg_data_uri_cache.get(path)
+    assert svg_data_uri_cache.get(path) is uri
+    assert "one" in unquote(uri)
+    assert "one" not in unquote(svg_data_uri_cache.get(path, minify=True))
+
+    path.write_text("<svg><rect/></svg>")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert unquote(svg_data_uri_cache.get(path)) == (
+        "data:image/svg+xml,<svg><rect/></svg>"
+    )
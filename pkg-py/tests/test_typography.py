@@ -1,16 +1,29 @@
 from __future__ import annotations
 
+import hashlib
+import logging
+import os
 import re
+import shutil
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from urllib.parse import unquote
 
 import pytest
-from brand_yml import Brand
+from brand_yml import Brand, _font_tools
+from brand_yml._font_tools import (
+    FontToolsCache,
+    font_cache_dir,
+    font_tools_cache,
+)
 from brand_yml._utils import maybe_default_font_source
 from brand_yml.color import BrandColor
 from brand_yml.file import FileLocationLocal
 from brand_yml.typography import (
+    FONT_SUBSET_RANGES,
+    BrandFontSubsetError,
     BrandTypography,
     BrandTypographyBase,
     BrandTypographyFontBunny,
@@ -19,6 +32,7 @@ from brand_yml.typography import (
     BrandTypographyFontFileWeight,
     BrandTypographyFontGoogle,
     BrandTypographyGoogleFontsApi,
+    BrandTypographyGoogleFontsWeight,
     BrandTypographyGoogleFontsWeightRange,
     BrandTypographyHeadings,
     BrandTypographyLink,
@@ -38,6 +52,15 @@ def snapshot_json(snapshot):
     return snapshot.use_extension(JSONSnapshotExtension)
 
 
+@pytest.fixture(autouse=True)
+def brand_yml_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("BRAND_YML_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
 @pytest.mark.parametrize(
     "path, fmt",
     [
@@ -672,6 +695,130 @@ def test_brand_typography_css_fonts(snapshot):
     assert snapshot == brand.typography.fonts_css_include()
 
 
+def test_brand_typography_to_css(snapshot):
+    brand = Brand.from_yaml(path_examples("brand-typography-fonts.yml"))
+
+    assert isinstance(brand.typography, BrandTypography)
+    assert snapshot == brand.typography.to_css()
+
+
+def test_brand_typography_to_css_monospace_sizes(snapshot):
+    brand = Brand.from_yaml_str(
+        """
+        typography:
+          monospace:
+            family: Fira Code
+            size: 0.9em
+          monospace-block:
+            line-height: 1.4
+        """
+    )
+    assert isinstance(brand.typography, BrandTypography)
+
+    # `code` in `pre` doesn't scale the block's 0.9em again
+    css = brand.typography.to_css()
+    assert "pre code,pre kbd,pre samp{font-size:inherit}" in css
+    assert snapshot == css
+
+
+def test_brand_typography_to_css_properties():
+    brand = Brand.from_yaml_str(
+        """
+        color:
+          primary: "#447099"
+          palette:
+            blue: "#0000ff"
+        typography:
+          base:
+            family: Open Sans
+            size: 18px
+            line-height: 1.5
+          headings:
+            weight: semi-bold
+            style: italic
+            color: primary
+          monospace-inline:
+            size: 0.9em
+            color: blue
+            background-color: "#eeeeee"
+          link:
+            decoration: underline
+        """
+    )
+    assert isinstance(brand.typography, BrandTypography)
+
+    css = brand.typography.to_css()
+    assert "\n" not in css
+    assert (
+        ":root{--brand-typography-base-family:'Open Sans';"
+        + "--brand-typography-base-size:1.125rem;"
+        + "--brand-typography-base-line-height:1.5;"
+        + "--brand-typography-headings-weight:600;"
+        + "--brand-typography-headings-style:italic;"
+        + "--brand-typography-headings-color:#447099;"
+    ) in css
+    assert "--brand-typography-monospace-inline-size:0.9em;" in css
+    assert "--brand-typography-monospace-inline-color:#0000ff;" in css
+    assert (
+        "body{font-family:var(--brand-typography-base-family);"
+        + "font-size:var(--brand-typography-base-size);"
+        + "line-height:var(--brand-typography-base-line-height)}"
+    ) in css
+    assert ("a{text-decoration:var(--brand-typography-link-decoration)}") in css
+    assert "pre{" not in css
+    assert "pre code" not in css
+
+
+def test_brand_typography_to_css_values():
+    brand = Brand.from_yaml_str(
+        """
+        typography:
+          base:
+            family: Tom's Sans
+          headings:
+            style: [italic]
+        """
+    )
+    assert isinstance(brand.typography, BrandTypography)
+
+    css = brand.typography.to_css()
+    assert "--brand-typography-base-family:'Tom\\'s Sans';" in css
+    assert "--brand-typography-headings-style:italic}" in css
+
+    brand = Brand.from_yaml_str(
+        """
+        typography:
+          headings:
+            style: [normal, italic]
+        """
+    )
+    assert isinstance(brand.typography, BrandTypography)
+
+    with pytest.raises(ValueError, match="headings.style"):
+        brand.typography.to_css()
+
+
+def test_brand_typography_to_css_is_cached():
+    brand = Brand.from_yaml_str(
+        """
+        typography:
+          base: Open Sans
+          headings:
+            weight: bold
+        """
+    )
+    assert isinstance(brand.typography, BrandTypography)
+    assert isinstance(brand.typography.headings, BrandTypographyHeadings)
+
+    css = brand.typography.to_css()
+    assert brand.typography.to_css() is css
+
+    brand.typography.headings.weight = 300
+    assert "--brand-typography-headings-weight:300" in brand.typography.to_css()
+
+    assert BrandTypography().to_css() == ""
+
+
 def test_brand_typography_css_fonts_local(snapshot):
     fw = BrandTypographyFontFileWeight.model_validate("400..800")
     assert str(fw) == "400 800"
@@ -785,6 +932,388 @@ def test_brand_typography_write_font_css():
             assert f.read() == brand.typography.fonts_css_include()
 
 
+def test_brand_typography_fonts_css_include_is_cached(tmp_path: Path):
+    shutil.copytree(path_examples("fonts"), tmp_path / "fonts")
+    shutil.copy(
+        path_examples("brand-typography-fonts.yml"), tmp_path / "_brand.yml"
+    )
+    brand = Brand.from_yaml(tmp_path / "_brand.yml")
+    typography = brand.typography
+    assert isinstance(typography, BrandTypography)
+
+    css = typography.fonts_css_include()
+    assert typography.fonts_css_include() is css
+
+    # Assigning `fonts` drops the cached CSS
+    typography.fonts = typography.fonts[:1]
+    css_one = typography.fonts_css_include()
+    assert css_one != css
+    assert "@import" not in css_one
+
+    # So do changes to nested models
+    font = typography.fonts[0]
+    assert isinstance(font, BrandTypographyFontFiles)
+    font.files[0].style = "italic"
+    assert typography.fonts_css_include().count("font-style: italic") == 2
+
+    # And changes to local font files, whose weight is read from the file
+    css = typography.fonts_css_include()
+    assert "font-weight: auto" not in css
+    font_file = tmp_path / "fonts" / "open-sans" / "OpenSans-Variable.ttf"
+    font_file.write_bytes(b"not a font")
+    stat = font_file.stat()
+    os.utime(font_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert "font-weight: auto" in typography.fonts_css_include()
+
+
+def test_brand_typography_fonts_css_include_cache_is_per_brand():
+    brand = Brand.from_yaml(path_examples("brand-typography-fonts.yml"))
+    typography = brand.typography
+    assert isinstance(typography, BrandTypography)
+    css = typography.fonts_css_include()
+    to_css = typography.to_css()
+
+    # Loading or modifying another brand keeps the cached CSS
+    other = Brand.from_yaml(path_examples("brand-typography-fonts.yml"))
+    assert other.typography is not None
+    other.typography.fonts = []
+    assert typography.fonts_css_include() is css
+    assert typography.to_css() is to_css
+
+    # Changes to models nested in the typography drop it
+    font = typography.fonts[0]
+    assert isinstance(font, BrandTypographyFontFiles)
+    font.files[0].path = FileLocationLocal(root="fonts/other/Other.ttf")
+    assert "fonts/other/Other.ttf" in typography.fonts_css_include()
+    assert "fonts/other/Other.ttf" in typography.to_css()
+
+    # ... and so does the brand's fingerprint
+    fingerprint = brand.fingerprint()
+    font.files[0].style = "italic"
+    assert brand.fingerprint() != fingerprint
+
+
+def test_brand_typography_google_import_url_is_cached():
+    font = BrandTypographyFontGoogle.model_validate(
+        {"family": "Roboto", "weight": [400, 700]}
+    )
+    url = font.to_import_url()
+    assert font.to_import_url() is url
+
+    font.display = "swap"
+    assert font.to_import_url() != url
+    assert "display=swap" in font.to_import_url()
+
+    font.version = 1
+    assert "css?family=Roboto" in font.to_import_url()
+
+    url = font.to_import_url()
+    assert isinstance(font.weight, BrandTypographyGoogleFontsWeight)
+    font.weight.root = [300, 500]
+    assert font.to_import_url() != url
+
+
+def test_brand_typography_fonts_css_include_plans_font_faces():
+    brand = Brand.from_yaml_str(
+        """
+        typography:
+          fonts:
+            - family: Variable Sans
+              source: file
+              files:
+                - path: https://example.com/Variable-Sans.woff2
+                  weight: 300
+                - path: https://example.com/Variable-Sans.woff2
+                  weight: bold
+                - path: https://example.com/Variable-Sans.woff2
+                  weight: 100..500
+                - path: https://example.com/Variable-Sans-Italic.woff2
+                  style: italic
+            - family: Variable Sans
+              source: file
+              files:
+                - path: https://example.com/Variable-Sans-Italic.woff2
+                  style: italic
+            - family: Empty Sans
+              source: file
+            - family: Roboto
+              source: google
+            - family: Roboto
+              source: google
+            - family: Helvetica
+              source: system
+        """
+    )
+    assert isinstance(brand.typography, BrandTypography)
+
+    css = brand.typography.fonts_css_include()
+    assert css.count("@import") == 1
+    assert css.count("@font-face") == 2
+    assert css.index("@import") < css.index("@font-face")
+    assert "Empty Sans" not in css and "Helvetica" not in css
+    assert (
+        "  font-family: 'Variable Sans';\n"
+        + "  font-weight: 100 700;\n"
+        + "  font-style: normal;\n"
+        + "  src: url('https://example.com/Variable-Sans.woff2') "
+        + "format('woff2');\n"
+    ) in css
+    assert "font-weight: auto;\n  font-style: italic;" in css
+
+
+def test_brand_typography_fonts_preload_files():
+    brand = Brand.from_yaml_str(
+        """
+        typography:
+          fonts:
+            - family: Closed Sans
+              source: file
+              files:
+                - path: https://example.com/Closed-Sans-Light.woff2
+                  weight: light
+                - path: https://example.com/Closed-Sans-Regular.woff2
+                - path: https://example.com/Closed-Sans-Bold.woff2
+                  weight: bold
+                - path: https://example.com/Closed-Sans-Italic.woff2
+                  style: italic
+            - family: Mono Sans
+              source: file
+              files:
+                - path: https://example.com/Mono-Sans.woff
+                  weight: 100..900
+          base: Closed Sans
+          headings:
+            family: Closed Sans
+            weight: semi-bold
+            style: [normal, italic]
+          monospace:
+            family: Mono Sans
+            weight: 300
+          monospace-block:
+            family: Roboto Mono
+        """
+    )
+    assert isinstance(brand.typography, BrandTypography)
+
+    files = brand.typography.fonts_preload_files()
+    assert [str(f.path.root) for f in files] == [
+        "https://example.com/Closed-Sans-Regular.woff2",
+        "https://example.com/Closed-Sans-Bold.woff2",
+        "https://example.com/Closed-Sans-Italic.woff2",
+        "https://example.com/Mono-Sans.woff",
+    ]
+
+
+def test_brand_typography_fonts_html_dependency_preload(tmp_path: Path):
+    brand = Brand.from_yaml(path_examples("brand-typography-fonts.yml"))
+    assert isinstance(brand.typography, BrandTypography)
+
+    dep = brand.typography.fonts_html_dependency(tmp_path)
+    assert dep is not None
+    html = str(dep.as_html_tags())
+    # Only the regular Open Sans face is used, by `base`
+    assert html.count('rel="preload"') == 1
+    assert (
+        '<link rel="preload" '
+        + 'href="lib/brand-fonts-0.0.1/fonts/open-sans/OpenSans-Variable.ttf" '
+        + 'as="font" type="font/ttf" crossorigin=""/>'
+    ) in html
+
+    dep = brand.typography.fonts_html_dependency(tmp_path, preload=False)
+    assert dep is not None
+    assert "preload" not in str(dep.as_html_tags())
+
+
+def test_brand_typography_write_font_css_subset(tmp_path: Path):
+    pytest.importorskip("fontTools")
+    brand = Brand.from_yaml(path_examples("brand-typography-fonts.yml"))
+    assert isinstance(brand.typography, BrandTypography)
+
+    res = brand.typography.fonts_write_css(
+        tmp_path, subset={"basic": "U+0020-007E", "greek": "U+0370-03FF"}
+    )
+    assert res == tmp_path.resolve()
+
+    fonts = tmp_path / "fonts" / "open-sans"
+    assert sorted(p.name for p in fonts.iterdir()) == [
+        "OpenSans-Variable-Italic.basic.ttf",
+        "OpenSans-Variable-Italic.greek.ttf",
+        "OpenSans-Variable.basic.ttf",
+        "OpenSans-Variable.greek.ttf",
+    ]
+    full = path_examples("fonts", "open-sans", "OpenSans-Variable.ttf")
+    assert (fonts / "OpenSans-Variable.basic.ttf").stat().st_size < (
+        full.stat().st_size / 2
+    )
+
+    css = (tmp_path / "fonts.css").read_text()
+    assert css.count("@font-face") == 4 + 2  # + 2 for the remote font files
+    assert (
+        "src: url('fonts/open-sans/OpenSans-Variable.basic.ttf') "
+        + "format('truetype');\n  unicode-range: U+0020-007E;"
+    ) in css
+    assert "unicode-range: U+0370-03FF;" in css
+    assert "url('fonts/open-sans/OpenSans-Variable.ttf')" not in css
+
+
+def test_brand_typography_write_font_css_subset_names(tmp_path: Path):
+    pytest.importorskip("fontTools")
+    brand = Brand.from_yaml(path_examples("brand-typography-fonts.yml"))
+    assert isinstance(brand.typography, BrandTypography)
+
+    brand.typography.fonts_write_css(tmp_path, subset=["latin", "vietnamese"])
+    css = (tmp_path / "fonts.css").read_text()
+    assert f"unicode-range: {FONT_SUBSET_RANGES['latin']};" in css
+    assert (
+        tmp_path / "fonts/open-sans/OpenSans-Variable.vietnamese.ttf"
+    ).exists()
+
+
+def test_brand_typography_write_font_css_woff2(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+):
+    pytest.importorskip("fontTools")
+    pytest.importorskip("brotli")
+    brand = Brand.from_yaml(path_examples("brand-typography-fonts.yml"))
+    assert isinstance(brand.typography, BrandTypography)
+
+    with caplog.at_level(logging.INFO, logger="brand_yml"):
+        brand.typography.fonts_write_css(
+            tmp_path, subset={"basic": "U+0020-007E"}, woff2=True
+        )
+
+    fonts = tmp_path / "fonts" / "open-sans"
+    assert sorted(p.name for p in fonts.iterdir()) == [
+        "OpenSans-Variable-Italic.basic.ttf",
+        "OpenSans-Variable-Italic.basic.woff2",
+        "OpenSans-Variable.basic.ttf",
+        "OpenSans-Variable.basic.woff2",
+    ]
+    assert (fonts / "OpenSans-Variable.basic.woff2").stat().st_size < (
+        fonts / "OpenSans-Variable.basic.ttf"
+    ).stat().st_size
+
+    css = (tmp_path / "fonts.css").read_text()
+    assert (
+        "src: url('fonts/open-sans/OpenSans-Variable.basic.woff2') "
+        + "format('woff2'), "
+        + "url('fonts/open-sans/OpenSans-Variable.basic.ttf') "
+        + "format('truetype');"
+    ) in css
+    # Remote fonts are left as is
+    assert "url('https://example.com/Closed-Sans-Bold.woff2')" in css
+
+    assert "WOFF2 fonts:" in caplog.text
+    assert "saved" in caplog.text
+
+
+def test_brand_typography_write_font_css_woff2_full_font(tmp_path: Path):
+    pytest.importorskip("fontTools")
+    pytest.importorskip("brotli")
+    brand = Brand.from_yaml(path_examples("brand-typography-fonts.yml"))
+    assert isinstance(brand.typography, BrandTypography)
+
+    brand.typography.fonts_write_css(tmp_path, woff2=True)
+    fonts = tmp_path / "fonts" / "open-sans"
+    assert (fonts / "OpenSans-Variable.ttf").exists()
+    assert (fonts / "OpenSans-Variable.woff2").exists()
+
+    css = (tmp_path / "fonts.css").read_text()
+    assert "unicode-range" not in css
+    assert css.index("OpenSans-Variable.woff2") < css.index(
+        "OpenSans-Variable.ttf"
+    )
+
+
+def test_font_tools_cache_is_bounded_by_bytes(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_font_tools, "FONT_TOOLS_CACHE_BYTES", 10)
+    cache = FontToolsCache()
+    computed: list[str] = []
+
+    def get(key: str, size: int) -> bytes | None:
+        def compute() -> bytes:
+            computed.append(key)
+            return b"x" * size
+
+        return cache.get((key,), compute)
+
+    get("a", 4), get("b", 4), get("a", 4)
+    assert computed == ["a", "b"]
+
+    # "b" is the least recently used file and is dropped to make room for "c"
+    get("c", 4), get("a", 4), get("b", 4)
+    assert computed == ["a", "b", "c", "b"]
+
+    # Files larger than the limit aren't kept
+    get("big", 11), get("big", 11)
+    assert computed == ["a", "b", "c", "b", "big", "big"]
+    assert cache._size == sum(len(v or b"") for v in cache._entries.values())
+    assert cache._size <= 10
+
+
+def test_brand_typography_woff2_cached_on_disk(brand_yml_cache_dir: Path):
+    pytest.importorskip("fontTools")
+    pytest.importorskip("brotli")
+    path = path_examples("fonts", "open-sans", "OpenSans-Variable.ttf")
+    data = font_tools_cache.subset(path, "U+0020-007E")
+    assert data is not None
+
+    font_tools_cache.clear()
+    woff2 = font_tools_cache.woff2(data)
+    digest = hashlib.sha256(data).hexdigest()
+    cached = brand_yml_cache_dir / "woff2" / f"{digest}.woff2"
+    assert cached.read_bytes() == woff2
+
+    # Another process re-uses the cached file instead of transcoding again
+    subset_path = brand_yml_cache_dir / "subset.ttf"
+    subset_path.write_bytes(data)
+    script = "\n".join(
+        [
+            "import sys",
+            "from pathlib import Path",
+            "from brand_yml import _font_tools",
+            "def transcode(data):",
+            "    raise AssertionError('transcoded again')",
+            "_font_tools.woff2_font_bytes = transcode",
+            "data = Path(sys.argv[1]).read_bytes()",
+            "woff2 = _font_tools.font_tools_cache.woff2(data)",
+            "sys.stdout.write(str(len(woff2)))",
+        ]
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script, str(subset_path)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout == str(len(woff2))
+
+
+def test_font_cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("BRAND_YML_CACHE_DIR", str(tmp_path))
+    assert font_cache_dir() == tmp_path
+
+    monkeypatch.setenv("BRAND_YML_CACHE_DIR", "false")
+    assert font_cache_dir() is None
+
+    monkeypatch.delenv("BRAND_YML_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert font_cache_dir() == tmp_path / "brand_yml"
+
+
+def test_brand_typography_write_font_css_subset_invalid(tmp_path: Path):
+    brand = Brand.from_yaml(path_examples("brand-typography-fonts.yml"))
+    assert isinstance(brand.typography, BrandTypography)
+
+    with pytest.raises(BrandFontSubsetError, match="Unknown font subset"):
+        brand.typography.fonts_write_css(tmp_path, subset=["klingon"])
+
+    with pytest.raises(BrandFontSubsetError, match="Invalid unicode range"):
+        brand.typography.fonts_write_css(tmp_path, subset={"x": "0-7F"})
+
+    assert not (tmp_path / "fonts.css").exists()
+
+
 @pytest.mark.parametrize(
     "original, rem",
     [
@@ -816,6 +1345,29 @@ def test_brand_typography_base_font_size_as_rem(original, rem):
     assert data == {"base": {"size": rem}}
 
 
+@pytest.mark.parametrize(
+    "unit, size",
+    [("px", "18px"), ("em", "1.125em"), ("pt", "13.5pt"), ("rem", "1.125rem")],
+)
+def test_brand_typography_base_font_size_units(unit, size):
+    brand = Brand.from_yaml_str(
+        """
+        typography:
+          base:
+            size: 18px
+        """
+    )
+
+    assert isinstance(brand.typography, BrandTypography)
+
+    data = brand.typography.model_dump(
+        exclude={"fonts"},
+        exclude_none=True,
+        context={"typography_base_size_unit": unit},
+    )
+    assert data == {"base": {"size": size}}
+
+
 def test_brand_typography_base_font_size_as_rem_error():
     brand = Brand.from_yaml_str(
         """
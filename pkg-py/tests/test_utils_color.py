@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import pytest
+from brand_yml._utils_color import (
+    BrandColorParseError,
+    contrast_ratio,
+    mix,
+    oklab_to_rgb,
+    parse_color,
+    rgb_to_hsl,
+    rgb_to_oklab,
+    to_hex,
+)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "#ff8000",
+        "#FF8000",
+        "#ff8000ff",
+        "rgb(255, 128, 0)",
+        "rgb(255 128 0)",
+        "rgba(255, 128, 0, 1)",
+        "rgb(100% 50.2% 0% / 100%)",
+        "hsl(30, 100%, 50%)",
+        "hsl(30deg 100% 50%)",
+        "hsla(30, 100%, 50%, 1)",
+    ],
+)
+def test_parse_color_formats(value: str):
+    assert to_hex(parse_color(value)) == "#ff8000"
+
+
+def test_parse_color_named_and_alpha():
+    assert parse_color("white") == (1.0, 1.0, 1.0, 1.0)
+    assert parse_color("RebeccaPurple") == parse_color("#663399")
+    assert parse_color("transparent")[3] == 0
+    assert parse_color("rgba(0, 0, 0, 0.5)")[3] == 0.5
+    assert to_hex(parse_color("#00000080")) == "#00000080"
+    assert to_hex(parse_color("#f80")) == "#ff8800"
+    assert to_hex(parse_color("hsl(0.5turn 100% 50%)")) == "#00ffff"
+
+
+@pytest.mark.parametrize(
+    "value", ["", "#12", "blurple", "rgb(1, 2)", "var(--x)"]
+)
+def test_parse_color_invalid(value: str):
+    with pytest.raises(BrandColorParseError):
+        parse_color(value)
+
+
+def test_contrast_ratio():
+    black = parse_color("black")
+    white = parse_color("white")
+
+    assert contrast_ratio(black, white) == pytest.approx(21)
+    assert contrast_ratio(white, black) == pytest.approx(21)
+    assert contrast_ratio(white, white) == pytest.approx(1)
+    # https://webaim.org/resources/contrastchecker/?fcolor=447099&bcolor=FFFFFF
+    assert contrast_ratio(parse_color("#447099"), white) == pytest.approx(
+        5.22, abs=0.01
+    )
+
+
+def test_mix_hsl_oklab():
+    black = parse_color("black")
+    white = parse_color("white")
+
+    assert mix(black, white, 0) == black
+    assert mix(black, white, 1) == white
+    assert to_hex(mix(black, white, 0.5)) == "#808080"
+
+    assert rgb_to_hsl(parse_color("#ff8000")) == pytest.approx(
+        (30.1176, 1.0, 0.5), abs=1e-3
+    )
+
+    L, a, b = rgb_to_oklab(white)
+    assert (L, a, b) == pytest.approx((1, 0, 0), abs=1e-4)
+
+    orange = parse_color("#ee6331")
+    assert to_hex(oklab_to_rgb(rgb_to_oklab(orange))) == "#ee6331"
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pytest
+from brand_yml._utils import (
+    convert_css_length,
+    convert_css_lengths,
+    maybe_convert_font_size_to_rem,
+)
+
+
+@pytest.mark.parametrize(
+    "value, rem",
+    [
+        ("18px", "1.125rem"),
+        ("160px", "10rem"),
+        ("1000%", "10rem"),
+        ("20pt", "1.6667rem"),
+        ("1.5em", "1.5rem"),
+        ("0.5rem", "0.5rem"),
+        ("-8px", "-0.5rem"),
+        ("0.00001px", "0rem"),
+    ],
+)
+def test_maybe_convert_font_size_to_rem(value: str, rem: str):
+    assert maybe_convert_font_size_to_rem(value) == rem
+
+
+@pytest.mark.parametrize(
+    "value, px, em, pt",
+    [
+        ("1rem", "16px", "1em", "12pt"),
+        ("1.5em", "24px", "1.5em", "18pt"),
+        ("50%", "8px", "0.5em", "6pt"),
+        ("12pt", "16px", "1em", "12pt"),
+        ("1in", "96px", "6em", "72pt"),
+        ("2.54cm", "96px", "6em", "72pt"),
+        ("14px", "14px", "0.875em", "10.5pt"),
+    ],
+)
+def test_convert_css_length(value: str, px: str, em: str, pt: str):
+    assert convert_css_length(value, "px") == px
+    assert convert_css_length(value, "em") == em
+    assert convert_css_length(value, "pt") == pt
+
+
+def test_convert_css_lengths():
+    assert convert_css_lengths(["16px", "2em", "75%", "16px"]) == [
+        "1rem",
+        "2rem",
+        "0.75rem",
+        "1rem",
+    ]
+    assert convert_css_lengths([], "px") == []
+
+
+def test_convert_css_length_errors():
+    with pytest.raises(ValueError, match="vw units"):
+        convert_css_length("4vw")
+
+    with pytest.raises(ValueError, match="to vh units"):
+        convert_css_length("16px", "vh")  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError, match="Invalid CSS value"):
+        convert_css_length("large")